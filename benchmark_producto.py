@@ -0,0 +1,51 @@
+"""Punto de cruce entre el producto directo y Strassen-Winograd (core.racional).
+
+Mide producto_enteros con el núcleo directo (columnas traspuestas) y con
+Strassen para varios órdenes y tamaños de entrada, e indica a partir de qué
+orden compensa Strassen. Sirve para ajustar UMBRAL_STRASSEN y BITS_STRASSEN.
+
+    python benchmark_producto.py [orden1 orden2 ...]
+"""
+
+import random
+import sys
+import time
+
+from core.racional import _producto_directo, _strassen
+
+ORDENES = (32, 64, 96, 128)
+BITS = (16, 256, 1024)
+HOJA = 32  # orden por debajo del cual Strassen pasa al núcleo directo
+
+
+def _medir(funcion, *args):
+    inicio = time.perf_counter()
+    resultado = funcion(*args)
+    return time.perf_counter() - inicio, resultado
+
+
+def main(argv) -> int:
+    ordenes = [int(x) for x in argv[1:]] or list(ORDENES)
+    random.seed(0)
+    print(f"{'bits':>6} {'n':>5} {'directo (s)':>12} {'Strassen (s)':>13} {'razón':>7}")
+    for bits in BITS:
+        cruce = None
+        for n in ordenes:
+            A = [[random.getrandbits(bits) - (1 << (bits - 1)) for _ in range(n)] for _ in range(n)]
+            B = [[random.getrandbits(bits) - (1 << (bits - 1)) for _ in range(n)] for _ in range(n)]
+            t_dir, C = _medir(_producto_directo, A, B)
+            t_str, D = _medir(_strassen, A, B, HOJA)
+            if C != D:
+                print("Strassen y el producto directo no coinciden.")
+                return 1
+            # por debajo de HOJA los dos son el mismo núcleo; 5 % de margen por ruido
+            if cruce is None and n > HOJA and t_str * 1.05 < t_dir:
+                cruce = n
+            print(f"{bits:>6} {n:>5} {t_dir:>12.3f} {t_str:>13.3f} {t_dir / t_str:>7.2f}")
+        print(f"  -> entradas de {bits} bits: Strassen compensa desde n = {cruce}" if cruce
+              else f"  -> entradas de {bits} bits: Strassen no compensa en estos órdenes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
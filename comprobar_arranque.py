@@ -0,0 +1,98 @@
+"""Presupuesto de importación del menú principal Qt (python -X importtime).
+
+Importa qt_app.menu_principal_qt en un proceso limpio y falla (código 1) si
+se carga alguno de los módulos de cálculo, que deben importarse en el primer
+clic, o si lo que cuelga de qt_app (sin contar PySide6/shiboken6 ni el
+arranque del intérprete) supera PRESUPUESTO_MS.
+
+    python comprobar_arranque.py [presupuesto_ms]
+"""
+
+import os
+import re
+import subprocess
+import sys
+
+PRESUPUESTO_MS = 60
+
+# No deben cargarse al abrir el menú principal
+PROHIBIDOS = (
+    "tkinter",
+    "core",
+    "qt_app.menu_matrices_qt",
+    "qt_app.menu_sistemas_qt",
+    "qt_app.matrices_qt",
+    "qt_app.independencia_qt",
+    "qt_app.transformaciones_qt",
+    "qt_app.trabajos_qt",
+    "qt_app.sistemas",
+)
+
+_LINEA = re.compile(r"import time:\s*(\d+)\s*\|\s*(\d+)\s*\|(\s*)(\S+)")
+
+
+def medir(modulo: str = "qt_app.menu_principal_qt"):
+    """Devuelve [(modulo, propio_us, acumulado_us, nivel)] de -X importtime."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "error al importar")
+    filas = []
+    for linea in proc.stderr.splitlines():
+        m = _LINEA.match(linea)
+        if m:
+            propio, acumulado, sangria, nombre = m.groups()
+            filas.append((nombre, int(propio), int(acumulado), len(sangria) // 2))
+    return filas
+
+
+def _es_de(nombre: str, paquete: str) -> bool:
+    return nombre == paquete or nombre.startswith(paquete + ".")
+
+
+def _tiempo_app_us(filas) -> int:
+    """Tiempo propio de lo importado bajo qt_app, sin los subárboles de PySide6.
+
+    importtime lista cada módulo después de sus dependencias (un nivel más
+    de sangría), así que el árbol se reconstruye con una pila.
+    """
+    pila = []  # (nombre, propio, nivel, hijos)
+    for nombre, propio, _, nivel in filas:
+        hijos = []
+        while pila and pila[-1][2] > nivel:
+            hijos.append(pila.pop())
+        pila.append((nombre, propio, nivel, hijos))
+
+    def suma(nodo):
+        nombre, propio, _, hijos = nodo
+        if _es_de(nombre, "PySide6") or _es_de(nombre, "shiboken6"):
+            return 0
+        return propio + sum(suma(h) for h in hijos)
+
+    return sum(suma(nodo) for nodo in pila if _es_de(nodo[0], "qt_app"))
+
+
+def main(argv) -> int:
+    presupuesto = float(argv[1]) if len(argv) > 1 else PRESUPUESTO_MS
+    filas = medir()
+    cargados = [n for n, *_ in filas if any(_es_de(n, p) for p in PROHIBIDOS)]
+    propio_us = _tiempo_app_us(filas)
+    total_us = sum(acumulado for _, _, acumulado, nivel in filas if nivel == 0)
+    print(f"Importación total: {total_us / 1000:.1f} ms")
+    print(f"qt_app sin PySide6: {propio_us / 1000:.1f} ms (presupuesto {presupuesto:g} ms)")
+    ok = True
+    if cargados:
+        print("Módulos que deberían cargarse en el primer clic: " + ", ".join(cargados))
+        ok = False
+    if propio_us / 1000 > presupuesto:
+        print("Se supera el presupuesto de importación.")
+        ok = False
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
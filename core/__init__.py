@@ -0,0 +1,84 @@
+"""Motores de álgebra lineal sin dependencias de interfaz (ni tkinter ni PySide6).
+
+Las ventanas Tk (*_app.py) y Qt (qt_app/) solo leen datos, llaman a estas
+funciones y muestran el resultado, así que los motores se pueden importar y
+medir sin pantalla.
+
+Las funciones que se llaman igual que su módulo (gauss_jordan, inversa,
+transpuesta, determinante) no se reexportan aquí: core.gauss_jordan,
+core.inversa, etc. siguen siendo los submódulos.
+"""
+
+from .determinante import (
+    UMBRAL_BAREISS,
+    METODO_AUTO,
+    METODO_COFACTORES,
+    METODO_BAREISS,
+    METODO_COFACTORES_PARALELO,
+    usar_bareiss,
+    determinante_con_pasos,
+    determinante_bareiss_con_pasos,
+    determinante_cofactores_memo_con_pasos,
+    determinante_por_metodo,
+)
+from . import aritmetica
+from .modular import UMBRAL_MODULAR, determinante_modular, rango_modular
+from .racional import MatrizRacional
+from .factorizaciones import factorizar
+from .actualizacion import UltimoCalculo
+from .registro import INTERVALO_CONTROL, RegistroOperaciones, aplicar_operacion
+from .cramer import determinantes_cramer, matriz_sustituida
+from .gauss_jordan import extraer_soluciones
+from .inversa import rref_info, inversa_gauss_jordan, explicar_invertibilidad, fotogramas_inversa
+from .producto import (
+    multiplicar_con_detalle,
+    multiplicar_cadena,
+    orden_cadena,
+    aplicar_escalar,
+    sumar_matrices,
+    restar_matrices,
+)
+from .independencia import BaseEscalonada, son_linealmente_independientes
+from .transpuesta import Transpuesta
+from .transformaciones import matmul, resolver_axb
+
+__all__ = [
+    "UMBRAL_BAREISS",
+    "METODO_AUTO",
+    "METODO_COFACTORES",
+    "METODO_BAREISS",
+    "METODO_COFACTORES_PARALELO",
+    "usar_bareiss",
+    "determinante_con_pasos",
+    "determinante_bareiss_con_pasos",
+    "determinante_cofactores_memo_con_pasos",
+    "determinante_por_metodo",
+    "aritmetica",
+    "UMBRAL_MODULAR",
+    "determinante_modular",
+    "rango_modular",
+    "MatrizRacional",
+    "factorizar",
+    "UltimoCalculo",
+    "INTERVALO_CONTROL",
+    "RegistroOperaciones",
+    "aplicar_operacion",
+    "determinantes_cramer",
+    "matriz_sustituida",
+    "extraer_soluciones",
+    "rref_info",
+    "inversa_gauss_jordan",
+    "explicar_invertibilidad",
+    "fotogramas_inversa",
+    "multiplicar_con_detalle",
+    "multiplicar_cadena",
+    "orden_cadena",
+    "aplicar_escalar",
+    "sumar_matrices",
+    "restar_matrices",
+    "BaseEscalonada",
+    "son_linealmente_independientes",
+    "Transpuesta",
+    "matmul",
+    "resolver_axb",
+]
@@ -0,0 +1,158 @@
+"""Actualizaciones de rango uno entre dos cálculos seguidos de la misma ventana.
+
+Si la matriz nueva A' solo difiere de la anterior A en una fila i (o en una
+columna j), A' = A + e_i v^T (o A + u e_j^T). Con A^-1 del cálculo anterior:
+
+* lema del determinante:  det(A') = det(A) (1 + v^T A^-1 e_i)
+* Sherman-Morrison:       A'^-1 = A^-1 - (A^-1 e_i)(v^T A^-1) / (1 + v^T A^-1 e_i)
+
+Las dos cosas cuestan O(n^2) en vez de una eliminación O(n^3) (o O(n!) con
+cofactores). Si 1 + v^T A^-1 e_i = 0, A' es singular: det(A') = 0 y no hay
+inversa. Si A era singular no hay A^-1 que actualizar y la ventana vuelve a
+calcular de forma exacta desde cero.
+
+A^-1 no se calcula al registrar un determinante (costaría otra eliminación
+tras cada cálculo): se obtiene la primera vez que una actualización la
+necesita.
+"""
+
+import threading
+from fractions import Fraction
+from typing import List, Optional
+
+from .determinante import _fmt, _matrix_lines
+from .factorizaciones import factorizar
+
+# Por debajo de este orden las ventanas usan sus fórmulas y pasos de siempre
+ORDEN_MINIMO = 4
+
+# Inversa registrada que aún no se ha calculado (None significa singular)
+_PENDIENTE = object()
+
+
+def cambio_rango_uno(anterior, nueva):
+    """("fila", i, v) o ("columna", j, u) con el cambio de anterior a nueva, o
+    None si las dimensiones cambian o difieren en más de una fila y columna.
+    Si son iguales devuelve ("fila", 0, [0, ..., 0])."""
+    n = len(nueva)
+    if len(anterior) != n or any(len(f) != n for f in anterior) or any(len(f) != n for f in nueva):
+        return None
+    celdas = [(i, j) for i in range(n) for j in range(n) if anterior[i][j] != nueva[i][j]]
+    if not celdas or len({i for i, _ in celdas}) == 1:
+        i = celdas[0][0] if celdas else 0
+        return "fila", i, [Fraction(nueva[i][j]) - Fraction(anterior[i][j]) for j in range(n)]
+    if len({j for _, j in celdas}) == 1:
+        j = celdas[0][1]
+        return "columna", j, [Fraction(nueva[i][j]) - Fraction(anterior[i][j]) for i in range(n)]
+    return None
+
+
+class Actualizacion:
+    """Resultado de una actualización: det (None si no se conocía el anterior),
+    inversa (None si A' es singular) y las líneas que la justifican."""
+
+    __slots__ = ("det", "inversa", "lineas")
+
+    def __init__(self, det, inversa, lineas: List[str]):
+        self.det = det
+        self.inversa = inversa
+        self.lineas = lineas
+
+
+class UltimoCalculo:
+    """Matriz del último cálculo de una ventana con su determinante e inversa."""
+
+    def __init__(self):
+        self.matriz = None
+        self.det = None
+        self.inversa = None
+        self._cerrojo = threading.Lock()  # las ventanas Qt calculan en otros hilos
+
+    def registrar(self, A, det=None, inversa=None) -> None:
+        """Guarda A tras un cálculo completo. Sin inversa solo se guardan A y
+        det; la inversa se calcula en actualizar cuando haga falta."""
+        if len(A) < ORDEN_MINIMO or any(len(f) != len(A) for f in A):
+            self.olvidar()
+            return
+        if inversa is None:
+            inversa = None if det == 0 else _PENDIENTE
+        with self._cerrojo:
+            self.matriz = [[Fraction(x) for x in fila] for fila in A]
+            self.det = det
+            self.inversa = inversa
+
+    def olvidar(self) -> None:
+        with self._cerrojo:
+            self.matriz = self.det = self.inversa = None
+
+    def actualizar(self, A, progreso=None) -> Optional[Actualizacion]:
+        """Actualización de rango uno desde el cálculo anterior, o None si no se
+        puede (no hay cálculo anterior, cambia más de una fila o columna, o la
+        matriz anterior era singular). Si se aplica, A pasa a ser la anterior.
+
+        Si la inversa anterior aún no se conocía se calcula aquí (una sola vez,
+        desde la caché de factorizaciones); progreso va a esa eliminación."""
+        with self._cerrojo:
+            anterior, det, inv = self.matriz, self.det, self.inversa
+        if anterior is None or inv is None:
+            return None
+        cambio = cambio_rango_uno(anterior, A)
+        if cambio is None:
+            return None
+        if inv is _PENDIENTE:
+            inv = factorizar(anterior, progreso).inversa()
+            with self._cerrojo:
+                if self.matriz is anterior:
+                    self.inversa = inv
+            if inv is None:
+                return None
+        tipo, k, delta = cambio
+        n = len(A)
+        if not any(delta):
+            return Actualizacion(det, inv, ["La matriz no cambio respecto al calculo anterior; se reutiliza su resultado."])
+        if tipo == "fila":
+            # w = v^T A^-1 (fila) y c = A^-1 e_k (columna k de A^-1)
+            w = [sum(delta[r] * inv[r][j] for r in range(n) if delta[r]) for j in range(n)]
+            c = [inv[i][k] for i in range(n)]
+            producto = w[k]
+            forma, nombre = f"A' = A + e_{k + 1} v^T", "v^T"
+            izquierda, derecha = f"A^-1 e_{k + 1}", "v^T A^-1"
+            termino = f"v^T A^-1 e_{k + 1}"
+        else:
+            # c = A^-1 u (columna) y w = e_k^T A^-1 (fila k de A^-1)
+            c = [sum(inv[i][r] * delta[r] for r in range(n) if delta[r]) for i in range(n)]
+            w = list(inv[k])
+            producto = c[k]
+            forma, nombre = f"A' = A + u e_{k + 1}^T", "u^T"
+            izquierda, derecha = "A^-1 u", f"e_{k + 1}^T A^-1"
+            termino = f"e_{k + 1}^T A^-1 u"
+        factor = 1 + producto
+        nuevo_det = None if det is None else det * factor
+        nueva_inv = None
+        if factor != 0:
+            c = [x / factor for x in c]
+            nueva_inv = [[a - ci * wj if wj else a for a, wj in zip(fila, w)] for fila, ci in zip(inv, c)]
+
+        lineas = [
+            "Actualizacion de rango uno respecto al calculo anterior (O(n^2))",
+            f"Solo cambio la {tipo} {k + 1}: {forma}, {nombre} = [ {'  '.join(_fmt(x) for x in delta)} ]",
+            f"1 + {termino} = 1 + {_fmt(producto)} = {_fmt(factor)}",
+        ]
+        if det is not None:
+            lineas.append(f"Lema del determinante: det(A') = det(A) (1 + {termino}) = "
+                          f"{_fmt(det)} * {_fmt(factor)} = {_fmt(nuevo_det)}")
+        if nueva_inv is None:
+            lineas.append(f"1 + {termino} = 0, asi que A' es singular y no tiene inversa.")
+        else:
+            divisor = _fmt(factor) if factor.denominator == 1 and factor > 0 else f"({_fmt(factor)})"
+            lineas.append(f"Sherman-Morrison: A'^-1 = A^-1 - ({izquierda})({derecha}) / {divisor}")
+            lineas.append("A^-1 (calculo anterior):")
+            lineas.extend(_matrix_lines(inv, "  "))
+            lineas.append("A'^-1:")
+            lineas.extend(_matrix_lines(nueva_inv, "  "))
+
+        with self._cerrojo:
+            self.matriz = [[Fraction(x) for x in fila] for fila in A]
+            self.det = nuevo_det
+            self.inversa = nueva_inv
+        return Actualizacion(nuevo_det, nueva_inv, lineas)
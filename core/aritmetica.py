@@ -0,0 +1,67 @@
+"""Backend de enteros grandes para los motores exactos.
+
+En la eliminación exacta casi todo el tiempo se va en aritmética de enteros
+grandes. Si gmpy2 está instalado se usan sus mpz (GMP) dentro de MatrizRacional
+y de Bareiss; si no, los int de Python. Los resultados se devuelven siempre
+como Fraction, así que los textos no cambian con el backend.
+
+    from core import aritmetica
+    aritmetica.usar_backend("python")   # o "gmpy2"
+"""
+
+import math
+from fractions import Fraction
+
+try:
+    import gmpy2
+except ImportError:  # backend opcional
+    gmpy2 = None
+
+BACKEND_PYTHON = "python"
+BACKEND_GMPY2 = "gmpy2"
+
+NOMBRES_BACKEND = {
+    BACKEND_PYTHON: "Python (int / Fraction)",
+    BACKEND_GMPY2: "gmpy2 (mpz / mpq, GMP)",
+}
+
+# Tipos racionales que los formateadores tratan como fracciones
+RACIONALES = (Fraction,) if gmpy2 is None else (Fraction, type(gmpy2.mpq(0)))
+
+_actual = BACKEND_PYTHON
+entero = int
+mcd = math.gcd
+mcm = math.lcm
+
+
+def backends_disponibles():
+    return [BACKEND_PYTHON] if gmpy2 is None else [BACKEND_PYTHON, BACKEND_GMPY2]
+
+
+def backend_actual() -> str:
+    return _actual
+
+
+def usar_backend(nombre: str) -> None:
+    """Cambia el backend; ValueError si no existe o no está instalado."""
+    global _actual, entero, mcd, mcm
+    if nombre not in backends_disponibles():
+        raise ValueError(f"Backend numérico no disponible: {nombre}")
+    if nombre == BACKEND_GMPY2:
+        entero, mcd, mcm = gmpy2.mpz, gmpy2.gcd, gmpy2.lcm
+    else:
+        entero, mcd, mcm = int, math.gcd, math.lcm
+    _actual = nombre
+
+
+def a_fraccion(num, den=1) -> Fraction:
+    """Fraction con int de Python a partir de enteros de cualquier backend."""
+    if type(num) is not int:
+        num = int(num)
+    if type(den) is not int:
+        den = int(den)
+    return Fraction(num, den)
+
+
+if gmpy2 is not None:
+    usar_backend(BACKEND_GMPY2)
@@ -0,0 +1,65 @@
+from fractions import Fraction
+from typing import List, Optional, Tuple
+
+from .determinante import _filas_enteras
+
+
+def matriz_sustituida(A: List[List[Fraction]], b: List[Fraction], k: int) -> List[List[Fraction]]:
+    """A_k: copia de A con la columna k reemplazada por b."""
+    M = [row[:] for row in A]
+    for i in range(len(M)):
+        M[i][k] = b[i]
+    return M
+
+
+def determinantes_cramer(A: List[List[Fraction]], b: List[Fraction], progreso=None) -> Tuple[Fraction, Optional[List[Fraction]]]:
+    """Calcula det(A) y todos los det(A_k) con una sola eliminacion de Bareiss.
+
+    Se elimina la matriz aumentada [A | b] sin fracciones; el ultimo pivote es
+    det(A) (salvo signo y escala) y una sustitucion regresiva entera da
+    det(A) * x_k = det(A_k) para cada k. Devuelve (det(A), None) en cuanto se
+    detecta que A es singular. progreso(hecho, total), si se indica, se llama
+    tras cada paso de la eliminacion.
+    """
+    n = len(A)
+    if n == 0:
+        return Fraction(1), []
+    M, factores = _filas_enteras([list(A[i]) + [b[i]] for i in range(n)])
+    escala = 1
+    for d in factores:
+        escala *= d
+
+    signo = 1
+    prev = 1
+    for k in range(n):
+        if M[k][k] == 0:
+            fila = next((r for r in range(k + 1, n) if M[r][k] != 0), None)
+            if fila is None:
+                return Fraction(0), None
+            M[k], M[fila] = M[fila], M[k]
+            signo = -signo
+        pivote = M[k][k]
+        fila_k = M[k]
+        for i in range(k + 1, n):
+            fila_i = M[i]
+            a_ik = fila_i[k]
+            for j in range(k + 1, n + 1):
+                fila_i[j] = (pivote * fila_i[j] - a_ik * fila_k[j]) // prev
+            fila_i[k] = 0
+        prev = pivote
+        if progreso is not None:
+            progreso(k + 1, n)
+
+    # Sustitucion regresiva sin fracciones: y_i = D * x_i es entero (D = ultimo pivote)
+    D = M[n - 1][n - 1]
+    y = [0] * n
+    for i in range(n - 1, -1, -1):
+        acc = D * M[i][n]
+        fila_i = M[i]
+        for j in range(i + 1, n):
+            acc -= fila_i[j] * y[j]
+        y[i] = acc // fila_i[i]
+
+    det_A = Fraction(signo * D, escala)
+    dets_k = [Fraction(signo * yk, escala) for yk in y]
+    return det_A, dets_k
@@ -0,0 +1,623 @@
+import atexit
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from fractions import Fraction
+from math import gcd
+from typing import Dict, FrozenSet, Iterator, List, Optional, Tuple
+
+from . import aritmetica
+from .modular import UMBRAL_MODULAR, determinante_modular, es_entera
+
+
+# Orden a partir del cual se deja la expansion por cofactores (O(n!)) y se usa
+# la eliminacion de Bareiss (O(n^3)). Puede ajustarse en tiempo de ejecucion:
+#     import core.determinante; core.determinante.UMBRAL_BAREISS = 8
+UMBRAL_BAREISS = 6
+
+# Metodos seleccionables desde las ventanas de determinante
+METODO_AUTO = "auto"
+METODO_COFACTORES = "cofactores"
+METODO_BAREISS = "bareiss"
+METODO_COFACTORES_PARALELO = "cofactores_paralelo"
+
+# Orden maximo de la expansion por cofactores clasica en paralelo (sin paso a
+# Bareiss); por encima se usa Bareiss igual que en el modo automatico.
+MAX_COFACTORES_PARALELO = 9
+
+
+def usar_bareiss(n: int) -> bool:
+    return n > UMBRAL_BAREISS
+
+
+def usar_modular(matrix) -> bool:
+    """Modo automatico: matrices enteras de orden >= UMBRAL_MODULAR van por TRC."""
+    return len(matrix) >= UMBRAL_MODULAR and es_entera(matrix)
+
+
+def _fmt(value) -> str:
+    if isinstance(value, aritmetica.RACIONALES):
+        if value.denominator == 1:
+            return str(value.numerator)
+        return f"{value.numerator}/{value.denominator}"
+    return str(value)
+
+
+def _matrix_lines(matrix, indent: str = "") -> List[str]:
+    rows = [[_fmt(x) for x in row] for row in matrix]
+    widths = [max(len(row[j]) for row in rows) for j in range(len(rows[0]))] if rows else []
+    return [indent + "[ " + "  ".join(c.rjust(widths[j]) for j, c in enumerate(row)) + " ]" for row in rows]
+
+
+def _filas_enteras(matrix: List[List[Fraction]]) -> Tuple[List[List[int]], List[int]]:
+    """Multiplica cada fila por el mcm de sus denominadores: devuelve (filas enteras, factores)."""
+    filas: List[List[int]] = []
+    factores: List[int] = []
+    for row in matrix:
+        row = [Fraction(x) for x in row]
+        d = 1
+        for x in row:
+            d = d // gcd(d, x.denominator) * x.denominator
+        filas.append([x.numerator * (d // x.denominator) for x in row])
+        factores.append(d)
+    return filas, factores
+
+
+def determinante(matrix: List[List[Fraction]], progreso=None) -> Fraction:
+    """Solo el valor de det(A): Bareiss sobre enteros, sin construir texto.
+
+    progreso(hecho, total), si se indica, se llama tras cada paso de la
+    eliminacion; puede lanzar una excepcion para abortar el calculo.
+    """
+    n = len(matrix)
+    if n == 0:
+        return Fraction(1)
+    M, factores = _filas_enteras(matrix)
+    if aritmetica.entero is not int:
+        M = [[aritmetica.entero(x) for x in fila] for fila in M]
+    escala = 1
+    for d in factores:
+        escala *= d
+    signo = 1
+    prev = 1
+    for k in range(n - 1):
+        if M[k][k] == 0:
+            fila = next((r for r in range(k + 1, n) if M[r][k] != 0), None)
+            if fila is None:
+                return Fraction(0)
+            M[k], M[fila] = M[fila], M[k]
+            signo = -signo
+        pivote = M[k][k]
+        fila_k = M[k]
+        for i in range(k + 1, n):
+            fila_i = M[i]
+            a_ik = fila_i[k]
+            for j in range(k + 1, n):
+                fila_i[j] = (pivote * fila_i[j] - a_ik * fila_k[j]) // prev
+        prev = pivote
+        if progreso is not None:
+            progreso(k + 1, n - 1)
+    return aritmetica.a_fraccion(signo * M[n - 1][n - 1], escala)
+
+
+def _recoger(generador) -> Tuple[Fraction, List[str]]:
+    """Consume un generador de pasos: devuelve (valor de retorno, lineas)."""
+    pasos: List[str] = []
+    try:
+        while True:
+            pasos.append(next(generador))
+    except StopIteration as fin:
+        return fin.value, pasos
+
+
+_SUBINDICES = str.maketrans("0123456789", "₀₁₂₃₄₅₆₇₈₉")
+
+
+def _etiqueta(prefijo: str, fila: int, col: int, ascii: bool) -> str:
+    if ascii:
+        return f"{prefijo}{fila}{col}"
+    return f"{prefijo}{str(fila).translate(_SUBINDICES)}{str(col).translate(_SUBINDICES)}"
+
+
+def _fmt_factor(value) -> str:
+    return _fmt(value) if value >= 0 else f"({_fmt(value)})"
+
+
+def _filas_lines(matrix, indent: str = "") -> List[str]:
+    return [indent + "[ " + "  ".join(_fmt(col) for col in row) + " ]" for row in matrix]
+
+
+def es_triangular_superior(matrix: List[List[Fraction]]) -> bool:
+    n = len(matrix)
+    for i in range(1, n):
+        for j in range(0, i):
+            if matrix[i][j] != 0:
+                return False
+    return True
+
+
+def es_triangular_inferior(matrix: List[List[Fraction]]) -> bool:
+    n = len(matrix)
+    for i in range(n):
+        for j in range(i + 1, n):
+            if matrix[i][j] != 0:
+                return False
+    return True
+
+
+def menor(matrix: List[List[Fraction]], row: int, col: int) -> List[List[Fraction]]:
+    return [
+        [matrix[i][j] for j in range(len(matrix)) if j != col]
+        for i in range(len(matrix))
+        if i != row
+    ]
+
+
+def determinante_con_pasos(
+    matrix: List[List[Fraction]], level: int = 0, ascii: bool = False, trace: bool = True
+) -> Tuple[Fraction, List[str]]:
+    """Expansion por cofactores a lo largo de la primera fila, con la traza de pasos.
+
+    Con ascii=True usa el formato de la interfaz Qt (sin subindices ni simbolos
+    unicode); por encima de UMBRAL_BAREISS delega en Bareiss. Con trace=False
+    solo calcula el valor y devuelve la lista de pasos vacia.
+    """
+    if not trace:
+        return determinante(matrix), []
+    return _recoger(pasos_determinante(matrix, level, ascii))
+
+
+def pasos_determinante(
+    matrix: List[List[Fraction]], level: int = 0, ascii: bool = False, *,
+    umbral: Optional[int] = None, calculados=None, ruta: Tuple[int, ...] = (),
+    detalle: bool = False,
+) -> Iterator[str]:
+    """Generador de las lineas de determinante_con_pasos, una a una.
+
+    El valor de det(A) es el valor de retorno del generador (StopIteration.value),
+    asi que las interfaces pueden mostrar los pasos a medida que se producen.
+    umbral sustituye a UMBRAL_BAREISS; calculados (ruta de columnas -> Future
+    con det(menor)) trae valores ya resueltos en otro proceso, ver
+    pasos_determinante_paralelo. De esos menores solo se muestra el valor,
+    salvo con detalle=True, que reconstruye aqui su expansion.
+    """
+    n = len(matrix)
+    indent = "    " * level
+    separator = indent + (("-" if ascii else "—") * 70)
+    por = "*" if ascii else "·"
+    menos = "-" if ascii else "−"
+
+    if n > (UMBRAL_BAREISS if umbral is None else umbral):
+        # Por encima del umbral la expansion por cofactores (O(n!)) bloquea la interfaz
+        return (yield from pasos_bareiss(matrix, level))
+
+    if n == 1:
+        value = matrix[0][0]
+        yield f"{indent}Caso base 1x1: det(A) = {_fmt(value)}"
+        return value
+
+    if n == 2:
+        a11, a12 = matrix[0]
+        a21, a22 = matrix[1]
+        prod1 = a11 * a22
+        prod2 = a12 * a21
+        det = prod1 - prod2
+        yield f"{indent}Caso base 2x2:"
+        yield from _filas_lines(matrix, indent + "    ")
+        if ascii:
+            yield f"{indent}|A| = {_fmt(a11)}*{_fmt(a22)} - {_fmt(a12)}*{_fmt(a21)}"
+            yield f"{indent}    = {_fmt(prod1)} - {_fmt(prod2)}"
+            yield f"{indent}    = {_fmt(det)}"
+        else:
+            yield (
+                f"{indent}det(A) = ({_fmt(a11)} · {_fmt(a22)}) − ({_fmt(a12)} · {_fmt(a21)}) = {_fmt(prod1)} − {_fmt(prod2)} = {_fmt(det)}"
+            )
+        return det
+
+    es_superior = es_triangular_superior(matrix)
+    if es_superior or es_triangular_inferior(matrix):
+        tipo = "superior" if es_superior else "inferior"
+        diag = [matrix[i][i] for i in range(n)]
+        det = Fraction(1)
+        for value in diag:
+            det *= value
+        yield f"{indent}La matriz es triangular {tipo}."
+        yield f"{indent}Producto de la diagonal principal: {f' {por} '.join(_fmt(v) for v in diag)} = {_fmt(det)}"
+        return det
+
+    yield f"{indent}Expansion por cofactores a lo largo de la primera fila"
+    formula = " + ".join(f"{_etiqueta('a', 1, j + 1, ascii)}{_etiqueta('C', 1, j + 1, ascii)}" for j in range(n))
+    yield f"{indent}det(A) = {formula}"
+
+    contributions: List[Fraction] = []
+    fmt_suma = _fmt if ascii else _fmt_factor
+    for j in range(n):
+        elemento = matrix[0][j]
+        idx_label = _etiqueta("a", 1, j + 1, ascii)
+        sign_factor = Fraction(1 if j % 2 == 0 else -1)
+        sign_symbol = "+" if sign_factor >= 0 else menos
+
+        yield separator
+        yield f"{indent}Elemento {idx_label} = {_fmt(elemento)} (signo {sign_symbol})"
+        if elemento == 0:
+            yield f"{indent}Como {idx_label} = 0, su contribucion es nula y se omite."
+            contributions.append(Fraction(0))
+            continue
+
+        cofactor_label = _etiqueta("C", 1, j + 1, ascii)
+        minor_label = _etiqueta("M", 1, j + 1, ascii)
+        if not ascii:
+            yield f"{indent}Cofactor: {cofactor_label} = (−1)^(1+{j+1}) · det({minor_label})"
+
+        submatriz = menor(matrix, 0, j)
+        yield f"{indent}Submatriz {minor_label} (eliminando fila 1 y columna {j+1}):"
+        yield from _filas_lines(submatriz, indent + "    ")
+
+        clave = ruta + (j,)
+        if calculados is not None and clave in calculados:
+            sub_det = calculados[clave].result()
+            if detalle:
+                yield from pasos_determinante(submatriz, level + 1, ascii, umbral=umbral)
+            else:
+                yield f"{indent}    (valor calculado en otro proceso; su expansion solo se genera al pedir el detalle)"
+        else:
+            sub_det = yield from pasos_determinante(
+                submatriz, level + 1, ascii, umbral=umbral, calculados=calculados, ruta=clave, detalle=detalle
+            )
+        yield f"{indent}det({minor_label}) = {_fmt(sub_det)}"
+
+        cofactor_value = sign_factor * sub_det
+        if ascii:
+            yield f"{indent}{cofactor_label} = ({'+' if sign_factor > 0 else '-'}1) * {_fmt(sub_det)} = {_fmt(cofactor_value)}"
+        else:
+            yield (
+                f"{indent}{cofactor_label} = ({'+' if sign_factor >= 0 else ''}{_fmt(sign_factor)}) · {_fmt_factor(sub_det)} = {_fmt(cofactor_value)}"
+            )
+
+        contribucion = elemento * cofactor_value
+        yield (
+            f"{indent}Contribucion parcial: {fmt_suma(elemento)} {por} {fmt_suma(cofactor_value)} = {_fmt(contribucion)}"
+        )
+        contributions.append(contribucion)
+
+    yield separator
+    total = sum(contributions, Fraction(0))
+    partes = " + ".join(fmt_suma(valor) for valor in contributions)
+    yield f"{indent}Suma total de contribuciones: det(A) = {partes} = {_fmt(total)}"
+    return total
+
+
+def _se_expande(matrix: List[List[Fraction]], umbral: int) -> bool:
+    """True si pasos_determinante expandiria matrix por cofactores."""
+    n = len(matrix)
+    return 2 < n <= umbral and not (es_triangular_superior(matrix) or es_triangular_inferior(matrix))
+
+
+def _valor_cofactores(matrix: List[List[Fraction]], umbral: int) -> Fraction:
+    """det(A) por la misma expansion que pasos_determinante, sin construir texto."""
+    n = len(matrix)
+    if n > umbral:
+        return determinante(matrix)
+    if n == 1:
+        return Fraction(matrix[0][0])
+    if n == 2:
+        return Fraction(matrix[0][0] * matrix[1][1] - matrix[0][1] * matrix[1][0])
+    total = Fraction(0)
+    for j, elemento in enumerate(matrix[0]):
+        if elemento:
+            termino = elemento * _valor_cofactores(menor(matrix, 0, j), umbral)
+            total += termino if j % 2 == 0 else -termino
+    return total
+
+
+# Pool de procesos compartido por todas las expansiones en paralelo: arrancar
+# procesos con "spawn" cuesta unas decimas de segundo cada uno, asi que se crea
+# la primera vez y se reutiliza hasta salir del programa.
+_pool: Optional[ProcessPoolExecutor] = None
+_procesos_pool = 0
+_cerrojo_pool = threading.Lock()
+
+
+def _pool_compartido(procesos: int) -> ProcessPoolExecutor:
+    global _pool, _procesos_pool
+    with _cerrojo_pool:
+        if _pool is None or _procesos_pool != procesos:
+            if _pool is not None:
+                _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = ProcessPoolExecutor(max_workers=procesos, mp_context=multiprocessing.get_context("spawn"))
+            _procesos_pool = procesos
+        return _pool
+
+
+def cerrar_pool() -> None:
+    """Cierra el pool compartido (se llama sola al salir del programa)."""
+    global _pool
+    with _cerrojo_pool:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+atexit.register(cerrar_pool)
+
+
+def _repartir(pool, matrix, umbral, niveles, ruta, calculados) -> None:
+    for j, elemento in enumerate(matrix[0]):
+        if elemento == 0:
+            continue
+        submatriz = menor(matrix, 0, j)
+        if niveles > 1 and _se_expande(submatriz, umbral):
+            _repartir(pool, submatriz, umbral, niveles - 1, ruta + (j,), calculados)
+        else:
+            calculados[ruta + (j,)] = pool.submit(_valor_cofactores, submatriz, umbral)
+
+
+def _umbral_paralelo() -> int:
+    return max(UMBRAL_BAREISS, MAX_COFACTORES_PARALELO)
+
+
+def repartir_menores(
+    matrix: List[List[Fraction]], procesos: Optional[int] = None, niveles: Optional[int] = None,
+) -> Dict[Tuple[int, ...], Future]:
+    """Lanza en el pool compartido el valor de los menores de los primeros
+    niveles (1 o 2; por defecto 2 si n es menor que el numero de procesos).
+
+    Devuelve {ruta de columnas: Future con det(menor)}, vacio si no compensa
+    repartir (un solo nucleo o matriz que no se expande). Las ventanas pueden
+    esperar a que terminen sin bloquearse y pasar el resultado a
+    pasos_determinante_paralelo.
+    """
+    n = len(matrix)
+    umbral = _umbral_paralelo()
+    procesos = procesos or os.cpu_count() or 1
+    if procesos < 2 or not _se_expande(matrix, umbral):
+        return {}
+    if niveles is None:
+        niveles = 1 if n >= procesos else 2
+    calculados: Dict[Tuple[int, ...], Future] = {}
+    try:
+        _repartir(_pool_compartido(procesos), matrix, umbral, niveles, (), calculados)
+    except BrokenProcessPool:
+        # algun proceso del pool murio: se descarta y se vuelve a lanzar una vez
+        cerrar_pool()
+        calculados = {}
+        _repartir(_pool_compartido(procesos), matrix, umbral, niveles, (), calculados)
+    return calculados
+
+
+def pasos_determinante_paralelo(
+    matrix: List[List[Fraction]], level: int = 0, ascii: bool = False,
+    procesos: Optional[int] = None, niveles: Optional[int] = None, *,
+    calculados: Optional[Dict[Tuple[int, ...], Future]] = None, detalle: bool = False,
+) -> Iterator[str]:
+    """Expansion por cofactores clasica con los menores repartidos entre procesos.
+
+    Los procesos (ver repartir_menores, o calculados si ya se lanzaron) solo
+    devuelven el valor de cada menor, sin texto, asi que la traza muestra la
+    expansion de los primeros niveles con esos valores. Con detalle=True la
+    expansion de cada menor se reconstruye en este proceso y la traza es
+    identica a la de pasos_determinante. Hasta MAX_COFACTORES_PARALELO no se
+    pasa a Bareiss.
+
+    Los procesos se arrancan con "spawn" y no con fork: se llama desde hilos
+    (el QThreadPool de la version Qt) y hacer fork de un proceso con hilos
+    puede dejar al hijo bloqueado en un cerrojo copiado. Cada proceso arranca
+    un interprete nuevo e importa core y el modulo principal (unas decimas de
+    segundo por proceso, solo la primera vez: el pool se reutiliza); el
+    programa tiene que arrancar bajo if __name__ == "__main__" (como main.py).
+    """
+    propios = calculados is None
+    if propios:
+        calculados = repartir_menores(matrix, procesos, niveles)
+    try:
+        return (yield from pasos_determinante(
+            matrix, level, ascii, umbral=_umbral_paralelo(), calculados=calculados or None, detalle=detalle
+        ))
+    finally:
+        # si se abandona el generador (cancelacion) no se espera a los menores pendientes
+        if propios:
+            for futuro in calculados.values():
+                futuro.cancel()
+
+
+def determinante_bareiss_con_pasos(matrix: List[List[Fraction]], level: int = 0, trace: bool = True) -> Tuple[Fraction, List[str]]:
+    """Determinante por eliminacion de Bareiss (sin fracciones), con la traza de pasos."""
+    if not trace:
+        return determinante(matrix), []
+    return _recoger(pasos_bareiss(matrix, level))
+
+
+def pasos_bareiss(matrix: List[List[Fraction]], level: int = 0) -> Iterator[str]:
+    """Generador de las lineas de determinante_bareiss_con_pasos (devuelve det(A))."""
+    n = len(matrix)
+    indent = "    " * level
+    sep = indent + ("-" * 70)
+
+    if n == 0:
+        return Fraction(1)
+
+    M, factores = _filas_enteras(matrix)
+    yield f"{indent}Metodo de Bareiss (eliminacion sin fracciones) para una matriz {n}x{n}"
+    yield f"{indent}En el paso k: a_ij <- (p_k * a_ij - a_ik * a_kj) / p_(k-1), division exacta (p_0 = 1)."
+    escala = 1
+    if any(d != 1 for d in factores):
+        yield f"{indent}Se multiplica cada fila por el mcm de sus denominadores para trabajar con enteros:"
+        yield indent + "    " + ", ".join(f"F{i+1} x {d}" for i, d in enumerate(factores) if d != 1)
+        for d in factores:
+            escala *= d
+    yield f"{indent}Matriz inicial:"
+    yield from _matrix_lines(M, indent + "    ")
+
+    signo = 1
+    prev = 1
+    for k in range(n - 1):
+        yield sep
+        if M[k][k] == 0:
+            fila = next((r for r in range(k + 1, n) if M[r][k] != 0), None)
+            if fila is None:
+                yield f"{indent}Paso {k+1}: la columna {k+1} no tiene pivote disponible (todas sus entradas son 0)."
+                yield f"{indent}Por lo tanto det(A) = 0"
+                return Fraction(0)
+            M[k], M[fila] = M[fila], M[k]
+            signo = -signo
+            yield f"{indent}a{k+1}{k+1} = 0: se intercambian F{k+1} <-> F{fila+1} (el determinante cambia de signo)"
+        pivote = M[k][k]
+        yield f"{indent}Paso {k+1}: pivote p{k+1} = {pivote}, divisor p{k} = {prev}"
+        for i in range(k + 1, n):
+            fila_i = M[i]
+            fila_k = M[k]
+            a_ik = fila_i[k]
+            for j in range(k + 1, n):
+                fila_i[j] = (pivote * fila_i[j] - a_ik * fila_k[j]) // prev
+            fila_i[k] = 0
+        prev = pivote
+        yield f"{indent}Matriz tras el paso {k+1}:"
+        yield from _matrix_lines(M, indent + "    ")
+
+    yield sep
+    ultimo = M[n - 1][n - 1]
+    det = Fraction(signo * ultimo, escala)
+    signo_txt = "(+1)" if signo > 0 else "(-1)"
+    if escala != 1:
+        yield (
+            f"{indent}det(A) = {signo_txt} * p{n} / ({' * '.join(str(d) for d in factores)}) = {signo_txt} * {ultimo} / {escala} = {_fmt(det)}"
+        )
+    else:
+        yield f"{indent}det(A) = {signo_txt} * p{n} = {signo_txt} * {ultimo} = {_fmt(det)}"
+    return det
+
+
+def determinante_cofactores_memo_con_pasos(matrix: List[List[Fraction]], level: int = 0, trace: bool = True) -> Tuple[Fraction, List[str]]:
+    """Expansion por cofactores memorizando los menores ya calculados.
+
+    Un menor queda determinado por la fila en la que empieza y el conjunto de
+    columnas que conserva, asi que solo hay 2^n menores distintos: O(2^n * n).
+    Los menores repetidos se muestran como lineas "reutilizado".
+    """
+    if not trace:
+        return determinante(matrix), []
+    return _recoger(pasos_cofactores_memo(matrix, level))
+
+
+def pasos_cofactores_memo(matrix: List[List[Fraction]], level: int = 0) -> Iterator[str]:
+    """Generador de las lineas de determinante_cofactores_memo_con_pasos (devuelve det(A))."""
+    n = len(matrix)
+    if n == 0:
+        return Fraction(1)
+
+    valores = [[Fraction(x) for x in row] for row in matrix]
+    if all(x.denominator == 1 for row in valores for x in row):
+        # Con entradas enteras se opera con int (mucho mas rapido que Fraction)
+        valores = [[x.numerator for x in row] for row in valores]
+    textos = [[_fmt(x) for x in row] for row in valores]
+    # clave (fila inicial, columnas restantes) -> (valor, texto)
+    cache: Dict[Tuple[int, FrozenSet[int]], Tuple[Fraction, str]] = {}
+
+    def factor(valor, texto: str) -> str:
+        return f"({texto})" if valor < 0 else texto
+
+    def etiqueta(fila: int, cols: FrozenSet[int]) -> str:
+        if fila == 0:
+            return "A"
+        return f"M[filas {fila + 1}-{n}; cols {','.join(str(c + 1) for c in sorted(cols))}]"
+
+    def det(fila: int, cols: FrozenSet[int], nivel: int):
+        ind = "    " * nivel
+        clave = (fila, cols)
+        if clave in cache:
+            valor, texto = cache[clave]
+            yield f"{ind}reutilizado: det({etiqueta(fila, cols)}) = {texto}"
+            return valor, texto
+
+        nombre = etiqueta(fila, cols)
+        orden = sorted(cols)
+        fila_v = valores[fila]
+        fila_t = textos[fila]
+        if len(orden) == 1:
+            valor = fila_v[orden[0]]
+        elif len(orden) == 2:
+            c1, c2 = orden
+            sig_v = valores[fila + 1]
+            sig_t = textos[fila + 1]
+            valor = fila_v[c1] * sig_v[c2] - fila_v[c2] * sig_v[c1]
+            yield (
+                f"{ind}det({nombre}) = ({fila_t[c1]} * {sig_t[c2]}) - ({fila_t[c2]} * {sig_t[c1]}) = {_fmt(valor)}"
+            )
+        else:
+            yield f"{ind}det({nombre}): expansion por cofactores a lo largo de la fila {fila + 1}"
+            valor = 0
+            terminos: List[str] = []
+            for pos, col in enumerate(orden):
+                elemento = fila_v[col]
+                if elemento == 0:
+                    yield f"{ind}a{fila + 1}{col + 1} = 0: su contribucion es nula y se omite."
+                    continue
+                resto = cols - {col}
+                sub, sub_texto = yield from det(fila + 1, resto, nivel + 1)
+                termino = elemento * sub if pos % 2 == 0 else -elemento * sub
+                termino_texto = _fmt(termino)
+                yield (
+                    f"{ind}{'+' if pos % 2 == 0 else '-'} a{fila + 1}{col + 1} * det({etiqueta(fila + 1, resto)})"
+                    f" = {'+' if pos % 2 == 0 else '-'} {factor(elemento, fila_t[col])} * {factor(sub, sub_texto)} = {termino_texto}"
+                )
+                terminos.append(factor(termino, termino_texto))
+                valor += termino
+            yield f"{ind}det({nombre}) = {' + '.join(terminos) or '0'} = {_fmt(valor)}"
+
+        cache[clave] = (valor, _fmt(valor))
+        return cache[clave]
+
+    total, _ = yield from det(0, frozenset(range(n)), level)
+    total = Fraction(total)
+    if n == 1:
+        yield f"{'    ' * level}Caso base 1x1: det(A) = {_fmt(total)}"
+    yield f"{'    ' * level}Menores distintos calculados: {len(cache)}"
+    return total
+
+
+def pasos_modular(matrix: List[List[Fraction]], level: int = 0) -> Iterator[str]:
+    """Generador con la justificacion del determinante modular (devuelve det(A))."""
+    det, lineas = determinante_modular(matrix)
+    indent = "    " * level
+    for linea in lineas:
+        yield indent + linea
+    return det
+
+
+def determinante_por_metodo(matrix: List[List[Fraction]], metodo: str = METODO_AUTO, level: int = 0, trace: bool = True,
+                            calculados=None, detalle: bool = False):
+    """Devuelve (det, pasos) con el motor elegido, o None si metodo es "auto" y n
+    no supera el umbral (la ventana usa entonces su expansion por cofactores clasica).
+    En "auto" las matrices enteras grandes (usar_modular) van por TRC.
+    calculados y detalle pasan a pasos_determinante_paralelo.
+    Con trace=False siempre devuelve (det, [])."""
+    if not trace:
+        return determinante(matrix), []
+    n = len(matrix)
+    if metodo == METODO_AUTO and usar_modular(matrix):
+        return _recoger(pasos_modular(matrix, level))
+    if metodo == METODO_BAREISS or (metodo == METODO_AUTO and usar_bareiss(n)):
+        return determinante_bareiss_con_pasos(matrix, level)
+    if metodo == METODO_COFACTORES:
+        return determinante_cofactores_memo_con_pasos(matrix, level)
+    if metodo == METODO_COFACTORES_PARALELO:
+        return _recoger(pasos_determinante_paralelo(matrix, level, ascii=True, calculados=calculados, detalle=detalle))
+    return None
+
+
+def pasos_por_metodo(matrix: List[List[Fraction]], metodo: str = METODO_AUTO, level: int = 0):
+    """Generador de pasos del motor elegido (como determinante_por_metodo), o None
+    si metodo es "auto" y n no supera el umbral."""
+    n = len(matrix)
+    if metodo == METODO_AUTO and usar_modular(matrix):
+        return pasos_modular(matrix, level)
+    if metodo == METODO_BAREISS or (metodo == METODO_AUTO and usar_bareiss(n)):
+        return pasos_bareiss(matrix, level)
+    if metodo == METODO_COFACTORES:
+        return pasos_cofactores_memo(matrix, level)
+    if metodo == METODO_COFACTORES_PARALELO:
+        return pasos_determinante_paralelo(matrix, level, ascii=True)
+    return None
+
@@ -0,0 +1,134 @@
+"""Caché LRU de factorizaciones para resolver muchas veces con la misma A.
+
+Para A (m x n) se guarda una sola reducción de [A | I]: la RREF R de A, las
+columnas pivote y la matriz E (m x m) con E·A = R. Como Gauss-Jordan elige los
+pivotes mirando solo las columnas de A, la RREF de [A | b] es [R | E·b] para
+cualquier b, y si A es cuadrada e invertible E = A^-1. Así, repetir A cuesta
+un producto matriz-vector O(m^2) en vez de una eliminación completa.
+
+Las entradas se identifican por un hash canónico de los valores exactos y
+se descartan las menos usadas cuando el tamaño estimado pasa de
+TAMANO_MAXIMO bytes.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from fractions import Fraction
+from operator import mul
+from typing import List, Optional
+
+from . import aritmetica
+from .racional import MatrizRacional
+
+TAMANO_MAXIMO = 32 * 1024 * 1024
+
+# Bytes que se suman por entrada además de los de sus enteros (objetos y listas)
+_COSTE_ENTRADA = 64
+
+
+def clave_matriz(A) -> bytes:
+    """Hash canónico de A: dimensiones y cada entrada como num/den reducido."""
+    filas = len(A)
+    columnas = len(A[0]) if filas else 0
+    h = hashlib.blake2b(f"{filas}x{columnas}".encode(), digest_size=20)
+    for fila in A:
+        partes = []
+        for x in fila:
+            x = Fraction(x)
+            partes.append(f"{x.numerator}/{x.denominator}")
+        h.update((";" + ",".join(partes)).encode())
+    return h.digest()
+
+
+class Factorizacion:
+    """RREF de A, columnas pivote y E con E·A = R (E como MatrizRacional)."""
+
+    __slots__ = ("reducida", "pivotes", "transformacion", "tamano")
+
+    def __init__(self, reducida, pivotes, transformacion: MatrizRacional):
+        self.reducida = reducida
+        self.pivotes = pivotes
+        self.transformacion = transformacion
+        bits = sum(abs(x.numerator).bit_length() + x.denominator.bit_length() for fila in reducida for x in fila)
+        bits += sum(int(x).bit_length() for fila in transformacion.filas for x in fila)
+        entradas = sum(len(fila) for fila in reducida) + sum(len(fila) for fila in transformacion.filas)
+        self.tamano = bits // 8 + _COSTE_ENTRADA * entradas
+
+    @classmethod
+    def calcular(cls, A, progreso=None) -> "Factorizacion":
+        m = len(A)
+        n = len(A[0]) if m else 0
+        M = MatrizRacional.desde_fracciones(
+            [list(fila) + [Fraction(int(i == j)) for j in range(m)] for i, fila in enumerate(A)]
+        )
+        pivotes = M.rref(n, progreso)
+        # E = bloque derecho (mismo denominador por fila que el izquierdo)
+        E = MatrizRacional([fila[n:] for fila in M.filas], list(M.dens), m)
+        izquierda = MatrizRacional([fila[:n] for fila in M.filas], list(M.dens), n)
+        return cls(izquierda.a_fracciones(), pivotes, E)
+
+    def rref(self) -> List[List[Fraction]]:
+        return [fila[:] for fila in self.reducida]
+
+    def transformar(self, b) -> List[Fraction]:
+        """E·b: la última columna de la RREF de [A | b]."""
+        b = [Fraction(x) for x in b]
+        D = aritmetica.mcm(*(x.denominator for x in b)) if b else 1
+        enteros = [x.numerator * (D // x.denominator) for x in b]
+        E = self.transformacion
+        return [aritmetica.a_fraccion(sum(map(mul, fila, enteros)), d * D) for fila, d in zip(E.filas, E.dens)]
+
+    def inversa(self) -> Optional[List[List[Fraction]]]:
+        """A^-1 si A es cuadrada e invertible (E), si no None."""
+        n = len(self.reducida)
+        if len(self.pivotes) != n or any(len(fila) != n for fila in self.reducida):
+            return None
+        return self.transformacion.a_fracciones()
+
+
+class CacheFactorizaciones:
+    """LRU de Factorizacion por clave_matriz, limitada por tamaño estimado."""
+
+    def __init__(self, tamano_maximo: int = TAMANO_MAXIMO):
+        self.tamano_maximo = tamano_maximo
+        self.tamano = 0
+        self.aciertos = 0
+        self.fallos = 0
+        self._entradas = OrderedDict()
+        self._cerrojo = threading.Lock()  # las ventanas Qt calculan en otros hilos
+
+    def __len__(self):
+        return len(self._entradas)
+
+    def obtener(self, A, progreso=None) -> Factorizacion:
+        clave = clave_matriz(A)
+        with self._cerrojo:
+            f = self._entradas.get(clave)
+            if f is not None:
+                self._entradas.move_to_end(clave)
+                self.aciertos += 1
+                return f
+            self.fallos += 1
+        f = Factorizacion.calcular(A, progreso)
+        with self._cerrojo:
+            if clave not in self._entradas and f.tamano <= self.tamano_maximo:
+                self._entradas[clave] = f
+                self.tamano += f.tamano
+                while self.tamano > self.tamano_maximo:
+                    _, viejo = self._entradas.popitem(last=False)
+                    self.tamano -= viejo.tamano
+        return f
+
+    def limpiar(self):
+        with self._cerrojo:
+            self._entradas.clear()
+            self.tamano = 0
+
+
+cache = CacheFactorizaciones()
+
+
+def factorizar(A, progreso=None) -> Factorizacion:
+    """Factorizacion de A desde la caché compartida (la calcula si no está)."""
+    return cache.obtener(A, progreso)
@@ -0,0 +1,205 @@
+from .factorizaciones import factorizar
+from .registro import RegistroOperaciones, aplicar_operacion
+
+
+def gauss_jordan(A, n, m, trace=True, progreso=None):
+    """Reduce en sitio la matriz aumentada A (n x m) y devuelve sus pasos.
+
+    Los pasos se guardan como operaciones de fila en un RegistroOperaciones;
+    al recorrerlo, cada paso es un dict con "titulo", "comentario",
+    "oper_lines" y "matriz_lines" generado en el momento.
+    Con trace=False no se registra nada y se devuelve una lista vacía: la
+    reducción de los coeficientes sale de la caché de factorizaciones (una A
+    repetida solo cuesta E·b) y el resultado se copia en A.
+    progreso(hecho, total), si se indica, se llama tras cada columna; puede
+    lanzar una excepción para abortar.
+    """
+    if not trace and m > 1:
+        f = factorizar([fila[:m - 1] for fila in A], progreso)
+        columna = f.transformar([fila[m - 1] for fila in A])
+        A[:] = [fila + [x] for fila, x in zip(f.rref(), columna)]
+        return []
+    registro = RegistroOperaciones(A, formatear=_paso_gauss_jordan) if trace else []
+    fila_pivote = 0
+    for col in range(m - 1):
+        pivote = None
+        for f in range(fila_pivote, n):
+            if A[f][col] != 0:
+                pivote = f
+                break
+        if pivote is None:
+            continue
+        if pivote != fila_pivote:
+            op = ("intercambio", fila_pivote, pivote, col)
+            aplicar_operacion(A, op)
+            if trace:
+                registro.registrar(op, A)
+        divisor = A[fila_pivote][col]
+        if divisor == 0:
+            fila_pivote += 1
+            continue
+        if divisor != 1:
+            op = ("escala", fila_pivote, divisor, col)
+            aplicar_operacion(A, op)
+            if trace:
+                registro.registrar(op, A)
+        for f in range(n):
+            if f != fila_pivote and A[f][col] != 0:
+                op = ("combinacion", f, fila_pivote, A[f][col], col)
+                aplicar_operacion(A, op)
+                if trace:
+                    registro.registrar(op, A)
+        fila_pivote += 1
+        if progreso is not None:
+            progreso(col + 1, m - 1)
+        if fila_pivote >= n:
+            break
+    return registro
+
+
+def _paso_gauss_jordan(op, antes, despues):
+    tipo, fila = op[0], op[1]
+    col = op[-1]
+    if tipo == "intercambio":
+        return {
+            "titulo": f"F{fila+1} ↔ F{op[2]+1}",
+            "comentario": f"Intercambio de filas para poner un pivote no nulo en la columna {col+1}",
+            "oper_lines": [],
+            "matriz_lines": format_matriz_lines(despues)
+        }
+    if tipo == "escala":
+        return {
+            "titulo": f"F{fila+1} → F{fila+1}/{op[2]}",
+            "comentario": f"Normalización: se convierte en pivote a 1 en la columna {col+1}",
+            "oper_lines": [],
+            "matriz_lines": format_matriz_lines(despues)
+        }
+    fila_pivote, factor = op[2], op[3]
+    return {
+        "titulo": f"F{fila+1} → F{fila+1} - ({factor})F{fila_pivote+1}",
+        "comentario": f"Se anula el elemento en la columna {col+1} usando la fila pivote",
+        "oper_lines": format_operacion_vertical_lines(
+            despues[fila_pivote], antes[fila], factor, despues[fila], fila_pivote + 1, fila + 1
+        ),
+        "matriz_lines": format_matriz_lines(despues)
+    }
+
+
+def format_operacion_vertical_lines(fila_pivote, fila_actual, factor, fila_result, idx_piv, idx_obj):
+    ancho = max(len(str(x)) for x in fila_result) if fila_result else 1
+
+    def fmt(lst):
+        return " ".join(str(x).rjust(ancho) for x in lst)
+
+    escala = [(-factor) * val for val in fila_pivote]
+
+    if factor < 0:
+        factor_str = f"+{abs(factor)}"
+    else:
+        factor_str = f"-{factor}"
+
+    lines = [
+        f"{factor_str}F{idx_piv} : {fmt(escala)}",
+        f"+F{idx_obj}   : {fmt(fila_actual)}",
+        " " * 10 + "-" * (ancho * len(fila_result) + len(fila_result) - 1),
+        f"=F{idx_obj}   : {fmt(fila_result)}"
+    ]
+    return lines
+
+
+def format_matriz_lines(A):
+    ancho = 1
+    for fila in A:
+        for x in fila:
+            ancho = max(ancho, len(str(x)))
+    lines = []
+    for fila in A:
+        line = " ".join(str(x).rjust(ancho) for x in fila)
+        lines.append(line)
+    return lines
+
+
+# Helpers para análisis de RREF y forma vectorial
+def analizar_rref(A):
+    """Devuelve (columnas pivote, columnas libres, {columna pivote: fila})."""
+    n = len(A); m = len(A[0]); num_vars = m - 1
+    piv_col_por_fila = [-1] * n
+    piv_fila_por_col = {}
+    for i in range(n):
+        for j in range(num_vars):
+            if A[i][j] == 1 and all(A[k][j] == 0 for k in range(n) if k != i):
+                piv_col_por_fila[i] = j
+                piv_fila_por_col[j] = i
+                break
+    pivot_cols = [j for j in piv_col_por_fila if j != -1]
+    free_cols = [j for j in range(num_vars) if j not in pivot_cols]
+    return pivot_cols, free_cols, piv_fila_por_col
+
+
+def extraer_soluciones(A):
+    """Lee las soluciones de la matriz reducida: (soluciones, tipo, analisis)."""
+    n = len(A); m = len(A[0]); num_vars = m - 1
+    # Incompatibilidad: [0 ... 0 | b≠0]
+    for i in range(n):
+        if all(A[i][j] == 0 for j in range(num_vars)) and A[i][-1] != 0:
+            return None, "incompatible", ([], [], {})
+    pivot_cols, free_cols, pivot_row_for_col = analizar_rref(A)
+    soluciones = [None] * num_vars
+    if free_cols:
+        for j in range(num_vars):
+            if j in free_cols:
+                soluciones[j] = f"x{j+1} es variable libre"
+            else:
+                irow = pivot_row_for_col.get(j, None)
+                partes = []
+                if irow is not None and A[irow][-1] != 0:
+                    partes.append(str(A[irow][-1]))
+                for l in free_cols:
+                    if irow is not None:
+                        coef = -A[irow][l]
+                        if coef != 0:
+                            partes.append(f"({coef})*x{l+1}")
+                expr = " + ".join(partes) if partes else "0"
+                soluciones[j] = expr
+        return soluciones, "indeterminado", (pivot_cols, free_cols, pivot_row_for_col)
+    else:
+        # Determinado
+        for j in range(num_vars):
+            irow = pivot_row_for_col.get(j, None)
+            soluciones[j] = A[irow][-1] if irow is not None else 0
+        return soluciones, "determinado", (pivot_cols, free_cols, pivot_row_for_col)
+
+
+def vectores_columna_lado_a_lado(vectores, nombres, espacio_entre_vectores=4):
+    n = len(vectores[0]) if vectores else 0
+    m = len(vectores)
+    encabezados = [nombres[0]] + [f"+ {nombres[idx]}" for idx in range(1, m)]
+    max_encabezado = max((len(e) for e in encabezados), default=0)
+    max_num_len = 1
+    for v in vectores:
+        for fila in range(n):
+            max_num_len = max(max_num_len, len(str(v[fila])))
+    bloque_ancho = max_encabezado + 3 + max_num_len + 2
+    sep = " " * espacio_entre_vectores
+    lines = []
+    for fila in range(n):
+        line = ""
+        for idx, v in enumerate(vectores):
+            valstr = str(v[fila]).rjust(max_num_len)
+            if fila == 0:
+                li, ri = "⎡", "⎤"  # ⎡ ⎤
+            elif fila == n - 1:
+                li, ri = "⎣", "⎦"  # ⎣ ⎦
+            else:
+                li, ri = "⎢", "⎥"  # ⎢ ⎥
+            if fila == 0:
+                encabezado = encabezados[idx].rjust(max_encabezado)
+                bloque = f"{encabezado} {li} {valstr} {ri}"
+            else:
+                bloque = " " * max_encabezado + f" {li} {valstr} {ri}"
+            bloque = bloque.ljust(bloque_ancho)
+            if idx < m - 1:
+                bloque += sep
+            line += bloque
+        lines.append(line.rstrip())
+    return lines
@@ -0,0 +1,609 @@
+from difflib import SequenceMatcher
+from fractions import Fraction
+from math import gcd
+
+from .inversa import rref_info
+from .modular import UMBRAL_MODULAR, es_entera, rango_modular
+from .registro import RegistroOperaciones, aplicar_operacion
+
+
+def es_vector_cero(v):
+    return all(x == 0 for x in v)
+
+
+
+
+def son_multiplos(v1, v2):
+    ratio = None
+    for a, b in zip(v1, v2):
+        if b == 0 and a == 0:
+            continue
+        elif b == 0 or a == 0:
+            return False
+        else:
+            r = a / b
+            if ratio is None:
+                ratio = r
+            elif abs(r - ratio) > 1e-10:
+                return False
+    return ratio is not None
+
+
+
+
+def _matriz_columnas(vectores):
+    """Matriz n x p con los vectores como columnas."""
+    return [[Fraction(v[i]).limit_denominator() for v in vectores] for i in range(len(vectores[0]))]
+
+
+def _rango_si_entera(V):
+    """(rango, justificación) de V por rango_modular si V es entera y alguna
+    dimensión llega a UMBRAL_MODULAR; None si no."""
+    if V and max(len(V), len(V[0])) >= UMBRAL_MODULAR and es_entera(V):
+        return rango_modular(V)
+    return None
+
+
+def _reglas_generales(vectores, n):
+    """Reglas que ya deciden la dependencia (vector cero, más vectores que
+    dimensiones) o, si no aplica ninguna, la definición por el rango."""
+    reglas = []
+    for k, v in enumerate(vectores):
+        if es_vector_cero(v):
+            reglas.append(f"• El conjunto contiene el vector cero (v{k+1}), por lo que es linealmente dependiente.")
+            break
+    if len(vectores) > n:
+        reglas.append(f"• El conjunto tiene más vectores ({len(vectores)}) que dimensiones ({n}), por lo que es linealmente dependiente.")
+    if not reglas:
+        reglas.append("• Un conjunto {v₁,…,vₚ} es linealmente independiente si y solo si el rango de V = [v₁ ⋯ vₚ] es p.")
+    return reglas
+
+
+# ---------- Función de independencia ----------
+def son_linealmente_independientes(vectores, trace=True):
+    """Devuelve (independiente, justificación).
+
+    Con trace=False solo se calcula el rango de la matriz de columnas (por
+    aritmética modular si es entera y grande) y la justificación queda vacía.
+    """
+    if not trace:
+        V = _matriz_columnas(vectores)
+        modular = _rango_si_entera(V)
+        if modular is not None:
+            return modular[0] == len(vectores), ""
+        _, piv_cols, _ = rref_info(V)
+        return len(piv_cols) == len(vectores), ""
+
+    # ---------- utilidades ----------
+    def toF(x):
+        return Fraction(x).limit_denominator()
+
+    def lcm(a, b):
+        return abs(a*b) // gcd(a, b) if a and b else 0
+
+    def lcm_list(nums):
+        cur = 1
+        for d in nums:
+            cur = lcm(cur, d) if cur else d
+        return cur if cur else 1
+
+    def fmt_frac(q: Fraction):
+        return f"{q.numerator}" if q.denominator == 1 else f"{q.numerator}/{q.denominator}"
+
+    def formato_matriz(M):
+        filas_txt = []
+        for fila in M:
+            izq = "  ".join(f"{fmt_frac(x):>7}" for x in fila[:-1])
+            der = f"{fmt_frac(fila[-1]):>7}"
+            filas_txt.append("[ " + izq + "  |  " + der + " ]")
+        return "\n".join(filas_txt)
+
+    # ---------- datos base ----------
+    n = len(vectores[0])     # dimensión
+    p = len(vectores)        # nº de vectores = nº de variables c1..cp
+
+    resultado = ""
+    reglas_aplicadas = []
+
+    # ---------- reglas básicas ----------
+    for idx, v in enumerate(vectores):
+        if es_vector_cero(v):
+            reglas_aplicadas.append(f"• El conjunto contiene el vector cero (v{idx+1} = {v}), por lo que es linealmente dependiente.")
+    if p > n:
+        reglas_aplicadas.append(f"• El conjunto tiene más vectores ({p}) que dimensiones ({n}), por lo que es linealmente dependiente.")
+    if p == 1:
+        if not es_vector_cero(vectores[0]):
+            reglas_aplicadas.append("• Un conjunto que solo tiene un vector v es linealmente independiente si y solo si v no es el vector cero.")
+        else:
+            reglas_aplicadas.append("• El único vector es el vector cero, por lo que el conjunto es linealmente dependiente.")
+    if p == 2:
+        if son_multiplos(vectores[0], vectores[1]):
+            reglas_aplicadas.append("• Un conjunto de dos vectores {v₁, v₂} es linealmente dependiente si al menos uno de los vectores es un múltiplo del otro.")
+        else:
+            reglas_aplicadas.append("• Un conjunto de dos vectores {v₁, v₂} es linealmente independiente si y solo si ninguno de los vectores es un múltiplo del otro.")
+
+    if p <= 2 and reglas_aplicadas:
+        resultado += "📘 Reglas aplicadas:\n" + "\n".join(reglas_aplicadas) + "\n\n"
+        if any("es linealmente dependiente" in r for r in reglas_aplicadas):
+            resultado += "❌ El conjunto es linealmente DEPENDIENTE.\n"
+            return False, resultado
+        else:
+            resultado += "✅ El conjunto es linealmente INDEPENDIENTE.\n"
+            return True, resultado
+
+    # ---------- núcleo: SIEMPRE columnas = vectores ----------
+    V = [[toF(vectores[j][i]) for j in range(p)] for i in range(n)]  # n x p
+    A = [row + [Fraction(0)] for row in V]  # [V | 0]
+
+    pasos = ["📗 Procedimiento paso a paso (Gauss-Jordan sobre c1..cₚ, columnas=vectores):\n\n"]
+
+    def texto_paso(op, antes, despues):
+        tipo, fila = op[0], op[1]
+        if tipo == "intercambio":
+            linea = f"↔ Se intercambian filas F{fila+1} ↔ F{op[2]+1}\n"
+        elif tipo == "escala":
+            linea = f"F{fila+1} → F{fila+1} / {fmt_frac(op[2])}\n"
+        else:
+            linea = f"F{fila+1} → F{fila+1} - ({fmt_frac(op[3])})·F{op[2]+1}\n"
+        return linea + formato_matriz(despues) + "\n\n"
+
+    # Durante la eliminación solo se anotan las operaciones; el texto de
+    # cada paso se genera después, reaplicándolas.
+    registro = RegistroOperaciones(A, formatear=texto_paso)
+
+    piv_fila = 0
+    pos_piv_col = [-1] * n
+
+    # Gauss–Jordan (solo columnas de variables: 0..p-1)
+    for col in range(p):
+        fila_pivote = None
+        for f in range(piv_fila, n):
+            if A[f][col] != 0:
+                fila_pivote = f
+                break
+        if fila_pivote is None:
+            continue
+        if fila_pivote != piv_fila:
+            op = ("intercambio", piv_fila, fila_pivote, col)
+            aplicar_operacion(A, op)
+            registro.registrar(op, A)
+        factor = A[piv_fila][col]
+        if factor != 0:
+            op = ("escala", piv_fila, factor, col)
+            aplicar_operacion(A, op)
+            registro.registrar(op, A)
+        for f in range(n):
+            if f != piv_fila and A[f][col] != 0:
+                op = ("combinacion", f, piv_fila, A[f][col], col)
+                aplicar_operacion(A, op)
+                registro.registrar(op, A)
+        pos_piv_col[piv_fila] = col
+        piv_fila += 1
+        if piv_fila == n:
+            break
+    pasos.extend(registro)
+
+    # columnas pivote y libres (sobre variables 0..p-1)
+    piv_cols = set(c for c in pos_piv_col if c != -1)
+    libres = [j for j in range(p) if j not in piv_cols]
+
+    # vector solución c (tamaño p)
+    c = [Fraction(0)] * p
+
+    # ------------ helpers para despeje robusto (evita IndexError) ------------
+    def despeje_vk_desde_Cint(Cint, prefer_libres=None):
+        """Devuelve (k, rhs_str). Elige k con RHS no vacío; si no hay, v_k = 0."""
+        prefer_libres = set(prefer_libres or [])
+        candidatos = list(range(p))
+
+        def prioridad(idx):
+            Ci = Cint[idx]
+            if Ci == -1: return (0, idx)
+            if abs(Ci) == 1: return (1, idx)
+            if idx in prefer_libres: return (2, idx)
+            return (3, idx)
+
+        candidatos.sort(key=prioridad)
+
+        for cand in candidatos:
+            Ck = Cint[cand]
+            if Ck == 0:
+                continue
+            tmp_terms = []
+            for i, Ci in enumerate(Cint):
+                if i == cand or Ci == 0:
+                    continue
+                frac = Fraction(-Ci, Ck).limit_denominator()
+                s = "-" if frac < 0 else ""
+                aval = -frac if frac < 0 else frac
+                coef_txt = fmt_frac(aval)
+                tmp_terms.append(f"{s}{coef_txt}·v{i+1}")
+            if tmp_terms:
+                rhs = tmp_terms[0]
+                for t in tmp_terms[1:]:
+                    rhs += (" + " + t) if not t.startswith("-") else (" - " + t[1:])
+                return cand, rhs
+
+        # Caso extremo: sin RHS → v_k = 0
+        k_fallback = candidatos[0] if candidatos else 0
+        return k_fallback, "0   (columna nula)"
+
+    # -------------------------------------------------------------------------
+
+    if libres:
+        # DEPENDIENTE — presentación didáctica (una o varias libres)
+        reglas_aplicadas.append("• Es linealmente dependiente si existen coeficientes no todos cero tales que c₁v₁ + c₂v₂ + ⋯ + cₚvₚ = 0, es decir, al menos uno de los vectores puede escribirse como combinación lineal de los demás.")
+        resultado += "📘 Reglas aplicadas:\n" + "\n".join(reglas_aplicadas) + "\n\n"
+        resultado += "".join(pasos)
+
+        # ---- 1) UNA libre: formato especial que pediste ----
+        if len(libres) == 1:
+            j = libres[0]               # índice de la variable libre
+            tname = "t"
+            # c_i en función de c_j (c_col = -A[i][j] c_j)
+            coef_en_j = [Fraction(0)] * p
+            coef_en_j[j] = Fraction(1)
+            for i in reversed(range(n)):
+                if pos_piv_col[i] == -1:
+                    continue
+                col = pos_piv_col[i]
+                coef_en_j[col] = (-A[i][j]).limit_denominator()
+
+            # Relaciones "c1 = 2c3, c2 = -c3, c3 libre (sea c3 = t)"
+            rel_lineas = []
+            for i in range(p):
+                if i == j:
+                    continue
+                a = coef_en_j[i]
+                if a == 0:
+                    rel_lineas.append(f"c{i+1} = 0")
+                else:
+                    pref = "-" if a < 0 else ""
+                    aval = -a if a < 0 else a
+                    coef_txt = fmt_frac(aval)
+                    rel_lineas.append(f"c{i+1} = {pref}{coef_txt}c{j+1}")
+            rel_lineas.append(f"c{j+1} libre (sea c{j+1} = {tname})")
+
+            resultado += "Relaciones entre coeficientes:\n" + ", ".join(rel_lineas) + "\n\n"
+            resultado += f"Variables libres: c{j+1} libre (sea c{j+1} = {tname})\n\n"
+
+            # Solución general y particular
+            dir_vec = [coef_en_j[i] for i in range(p)]
+            dir_vec[j] = Fraction(1)  # el libre vale 1 en el vector dirección
+            vec_txt = "(" + ", ".join(fmt_frac(x) for x in dir_vec) + ")"
+            resultado += f"Solución general: c = {tname}{vec_txt}\n"
+            resultado += f"Tomando {tname} = 1 → c = {vec_txt}\n"
+
+            # Construir Σ C_i v_i = 0 (entero)
+            L = lcm_list([x.denominator for x in dir_vec])
+            Cint = [int(x * L) for x in dir_vec]
+            # "Es decir: ..." bonito
+            suma_str = []
+            for i, Ci in enumerate(Cint):
+                if Ci == 0:
+                    continue
+                term = f"{abs(Ci)}v{i+1}"
+                if not suma_str:
+                    suma_str.append(("-" if Ci < 0 else "") + term)
+                else:
+                    suma_str.append((" - " if Ci < 0 else " + ") + term)
+            resultado += "Es decir: " + "".join(suma_str) + " = 0"
+
+            # Despejar v_k con RHS no vacío (preferir libre)
+            k, rhs = despeje_vk_desde_Cint(Cint, prefer_libres=[j])
+            resultado += f"  ⇔  v{k+1} = {rhs}\n\n"
+
+            # Relación entera final
+            relacion = " + ".join([f"{Cint[i]}·v{i+1}" for i in range(p)])
+            resultado += f"🔢 Versión entera equivalente: {relacion} = 0\n"
+            resultado += "❌ El conjunto es **linealmente DEPENDIENTE**.\n"
+            return False, resultado
+
+        # ---- 2) Varias libres: formato paramétrico t1, t2, ... ----
+        else:
+            # Relaciones c_pivote = sum_j (-A[i][j]) c_j
+            relaciones = []
+            for i in reversed(range(n)):
+                if pos_piv_col[i] == -1:
+                    continue
+                col = pos_piv_col[i]
+                terminos = []
+                for j in range(col+1, p):
+                    if j in libres and A[i][j] != 0:
+                        coef = (-A[i][j]).limit_denominator()
+                        s = "-" if coef < 0 else ""
+                        aval = -coef if coef < 0 else coef
+                        terminos.append(f"{s}{fmt_frac(aval)}c{j+1}")
+                if terminos:
+                    expr = terminos[0]
+                    for t in terminos[1:]:
+                        expr += (" + " + t) if not t.startswith("-") else (" - " + t[1:])
+                    relaciones.append(f"c{col+1} = {expr}")
+                else:
+                    relaciones.append(f"c{col+1} = 0")
+
+            param_name = {j: f"t{k+1}" for k, j in enumerate(libres)}
+            for j in libres:
+                relaciones.append(f"c{j+1} libre (pongamos c{j+1} = {param_name[j]})")
+
+            resultado += "Relaciones entre coeficientes:\n" + "\n".join(relaciones) + "\n\n"
+            resultado += "Variables libres: " + ", ".join([f"c{j+1} (sea c{j+1} = {param_name[j]})" for j in libres]) + "\n\n"
+
+            # Base del núcleo y solución general
+            base_nucleo = []
+            for jlib in libres:
+                c_basis = [Fraction(0)] * p
+                c_basis[jlib] = Fraction(1)
+                for i in reversed(range(n)):
+                    if pos_piv_col[i] == -1:
+                        continue
+                    col = pos_piv_col[i]
+                    suma = sum(A[i][k] * c_basis[k] for k in range(col+1, p))
+                    c_basis[col] = -suma
+                base_nucleo.append(c_basis)
+
+            partes = []
+            for k0, vdir in enumerate(base_nucleo):
+                vec_txt = "(" + ", ".join(fmt_frac(x) for x in vdir) + ")"
+                partes.append(f"t{k0+1}{vec_txt}")
+            resultado += "Solución general: c = " + " + ".join(partes) + "\n"
+
+            # Particular clara: t1=1, resto 0
+            c = base_nucleo[0][:]
+            vec_txt = "(" + ", ".join(fmt_frac(x) for x in c) + ")"
+            fija = [f"t1 = 1"] + [f"t{k0+1} = 0" for k0 in range(1, len(libres))]
+            resultado += "Tomando " + ", ".join(fija) + f" → c = {vec_txt}\n"
+
+            # Relación entera y despeje robusto (preferir libres)
+            denoms = [ci.denominator for ci in c]
+            M = lcm_list(denoms)
+            Cint = [int(ci * M) for ci in c]
+
+            k, rhs = despeje_vk_desde_Cint(Cint, prefer_libres=libres)
+            resultado += f"\n🧮 Despejando un vector:\n"
+            resultado += f"v{k+1} = {rhs}\n"
+
+            relacion = " + ".join([f"{Cint[i]}·v{i+1}" for i in range(p)])
+            resultado += f"🔢 Versión entera equivalente: {relacion} = 0\n"
+            resultado += "❌ El conjunto es **linealmente DEPENDIENTE**.\n"
+            return False, resultado
+
+    else:
+        # INDEPENDIENTE (con procedimiento)
+        reglas_aplicadas.append("• Se dice que un conjunto de vectores {v₁,…,vₚ} en ℝⁿ es linealmente independiente si la ecuación c₁v₁ + c₂v₂ + ⋯ + cₚvₚ = 0 solo tiene la solución trivial.")
+        resultado += "📘 Reglas aplicadas:\n" + "\n".join(reglas_aplicadas) + "\n\n"
+        pasos.append("Matriz reducida (RREF):\n")
+        pasos.append(formato_matriz(A) + "\n\n")
+        pasos.append(f"Columnas pivote (sobre c1..c{p}): {sorted(list(piv_cols))}\n")
+        pasos.append(f"Rango de V: {len(piv_cols)}\n")
+        pasos.append("Variables libres: ninguna\n\n")
+        resultado += "".join(pasos)
+        resultado += "Solución trivial: " + ", ".join([f"c{i+1}=0" for i in range(p)]) + "\n\n"
+        resultado += "✅ El conjunto es **linealmente INDEPENDIENTE**.\n"
+        return True, resultado
+
+
+# ---------- Base escalonada incremental ----------
+# A partir de este número de vectores las ventanas muestran la justificación
+# de BaseEscalonada (rango y una relación de dependencia) en vez de todo el
+# Gauss-Jordan, y solo reducen los vectores que cambiaron desde la última vez.
+UMBRAL_INCREMENTAL = 8
+
+
+def _texto_fraccion(q):
+    return f"{q.numerator}" if q.denominator == 1 else f"{q.numerator}/{q.denominator}"
+
+
+class _FilaBase:
+    """Fila de la base reducida: 1 en su columna pivote, 0 en las demás
+    columnas pivote, y sus coeficientes respecto a los vectores originales."""
+
+    __slots__ = ("pivote", "valores", "coeficientes")
+
+    def __init__(self, pivote, valores, coeficientes):
+        self.pivote = pivote
+        self.valores = valores
+        self.coeficientes = coeficientes
+
+
+class BaseEscalonada:
+    """Base escalonada reducida del espacio generado por una lista de vectores.
+
+    Añadir un vector es una sola reducción contra la base (O(r·(n + p)) con r
+    el rango); quitar uno que aporta pivote lo saca de la base con operaciones
+    entre filas y solo vuelve a reducir los vectores dependientes cuya relación
+    lo usaba. Los vectores dependientes guardan una relación
+    v = Σ c_j v_j con vectores que sí aportan pivote.
+    """
+
+    def __init__(self, dimension=0):
+        self.dimension = dimension
+        self._vectores = []
+        self._ids = []
+        self._siguiente = 0
+        self._filas = []
+        self._relaciones = {}
+
+    def __len__(self):
+        return len(self._vectores)
+
+    @property
+    def rango(self):
+        return len(self._filas)
+
+    @property
+    def independiente(self):
+        return len(self._filas) == len(self._vectores)
+
+    @property
+    def columnas_pivote(self):
+        return sorted(f.pivote for f in self._filas)
+
+    def _reducir(self, v):
+        """(residuo, combinación) con v = residuo + Σ combinación[id] v_id."""
+        residuo = list(v)
+        combinacion = {}
+        for fila in self._filas:
+            f = residuo[fila.pivote]
+            if not f:
+                continue
+            residuo = [a - f * b if b else a for a, b in zip(residuo, fila.valores)]
+            for j, c in fila.coeficientes.items():
+                combinacion[j] = combinacion.get(j, 0) + f * c
+        return residuo, {j: c for j, c in combinacion.items() if c}
+
+    def _colocar(self, ident, v):
+        """Reduce v: lo añade a la base o guarda su relación de dependencia."""
+        residuo, combinacion = self._reducir(v)
+        col = next((k for k, x in enumerate(residuo) if x), None)
+        if col is None:
+            self._relaciones[ident] = combinacion
+            return False
+        s = residuo[col]
+        nueva = _FilaBase(
+            col,
+            [x / s for x in residuo],
+            {ident: 1 / s, **{j: -c / s for j, c in combinacion.items()}},
+        )
+        # anular la nueva columna pivote en el resto de filas (siguen reducidas)
+        for fila in self._filas:
+            g = fila.valores[col]
+            if g:
+                fila.valores = [a - g * b if b else a for a, b in zip(fila.valores, nueva.valores)]
+                self._restar_coeficientes(fila, nueva, g)
+        self._filas.append(nueva)
+        return True
+
+    @staticmethod
+    def _restar_coeficientes(fila, otra, g):
+        coef = fila.coeficientes
+        for j, c in otra.coeficientes.items():
+            valor = coef.get(j, 0) - g * c
+            if valor:
+                coef[j] = valor
+            else:
+                coef.pop(j, None)
+
+    def insertar(self, posicion, v):
+        """Inserta v en posicion; True si no es combinación de los demás."""
+        v = [Fraction(x).limit_denominator() for x in v]
+        if len(v) != self.dimension:
+            raise ValueError("Todos los vectores deben tener la misma dimensión.")
+        ident = self._siguiente
+        self._siguiente += 1
+        self._vectores.insert(posicion, v)
+        self._ids.insert(posicion, ident)
+        return self._colocar(ident, v)
+
+    def agregar(self, v):
+        return self.insertar(len(self._vectores), v)
+
+    def quitar(self, posicion):
+        """Quita el vector de posicion (recálculo local si aportaba pivote)."""
+        ident = self._ids.pop(posicion)
+        self._vectores.pop(posicion)
+        if self._relaciones.pop(ident, None) is not None:
+            return
+        # fila con coeficiente no nulo para ident: con ella se elimina ident de
+        # las demás y se descarta; las que quedan siguen reducidas
+        r = next(k for k, fila in enumerate(self._filas) if fila.coeficientes.get(ident))
+        fila_r = self._filas.pop(r)
+        cr = fila_r.coeficientes[ident]
+        for fila in self._filas:
+            c = fila.coeficientes.get(ident)
+            if c:
+                g = c / cr
+                fila.valores = [a - g * b if b else a for a, b in zip(fila.valores, fila_r.valores)]
+                self._restar_coeficientes(fila, fila_r, g)
+        # solo los dependientes que usaban ident se vuelven a reducir
+        for j, v in zip(self._ids, self._vectores):
+            relacion = self._relaciones.get(j)
+            if relacion is not None and ident in relacion:
+                del self._relaciones[j]
+                self._colocar(j, v)
+
+    def sincronizar(self, vectores):
+        """Lleva la base a la lista vectores quitando e insertando solo lo que
+        cambió respecto a la lista anterior."""
+        nuevos = [[Fraction(x).limit_denominator() for x in v] for v in vectores]
+        dimension = len(nuevos[0]) if nuevos else 0
+        if dimension != self.dimension:
+            self.__init__(dimension)
+        anteriores = [tuple(v) for v in self._vectores]
+        cambios = SequenceMatcher(None, anteriores, [tuple(v) for v in nuevos], autojunk=False).get_opcodes()
+        for tipo, i1, i2, j1, j2 in reversed(cambios):
+            if tipo == "equal":
+                continue
+            for k in reversed(range(i1, i2)):
+                self.quitar(k)
+            for k, v in enumerate(nuevos[j1:j2]):
+                self.insertar(i1 + k, v)
+
+    def relacion(self):
+        """(k, {j: c}) del primer vector dependiente, con v_k = Σ c·v_j
+        (posiciones desde 0), o None si el conjunto es independiente."""
+        posicion = {ident: k for k, ident in enumerate(self._ids)}
+        for k, ident in enumerate(self._ids):
+            relacion = self._relaciones.get(ident)
+            if relacion is not None:
+                return k, {posicion[j]: c for j, c in sorted(relacion.items(), key=lambda t: posicion[t[0]])}
+        return None
+
+    def justificacion(self):
+        """Texto de la comprobación con el formato de las ventanas."""
+        p = len(self._vectores)
+        reglas = _reglas_generales(self._vectores, self.dimension)
+        aportan = [f"v{k+1}" for k, ident in enumerate(self._ids) if ident not in self._relaciones]
+        texto = "📘 Reglas aplicadas:\n" + "\n".join(reglas) + "\n\n"
+        texto += "📗 Base escalonada incremental (solo se reducen los vectores que cambiaron):\n"
+        texto += f"Vectores que aportan pivote: {', '.join(aportan) if aportan else 'ninguno'}\n"
+        texto += f"Coordenadas pivote: {[c + 1 for c in self.columnas_pivote]}\n"
+        texto += f"Rango de V: {self.rango} de p = {p}\n\n"
+        dependiente = self.relacion()
+        if dependiente is None:
+            texto += "Solución trivial: " + ", ".join(f"c{i+1}=0" for i in range(p)) + "\n\n"
+            texto += "✅ El conjunto es **linealmente INDEPENDIENTE**.\n"
+            return texto
+        k, relacion = dependiente
+        terminos = []
+        for j, c in relacion.items():
+            signo = "-" if c < 0 else "+"
+            terminos.append(f"{signo} {_texto_fraccion(abs(c))}·v{j+1}")
+        rhs = " ".join(terminos).lstrip("+ ") if terminos else "0   (vector cero)"
+        if rhs.startswith("- "):
+            rhs = "-" + rhs[2:]
+        texto += f"🧮 Relación de dependencia:\nv{k+1} = {rhs}\n\n"
+        texto += "❌ El conjunto es **linealmente DEPENDIENTE**.\n"
+        return texto
+
+
+def _justificacion_modular(vectores, rango, lineas):
+    p = len(vectores)
+    texto = "📘 Reglas aplicadas:\n" + "\n".join(_reglas_generales(vectores, len(vectores[0]))) + "\n\n"
+    texto += "📗 Rango de V = [v₁ ⋯ vₚ] por aritmética modular (entradas enteras):\n"
+    texto += "\n".join(lineas) + "\n"
+    texto += f"Rango de V: {rango} de p = {p}\n\n"
+    if rango == p:
+        texto += "Solución trivial: " + ", ".join(f"c{i+1}=0" for i in range(p)) + "\n\n"
+        texto += "✅ El conjunto es **linealmente INDEPENDIENTE**.\n"
+    else:
+        texto += "❌ El conjunto es **linealmente DEPENDIENTE**.\n"
+    return texto
+
+
+def verificar_independencia(base, vectores):
+    """(independiente, justificación) para las ventanas.
+
+    Con entradas enteras y alguna dimensión >= UMBRAL_MODULAR decide el rango
+    modular (con su cota como justificación); si no, con menos de
+    UMBRAL_INCREMENTAL vectores, el procedimiento completo, y a partir de ahí
+    base (una BaseEscalonada que la ventana conserva) se actualiza solo con
+    los cambios."""
+    modular = _rango_si_entera(_matriz_columnas(vectores)) if vectores else None
+    if modular is not None:
+        rango, lineas = modular
+        return rango == len(vectores), _justificacion_modular(vectores, rango, lineas)
+    if len(vectores) < UMBRAL_INCREMENTAL:
+        return son_linealmente_independientes(vectores)
+    base.sincronizar(vectores)
+    return base.independiente, base.justificacion()
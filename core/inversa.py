@@ -0,0 +1,234 @@
+from fractions import Fraction
+
+from .factorizaciones import factorizar
+from .registro import RegistroOperaciones, aplicar_operacion
+
+
+def identidad(n):
+    return [[Fraction(1 if i == j else 0) for j in range(n)] for i in range(n)]
+
+
+def rref_info(A):
+    """Devuelve (RREF, columnas_pivote, columnas_libres) usando Fraction.
+
+    La reducción sale de la caché de factorizaciones.
+    """
+    n = len(A)
+    if n == 0:
+        return [], [], []
+    m = len(A[0])
+    f = factorizar(A)
+    piv_cols = list(f.pivotes)
+    M = f.rref()
+    free_cols = [j for j in range(m) if j not in piv_cols]
+    return M, piv_cols, free_cols
+
+
+def explicar_invertibilidad(A):
+    """Líneas con la justificación de invertibilidad según (c), (d) y (e)."""
+    R, piv_cols, free_cols = rref_info(A)
+    lines = []
+    lines.append("Comprobación de invertibilidad (c, d, e):")
+    lines.append("")
+    lines.append("RREF de A:")
+    if R:
+        maxw = max(len(str(v)) for fila in R for v in fila)
+        for fila in R:
+            lines.append(" ".join(str(v).rjust(maxw) for v in fila))
+    lines.append("")
+    n = len(A)
+    if len(piv_cols) != n:
+        lines.append(f"- (c) No tiene n posiciones pivote: {len(piv_cols)} de {n}.")
+    else:
+        lines.append(f"- (c) Tiene n posiciones pivote: {len(piv_cols)} de {n}.")
+    if free_cols:
+        j0 = free_cols[0]
+        x = [Fraction(0) for _ in range(n)]
+        x[j0] = Fraction(1)
+        for r, pc in enumerate(piv_cols):
+            if j0 < len(R[0]):
+                x[pc] = -R[r][j0]
+        lines.append("")
+        lines.append("- (d) Existe solución no trivial para Ax = 0. Ejemplo:")
+        lines.append("x = [ " + ", ".join(str(v) for v in x) + " ]^t")
+        lines.append("")
+        lines.append("- (e) Por consiguiente, las columnas de A son linealmente dependientes (no LI).")
+    else:
+        lines.append("")
+        lines.append("- (d) Ax=0 solo tiene la solución trivial.")
+        lines.append("- (e) Las columnas de A son linealmente independientes.")
+    return lines
+
+
+def inversa_gauss_jordan(A, trace=True, progreso=None):
+    """Gauss-Jordan sobre [A | I] (primer pivote no nulo de cada columna).
+
+    Devuelve (A reducida, I transformada, columnas pivote, pasos). Los pasos
+    son un RegistroOperaciones sobre [A | I]; al recorrerlo cada paso es un
+    dict con "tipo" ("intercambio", "escala" o "eliminacion"), las filas y la
+    columna involucradas, el valor usado y A e I tras aplicarlo; las
+    eliminaciones llevan además la fila pivote y la fila antes del cambio
+    (ambas completas, A|I). A es invertible si hay n columnas pivote.
+    Con trace=False no se registra nada (pasos es una lista vacía) y el
+    resultado sale de la caché de factorizaciones.
+    progreso(hecho, total), si se indica, se llama tras cada columna.
+    """
+    n = len(A)
+    M = [list(fila) + fila_i for fila, fila_i in zip(A, identidad(n))]
+    if not trace:
+        f = factorizar(A, progreso)
+        return f.rref(), f.transformacion.a_fracciones(), list(f.pivotes), []
+    pasos = RegistroOperaciones(M, formatear=_paso_inversa) if trace else []
+    pivot_cols = []
+    fila_pivote = 0
+    for col in range(n):
+        piv = None
+        for r in range(fila_pivote, n):
+            if M[r][col] != 0:
+                piv = r
+                break
+        if piv is None:
+            continue
+        if piv != fila_pivote:
+            op = ("intercambio", fila_pivote, piv, col)
+            aplicar_operacion(M, op)
+            if trace:
+                pasos.registrar(op, M)
+        a = M[fila_pivote][col]
+        if a != 1:
+            op = ("escala", fila_pivote, a, col)
+            aplicar_operacion(M, op)
+            if trace:
+                pasos.registrar(op, M)
+        for r in range(n):
+            if r == fila_pivote:
+                continue
+            f = M[r][col]
+            if f == 0:
+                continue
+            op = ("combinacion", r, fila_pivote, f, col)
+            aplicar_operacion(M, op)
+            if trace:
+                pasos.registrar(op, M)
+        pivot_cols.append(col)
+        fila_pivote += 1
+        if progreso is not None:
+            progreso(col + 1, n)
+        if fila_pivote >= n:
+            break
+    Aw = [fila[:n] for fila in M]
+    Iw = [fila[n:] for fila in M]
+    return Aw, Iw, pivot_cols, pasos
+
+
+def _paso_inversa(op, antes, despues):
+    n = len(despues)
+    tipo, fila, col = op[0], op[1], op[-1]
+    paso = {"fila": fila, "col": col}
+    if tipo == "intercambio":
+        paso.update(tipo="intercambio", otra=op[2])
+    elif tipo == "escala":
+        paso.update(tipo="escala", valor=op[2])
+    else:
+        paso.update(
+            tipo="eliminacion", fila_pivote=op[2], valor=op[3],
+            pivote=despues[op[2]][:], antes=antes[fila][:],
+        )
+    paso["A"] = [f[:n] for f in despues]
+    paso["I"] = [f[n:] for f in despues]
+    return paso
+
+
+def inversa(A):
+    """A^-1 con Fraction, o None si A no es invertible (vía la caché de factorizaciones)."""
+    return factorizar(A).inversa()
+
+
+# Pasos genéricos para la animación; los valores exactos (pivote/factor) se
+# calculan al aplicar cada paso.
+def pasos_inversa(n):
+    pasos = []
+    for k in range(n):
+        pasos.append(("pivot", k))
+        pasos.append(("scale", k))
+        for i in range(n):
+            if i != k:
+                pasos.append(("elim", i, k))
+    return pasos
+
+
+def aplicar_paso_inversa(A, I, step):
+    """Aplica en sitio un paso de pasos_inversa sobre [A | I].
+
+    Devuelve (ok, texto): ok es False si no hay pivote (A singular) y texto
+    describe la operación realizada (None si no aplica).
+    """
+    n = len(A)
+    if step[0] == "pivot":
+        _, k = step
+        # seleccionar mejor pivote (mayor valor absoluto) y/o intercambiar
+        p = None
+        best_abs = Fraction(0)
+        for r in range(k, n):
+            v = A[r][k]
+            if v != 0 and abs(v) >= best_abs:
+                best_abs = abs(v)
+                p = r
+        if p is None or A[p][k] == 0:
+            return False, None
+        if p != k:
+            A[k], A[p] = A[p], A[k]
+            I[k], I[p] = I[p], I[k]
+            return True, f"Intercambiar R{k+1} -> R{p+1}"
+        return True, f"Pivote en R{k+1} ya adecuado"
+    if step[0] == "scale":
+        _, k = step
+        a = A[k][k]
+        if a == 0:
+            return False, None
+        if a != 1:
+            for j in range(n):
+                A[k][j] /= a
+                I[k][j] /= a
+            return True, f"R{k+1} := R{k+1} / {a}"
+        return True, f"Pivote R{k+1} ya es 1"
+    if step[0] == "elim":
+        _, i, k = step
+        if i == k:
+            return True, None
+        f = A[i][k]
+        if f != 0:
+            for j in range(n):
+                A[i][j] -= f * A[k][j]
+                I[i][j] -= f * I[k][j]
+            return True, f"R{i+1} := R{i+1} - ({f})*R{k+1}"
+        return True, f"Columna {k+1}: R{i+1} ya tiene 0"
+    return True, None
+
+
+def fotogramas_inversa(A):
+    """Recorre pasos_inversa una sola vez sobre [A | I] y devuelve (ok, fotogramas).
+
+    Cada fotograma es (texto, cambios) con cambios = [(i, j, antes, despues)]
+    para las celdas de [A | I] (j >= n es la columna j - n de I) que cambia
+    ese paso. Con antes y despues se puede avanzar y retroceder a cualquier
+    paso tocando solo esas celdas. ok es False si A es singular (los
+    fotogramas llegan hasta el paso que falla).
+    """
+    n = len(A)
+    A = [[Fraction(x) for x in fila] for fila in A]
+    I = identidad(n)
+    fotogramas = []
+    for step in pasos_inversa(n):
+        # filas que puede tocar el paso: el intercambio elige entre k..n-1
+        filas = range(step[1], n) if step[0] == "pivot" else (step[1],)
+        antes = {i: A[i] + I[i] for i in filas}
+        ok, texto = aplicar_paso_inversa(A, I, step)
+        if not ok:
+            return False, fotogramas
+        cambios = []
+        for i, fila_antes in antes.items():
+            fila = A[i] + I[i]
+            cambios.extend((i, j, x, y) for j, (x, y) in enumerate(zip(fila_antes, fila)) if x != y)
+        fotogramas.append((texto or "", cambios))
+    return True, fotogramas
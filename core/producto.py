@@ -0,0 +1,152 @@
+from fractions import Fraction
+
+from .racional import MatrizRacional
+from .transpuesta import Transpuesta
+
+
+def multiplicar_con_detalle(A, B, trace=True, progreso=None):
+    """C = A x B junto con la línea c_ij = a_i1*b_1j + ... de cada elemento.
+
+    Con trace=False solo se calcula C, con enteros sobre MatrizRacional (la
+    lista de pasos queda vacía). A o B pueden ser vistas Transpuesta.
+    progreso(hecho, total), si se indica, se llama tras cada fila de C.
+    """
+    fa, ca = len(A), len(A[0])
+    fb, cb = len(B), len(B[0])
+    if ca != fb:
+        raise ValueError("Las columnas de A deben coincidir con las filas de B.")
+    if not trace:
+        return _producto_racional(A, B, progreso).a_fracciones(), []
+    R = [[Fraction(0) for _ in range(cb)] for _ in range(fa)]
+    pasos = []
+    for i in range(fa):
+        for j in range(cb):
+            terms = []
+            s = Fraction(0)
+            for k in range(ca):
+                a = A[i][k]; b = B[k][j]
+                terms.append(f"{a}*{b}")
+                s += a * b
+            R[i][j] = s
+            pasos.append(f"c{i+1}{j+1} = " + " + ".join(terms) + f" = {s}")
+        if progreso is not None:
+            progreso(i + 1, fa)
+    return R, pasos
+
+
+def _producto_racional(A, B, progreso=None) -> MatrizRacional:
+    """A x B con MatrizRacional. Con vistas Transpuesta se usan las filas de la
+    matriz original: X^T X como matriz de Gram y A X^T fila por fila."""
+    if isinstance(A, Transpuesta) and not isinstance(B, Transpuesta) and A.original is B:
+        return MatrizRacional.desde_fracciones(B).gram(progreso)
+    if isinstance(B, Transpuesta):
+        return MatrizRacional.desde_fracciones(A).por_traspuesta(MatrizRacional.desde_fracciones(B.original), progreso)
+    return MatrizRacional.desde_fracciones(A).por(MatrizRacional.desde_fracciones(B), progreso)
+
+
+def aplicar_escalar(M, k, trace=True):
+    if not trace:
+        return [[x * k for x in fila] for fila in M], []
+    filas = len(M); cols = len(M[0]) if filas else 0
+    R = [[Fraction(0) for _ in range(cols)] for _ in range(filas)]
+    pasos = []
+    for i in range(filas):
+        for j in range(cols):
+            R[i][j] = M[i][j] * k
+            pasos.append(f"c{i+1}{j+1} = {k}*{M[i][j]} = {R[i][j]}")
+    return R, pasos
+
+
+def sumar_matrices(A, B, trace=True):
+    fa, ca = len(A), len(A[0])
+    fb, cb = len(B), len(B[0])
+    if fa != fb or ca != cb:
+        raise ValueError("Para sumar, las matrices deben tener las mismas dimensiones.")
+    if not trace:
+        return [[a + b for a, b in zip(fila_a, fila_b)] for fila_a, fila_b in zip(A, B)], []
+    R = [[Fraction(0) for _ in range(ca)] for _ in range(fa)]
+    pasos = []
+    for i in range(fa):
+        for j in range(ca):
+            R[i][j] = A[i][j] + B[i][j]
+            pasos.append(f"c{i+1}{j+1} = {A[i][j]} + {B[i][j]} = {R[i][j]}")
+    return R, pasos
+
+
+def restar_matrices(A, B, trace=True):
+    fa, ca = len(A), len(A[0])
+    fb, cb = len(B), len(B[0])
+    if fa != fb or ca != cb:
+        raise ValueError("Para restar, las matrices deben tener las mismas dimensiones.")
+    if not trace:
+        return [[a - b for a, b in zip(fila_a, fila_b)] for fila_a, fila_b in zip(A, B)], []
+    R = [[Fraction(0) for _ in range(ca)] for _ in range(fa)]
+    pasos = []
+    for i in range(fa):
+        for j in range(ca):
+            R[i][j] = A[i][j] - B[i][j]
+            pasos.append(f"c{i+1}{j+1} = {A[i][j]} - {B[i][j]} = {R[i][j]}")
+    return R, pasos
+
+
+def orden_cadena(dims):
+    """Parentización óptima de A1·A2·...·An por programación dinámica.
+
+    dims es la lista de (filas, columnas) de cada matriz, ya compatibles.
+    Devuelve (costo, corte): costo es el mínimo de multiplicaciones escalares
+    y corte[i][j] el k en que se parte Ai..Aj = (Ai..Ak)(Ak+1..Aj).
+    """
+    n = len(dims)
+    p = [dims[0][0]] + [c for _, c in dims] if n else []
+    costo = [[0] * n for _ in range(n)]
+    corte = [[0] * n for _ in range(n)]
+    for largo in range(2, n + 1):
+        for i in range(n - largo + 1):
+            j = i + largo - 1
+            mejor = None
+            for k in range(i, j):
+                c = costo[i][k] + costo[k + 1][j] + p[i] * p[k + 1] * p[j + 1]
+                if mejor is None or c < mejor:
+                    mejor = c
+                    corte[i][j] = k
+            costo[i][j] = mejor
+    return (costo[0][n - 1] if n else 0), corte
+
+
+def costo_secuencial(dims):
+    """Multiplicaciones escalares de la cadena de izquierda a derecha."""
+    total = 0
+    filas = dims[0][0] if dims else 0
+    for (f, c), (_, c2) in zip(dims, dims[1:]):
+        total += filas * c * c2
+    return total
+
+
+def multiplicar_cadena(mats, trace=True, nombres=None):
+    """Multiplica M1·M2·...·Mn en el orden de orden_cadena.
+
+    Devuelve (R, pasos, orden, costo, costo_secuencial): orden es la
+    parentización elegida como texto (p. ej. "(M1·M2)·M3") y pasos incluye
+    las líneas c_ij de cada producto, en el orden en que se calculan.
+    """
+    dims = [(len(M), len(M[0])) for M in mats]
+    nombres = nombres or [f"M{i+1}" for i in range(len(mats))]
+    costo, corte = orden_cadena(dims)
+    pasos = []
+
+    def calcular(i, j):
+        if i == j:
+            return mats[i], nombres[i]
+        k = corte[i][j]
+        izq, txt_izq = calcular(i, k)
+        der, txt_der = calcular(k + 1, j)
+        pasos.append("")
+        pasos.append(f"Producto {txt_izq} x {txt_der} ({len(izq)}x{len(izq[0])} por {len(der)}x{len(der[0])}): cálculo de c_ij")
+        R, p = multiplicar_con_detalle(izq, der, trace)
+        pasos.extend(p)
+        return R, f"({txt_izq}·{txt_der})"
+
+    R, orden = calcular(0, len(mats) - 1)
+    if orden.startswith("("):
+        orden = orden[1:-1]
+    return R, pasos, orden, costo, costo_secuencial(dims)
@@ -0,0 +1,257 @@
+"""Matriz racional con filas enteras y un denominador común por fila.
+
+Con Fraction cada suma o producto calcula un mcd y crea un objeto nuevo. Aquí
+la fila i vale filas[i] / dens[i] (enteros de Python), así que una operación
+de fila son solo productos y restas de enteros; el mcd de la fila se saca de
+vez en cuando (cuando el denominador pasa de UMBRAL_BITS) y al convertir de
+vuelta a Fraction. Los motores la usan en sus caminos sin pasos (trace=False).
+Los enteros son los del backend de core.aritmetica (int o mpz de gmpy2).
+"""
+
+from fractions import Fraction
+from operator import mul
+from typing import List, Optional
+
+from . import aritmetica
+
+# Bits del denominador de una fila a partir de los cuales se reduce la fila
+UMBRAL_BITS = 64
+
+# Producto de enteros: Strassen-Winograd mientras las tres dimensiones pasen de
+# UMBRAL_STRASSEN y las entradas tengan al menos BITS_STRASSEN bits (con enteros
+# pequeños las sumas extra cuestan más de lo que ahorra). Se ajustan con
+# benchmark_producto.py; UMBRAL_STRASSEN = None lo desactiva.
+UMBRAL_STRASSEN = 64
+BITS_STRASSEN = 1024
+
+
+def _producto_directo(A, B):
+    columnas = list(zip(*B))
+    return [[sum(map(mul, fila, col)) for col in columnas] for fila in A]
+
+
+def _suma(X, Y):
+    return [[a + b for a, b in zip(x, y)] for x, y in zip(X, Y)]
+
+
+def _resta(X, Y):
+    return [[a - b for a, b in zip(x, y)] for x, y in zip(X, Y)]
+
+
+def _strassen(A, B, umbral):
+    """Strassen-Winograd (7 productos y 15 sumas por nivel) con relleno de ceros."""
+    m, k, n = len(A), len(B), len(B[0])
+    if min(m, k, n) <= umbral:
+        return _producto_directo(A, B)
+    m2, k2, n2 = m + m % 2, k + k % 2, n + n % 2
+    if k2 != k:
+        A = [fila + [0] for fila in A]
+        B = B + [[0] * n]
+    if m2 != m:
+        A = A + [[0] * k2]
+    if n2 != n:
+        B = [fila + [0] for fila in B]
+    h, kh, nh = m2 // 2, k2 // 2, n2 // 2
+    A11 = [f[:kh] for f in A[:h]]; A12 = [f[kh:] for f in A[:h]]
+    A21 = [f[:kh] for f in A[h:]]; A22 = [f[kh:] for f in A[h:]]
+    B11 = [f[:nh] for f in B[:kh]]; B12 = [f[nh:] for f in B[:kh]]
+    B21 = [f[:nh] for f in B[kh:]]; B22 = [f[nh:] for f in B[kh:]]
+    S1 = _suma(A21, A22); S2 = _resta(S1, A11); S3 = _resta(A11, A21); S4 = _resta(A12, S2)
+    T1 = _resta(B12, B11); T2 = _resta(B22, T1); T3 = _resta(B22, B12); T4 = _resta(T2, B21)
+    P1 = _strassen(A11, B11, umbral)
+    P2 = _strassen(A12, B21, umbral)
+    P3 = _strassen(S4, B22, umbral)
+    P4 = _strassen(A22, T4, umbral)
+    P5 = _strassen(S1, T1, umbral)
+    P6 = _strassen(S2, T2, umbral)
+    P7 = _strassen(S3, T3, umbral)
+    U2 = _suma(P1, P6); U3 = _suma(U2, P7)
+    C11 = _suma(P1, P2); C12 = _suma(_suma(U2, P5), P3)
+    C21 = _resta(U3, P4); C22 = _suma(U3, P5)
+    C = [a + b for a, b in zip(C11, C12)] + [a + b for a, b in zip(C21, C22)]
+    return [fila[:n] for fila in C[:m]]
+
+
+def producto_enteros(A, B, umbral=None):
+    """A x B para matrices de enteros (columnas de B traspuestas una vez).
+
+    umbral: orden a partir del cual se usa Strassen-Winograd; por defecto
+    UMBRAL_STRASSEN, y solo si las entradas tienen >= BITS_STRASSEN bits.
+    """
+    if not A or not B or not B[0]:
+        return [[] for _ in A]
+    if umbral is None:
+        umbral = UMBRAL_STRASSEN
+        if umbral is not None:
+            bits = max(max((abs(x).bit_length() for x in fila), default=0) for fila in A + B)
+            if bits < BITS_STRASSEN:
+                umbral = None
+    if umbral is None or min(len(A), len(B), len(B[0])) <= umbral:
+        return _producto_directo(A, B)
+    return _strassen(A, B, umbral)
+
+
+class MatrizRacional:
+    __slots__ = ("filas", "dens", "columnas")
+
+    def __init__(self, filas: List[List[int]], dens: List[int], columnas: Optional[int] = None):
+        self.filas = filas
+        self.dens = dens
+        self.columnas = len(filas[0]) if columnas is None and filas else (columnas or 0)
+
+    @classmethod
+    def desde_fracciones(cls, M) -> "MatrizRacional":
+        entero, mcm = aritmetica.entero, aritmetica.mcm
+        filas = []
+        dens = []
+        for fila in M:
+            fila = [Fraction(x) for x in fila]
+            d = entero(mcm(*(x.denominator for x in fila)) if fila else 1)
+            if entero is int:
+                filas.append([x.numerator * (d // x.denominator) for x in fila])
+            else:
+                filas.append([entero(x.numerator) * (d // x.denominator) for x in fila])
+            dens.append(d)
+        return cls(filas, dens, len(M[0]) if M else 0)
+
+    def a_fracciones(self) -> List[List[Fraction]]:
+        if all(type(d) is int for d in self.dens):
+            return [[Fraction(x, d) for x in fila] for fila, d in zip(self.filas, self.dens)]
+        a_fraccion = aritmetica.a_fraccion
+        return [[a_fraccion(x, d) for x in fila] for fila, d in zip(self.filas, self.dens)]
+
+    def __len__(self):
+        return len(self.filas)
+
+    def valor(self, i: int, j: int) -> Fraction:
+        return aritmetica.a_fraccion(self.filas[i][j], self.dens[i])
+
+    def intercambiar(self, i: int, j: int) -> None:
+        self.filas[i], self.filas[j] = self.filas[j], self.filas[i]
+        self.dens[i], self.dens[j] = self.dens[j], self.dens[i]
+
+    def pivote_a_uno(self, i: int, col: int) -> None:
+        """F_i -> F_i / a_i,col: basta con cambiar el denominador."""
+        p = self.filas[i][col]
+        if p < 0:
+            self.filas[i] = [-x for x in self.filas[i]]
+            p = -p
+        self.dens[i] = p
+
+    def anular(self, i: int, k: int, col: int) -> None:
+        """F_i -> F_i - (a_i,col / a_k,col) F_k, que deja a_i,col = 0."""
+        fila_i = self.filas[i]
+        fila_k = self.filas[k]
+        p = fila_k[col]
+        f = fila_i[col]
+        self.filas[i] = [p * a - f * b for a, b in zip(fila_i, fila_k)]
+        self.dens[i] *= p
+        if self.dens[i].bit_length() > UMBRAL_BITS:
+            self.reducir(i)
+
+    def reducir(self, i: int) -> None:
+        """Divide la fila i y su denominador por su mcd."""
+        g = aritmetica.mcd(self.dens[i], *self.filas[i])
+        if g > 1:
+            self.filas[i] = [x // g for x in self.filas[i]]
+            self.dens[i] //= g
+
+    def rref(self, columnas: Optional[int] = None, progreso=None) -> List[int]:
+        """Gauss-Jordan en sitio sobre las primeras columnas (primer pivote no
+        nulo de cada columna, como los motores con pasos). Devuelve las
+        columnas pivote; progreso(hecho, total) se llama tras cada columna."""
+        n = len(self.filas)
+        total = self.columnas if columnas is None else columnas
+        pivotes = []
+        fila_pivote = 0
+        for col in range(total):
+            if fila_pivote >= n:
+                break
+            piv = next((r for r in range(fila_pivote, n) if self.filas[r][col] != 0), None)
+            if piv is None:
+                continue
+            if piv != fila_pivote:
+                self.intercambiar(fila_pivote, piv)
+            for r in range(n):
+                if r != fila_pivote and self.filas[r][col] != 0:
+                    self.anular(r, fila_pivote, col)
+            self.pivote_a_uno(fila_pivote, col)
+            self.reducir(fila_pivote)
+            pivotes.append(col)
+            fila_pivote += 1
+            if progreso is not None:
+                progreso(col + 1, total)
+        return pivotes
+
+    def _denominador_comun(self):
+        """(filas llevadas al mcm D de los denominadores, D)."""
+        D = aritmetica.mcm(*self.dens) if self.dens else 1
+        filas = [[x * (D // d) for x in fila] if d != D else fila for fila, d in zip(self.filas, self.dens)]
+        return filas, D
+
+    def por(self, otra: "MatrizRacional", progreso=None) -> "MatrizRacional":
+        """Producto self x otra (las columnas de otra pasan a un denominador común).
+
+        progreso(hecho, total), si se indica, se llama tras cada fila.
+        """
+        if self.columnas != len(otra.filas):
+            raise ValueError("Las columnas de A deben coincidir con las filas de B.")
+        filas_b, D = otra._denominador_comun()
+        total = len(self.filas)
+        R = MatrizRacional([], [], otra.columnas)
+        grande = UMBRAL_STRASSEN is not None and min(total, self.columnas, otra.columnas) > UMBRAL_STRASSEN
+        if grande:
+            # de una vez (producto_enteros decide si compensa Strassen)
+            R.filas = producto_enteros(self.filas, filas_b)
+            R.dens = [d * D for d in self.dens]
+            for i in range(total):
+                R.reducir(i)
+            if progreso is not None:
+                progreso(total, total)
+            return R
+        columnas = list(zip(*filas_b))
+        for i, (fila, d) in enumerate(zip(self.filas, self.dens)):
+            R.filas.append([sum(map(mul, fila, col)) for col in columnas])
+            R.dens.append(d * D)
+            R.reducir(i)
+            if progreso is not None:
+                progreso(i + 1, total)
+        return R
+
+    def por_traspuesta(self, otra: "MatrizRacional", progreso=None) -> "MatrizRacional":
+        """Producto self x otra^T: cada elemento es el producto de una fila de
+        self por una fila de otra, sin trasponer otra."""
+        if self.columnas != otra.columnas:
+            raise ValueError("Las columnas de A deben coincidir con las filas de B.")
+        filas_b, D = otra._denominador_comun()
+        total = len(self.filas)
+        R = MatrizRacional([], [], len(otra.filas))
+        for i, (fila, d) in enumerate(zip(self.filas, self.dens)):
+            R.filas.append([sum(map(mul, fila, g)) for g in filas_b])
+            R.dens.append(d * D)
+            R.reducir(i)
+            if progreso is not None:
+                progreso(i + 1, total)
+        return R
+
+    def gram(self, progreso=None) -> "MatrizRacional":
+        """self^T x self como suma de los productos exteriores de las filas
+        (solo el triángulo superior; es simétrica)."""
+        filas, D = self._denominador_comun()
+        n = self.columnas
+        G = [[0] * n for _ in range(n)]
+        for fila in filas:
+            for i, a in enumerate(fila):
+                if a:
+                    Gi = G[i]
+                    for j in range(i, n):
+                        Gi[j] += a * fila[j]
+        for i in range(n):
+            for j in range(i):
+                G[i][j] = G[j][i]
+            if progreso is not None:
+                progreso(i + 1, n)
+        R = MatrizRacional(G, [D * D] * n, n)
+        for i in range(n):
+            R.reducir(i)
+        return R
@@ -0,0 +1,103 @@
+"""Registro compacto de operaciones elementales de fila.
+
+En vez de guardar una copia de la matriz tras cada paso, se guarda la matriz
+inicial y una tupla por operación (la última entrada es la columna en la que
+se trabajaba, solo para los textos):
+
+    ("intercambio", i, j, col)      F_i <-> F_j
+    ("escala", i, d, col)           F_i -> F_i / d
+    ("combinacion", i, k, f, col)   F_i -> F_i - f * F_k
+
+Cualquier estado intermedio se reconstruye reaplicando las operaciones desde el
+punto de control más cercano (se guarda uno cada INTERVALO_CONTROL pasos), así
+que mostrar el paso k cuesta a lo sumo INTERVALO_CONTROL operaciones de fila.
+"""
+
+INTERVALO_CONTROL = 16
+
+
+def aplicar_operacion(M, op):
+    """Aplica op sobre M en sitio.
+
+    Las filas modificadas se sustituyen por listas nuevas (nunca se mutan), de
+    modo que una copia superficial de M conserva el estado anterior.
+    """
+    tipo = op[0]
+    if tipo == "intercambio":
+        i, j = op[1], op[2]
+        M[i], M[j] = M[j], M[i]
+    elif tipo == "escala":
+        i, d = op[1], op[2]
+        M[i] = [x / d for x in M[i]]
+    elif tipo == "combinacion":
+        i, k, f = op[1], op[2], op[3]
+        M[i] = [a - f * b for a, b in zip(M[i], M[k])]
+    else:
+        raise ValueError(f"Operación de fila desconocida: {tipo}")
+
+
+class RegistroOperaciones:
+    """Lista de operaciones de fila sobre una matriz inicial.
+
+    Se comporta como una secuencia de pasos: len(), iteración e índice
+    devuelven formatear(op, antes, despues) para cada operación, calculado en
+    el momento. Sin formatear se devuelve la tupla (op, despues).
+    """
+
+    def __init__(self, matriz, formatear=None, intervalo=INTERVALO_CONTROL):
+        self.inicial = [fila[:] for fila in matriz]
+        self.operaciones = []
+        self.formatear = formatear
+        self.intervalo = max(1, int(intervalo))
+        self._controles = [self.inicial]
+
+    def registrar(self, op, M):
+        """Anota op, que ya se aplicó sobre M (el estado actual del motor)."""
+        self.operaciones.append(op)
+        if len(self.operaciones) % self.intervalo == 0:
+            self._controles.append([fila[:] for fila in M])
+
+    def matriz_en(self, k):
+        """Matriz tras las primeras k operaciones (0 = matriz inicial)."""
+        k = max(0, min(k, len(self.operaciones)))
+        base = k // self.intervalo
+        M = self._controles[base][:]
+        for op in self.operaciones[base * self.intervalo:k]:
+            aplicar_operacion(M, op)
+        return M
+
+    def matriz_final(self):
+        return self.matriz_en(len(self.operaciones))
+
+    def pasos(self, inicio=0, fin=None):
+        """Genera los pasos inicio..fin-1 reaplicando desde el control previo."""
+        total = len(self.operaciones)
+        fin = total if fin is None else min(fin, total)
+        if inicio >= fin:
+            return
+        M = self.matriz_en(inicio)
+        for op in self.operaciones[inicio:fin]:
+            antes = M[:]
+            aplicar_operacion(M, op)
+            if self.formatear is None:
+                yield op, M[:]
+            else:
+                yield self.formatear(op, antes, M)
+
+    def __len__(self):
+        return len(self.operaciones)
+
+    def __iter__(self):
+        return self.pasos()
+
+    def __getitem__(self, k):
+        if isinstance(k, slice):
+            inicio, fin, salto = k.indices(len(self))
+            if salto == 1:
+                return list(self.pasos(inicio, fin))
+            return [self[i] for i in range(inicio, fin, salto)]
+        if k < 0:
+            k += len(self)
+        if not 0 <= k < len(self):
+            raise IndexError("paso fuera de rango")
+        return next(self.pasos(k, k + 1))
@@ -0,0 +1,284 @@
+from fractions import Fraction
+
+from .factorizaciones import factorizar
+
+
+def fmt(x: Fraction) -> str:
+    return f"{x.numerator}" if x.denominator == 1 else f"{x.numerator}/{x.denominator}"
+
+
+def parse_fraction(s: str) -> Fraction:
+    s = (s or "").strip().replace(",", ".")
+    if s == "":
+        return Fraction(0)
+    return Fraction(s)
+
+
+def matmul(A, x):
+    m = len(A)
+    n = len(A[0]) if m else 0
+    if len(x) != n:
+        raise ValueError("Dimensiones incompatibles entre A y x")
+    return [sum(A[i][j] * x[j] for j in range(n)) for i in range(m)]
+
+
+def format_symbolic_explicit(A):
+    m = len(A)
+    n = len(A[0]) if m else 0
+    xnames = [f"x{j+1}" for j in range(n)]
+    lines = []
+    lines.append("")
+    lines.append("Representación como combinación lineal de las columnas:")
+    lines += format_linear_combination(A)
+    lines.append("")
+    lines.append("Forma explícita (por componentes):")
+    fila_expr = []
+    for i in range(m):
+        terms = []
+        for j in range(n):
+            a = fmt(A[i][j])
+            xj = xnames[j]
+            if a == "0":
+                continue
+            if a == "1":
+                terms.append(xj)
+            elif a == "-1":
+                terms.append(f"- {xj}")
+            else:
+                if a.startswith("-"):
+                    terms.append(f"- {a[1:]}{xj}")
+                else:
+                    terms.append(f"{a}{xj}")
+        if not terms:
+            fila_expr.append("0")
+        else:
+            expr = terms[0]
+            for t in terms[1:]:
+                expr = expr + (" + " + t if not t.strip().startswith("-") else " - " + t.strip()[2:])
+            fila_expr.append(expr)
+    lines.append("T([" + ", ".join(xnames) + "]^T) = [")
+    for expr in fila_expr:
+        lines.append("  " + expr)
+    lines.append("]^T")
+    return lines
+
+
+def format_linear_combination(A):
+    m = len(A)
+    n = len(A[0]) if m else 0
+    xnames = [f"x{j+1}" for j in range(n)]
+    col_w = [0]*n
+    for j in range(n):
+        col_w[j] = max(len(fmt(A[i][j])) for i in range(m)) if m else 1
+    xw = [len(s) for s in xnames]
+
+    # expresiones por fila del resultado
+    fila_expr = []
+    for i in range(m):
+        terms = []
+        for j in range(n):
+            a = fmt(A[i][j])
+            if a == "0":
+                continue
+            if a == "1":
+                terms.append(f"x{j+1}")
+            elif a == "-1":
+                terms.append(f"-x{j+1}")
+            else:
+                terms.append(f"{a}x{j+1}")
+        if not terms:
+            fila_expr.append("0")
+        else:
+            expr = terms[0]
+            for t in terms[1:]:
+                expr += (" + " + t) if not t.startswith("-") else (" - " + t[1:])
+            fila_expr.append(expr)
+
+    # Construir bloques por filas con ancho fijo y alinear la columna del resultado
+    left_parts = []
+    for i in range(m):
+        pieces = []
+        for j in range(n):
+            scalar = xnames[j] if i == 0 else (" " * xw[j])
+            val = fmt(A[i][j]).rjust(col_w[j])
+            pieces.append(f"{scalar} [ {val} ]")
+        left_parts.append("  +  ".join(pieces))
+
+    max_left = max(len(s) for s in left_parts) if left_parts else 0
+    lines = []
+    for i in range(m):
+        left = left_parts[i].ljust(max_left)
+        if i == 0:
+            lines.append(f"= {left} = [ {fila_expr[i]} ]")
+        else:
+            lines.append(f"  {left}   [ {fila_expr[i]} ]")
+    return lines
+
+
+def format_product(A, x, b=None):
+    """Devuelve líneas de texto que muestran [A][x] = [b] con corchetes.
+    x es vector columna. Soporta m != n.
+    """
+    m = len(A)
+    n = len(A[0]) if m else 0
+    # anchuras por columna de A
+    col_w = [0]*n
+    for j in range(n):
+        col_w[j] = max(len(fmt(A[i][j])) for i in range(m)) if m else 1
+    x_w = max((len(fmt(x[j])) for j in range(n)), default=1)
+    b_w = max((len(fmt(b[i])) for i in range(m)), default=1) if b is not None else 1
+
+    lines = []
+    rows = max(m, n)
+    for i in range(rows):
+        # bloque A
+        if i < m:
+            a_row = " ".join(fmt(A[i][j]).rjust(col_w[j]) for j in range(n))
+            left = "[ " + a_row + " ]"
+        else:
+            left = "  " + " "*(sum(col_w)+ (n-1)) + "  "
+        # bloque x
+        if i < n:
+            x_txt = fmt(x[i]).rjust(x_w)
+            mid = "[ " + x_txt + " ]"
+        else:
+            mid = "  " + " "*(x_w+2)
+        # bloque b
+        if b is not None and i < m:
+            b_txt = fmt(b[i]).rjust(b_w)
+            right = "[ " + b_txt + " ]"
+        else:
+            right = ""
+        eq = " = " if (b is not None and i == 0) else ("   " if b is not None else "")
+        times = "   " if i else "   "  # separación simple
+        if i == 0 and b is not None:
+            lines.append(f"{left}{times}{mid}{eq}{right}")
+        else:
+            lines.append(f"{left}{times}{mid}{('   '+right) if right else ''}")
+    return lines
+
+
+def format_vector_column(vec):
+    vals = [fmt(v) for v in vec]
+    w = max((len(s) for s in vals), default=1)
+    return "\n".join("[ " + s.rjust(w) + " ]" for s in vals)
+
+
+def format_matrix(A):
+    if not A:
+        return "[ ]"
+    m = len(A); n = len(A[0])
+    col_w = [0]*n
+    for j in range(n):
+        col_w[j] = max(len(fmt(A[i][j])) for i in range(m))
+    lines = []
+    for i in range(m):
+        row = " ".join(fmt(A[i][j]).rjust(col_w[j]) for j in range(n))
+        lines.append("[ " + row + " ]")
+    return "\n".join(lines)
+
+
+def dot_steps(A, x, b):
+    m = len(A); n = len(A[0]) if A else 0
+    steps = ["", "  Detalle por filas (producto punto):"]
+    for i in range(m):
+        mults = [f"({fmt(A[i][j])})*({fmt(x[j])})" for j in range(n)]
+        prods = [A[i][j]*x[j] for j in range(n)]
+        sums = " + ".join(fmt(p) for p in prods)
+        steps.append(f"  Fila {i+1}: " + " + ".join(mults) + f" = {sums} = {fmt(b[i])}")
+    return steps
+
+
+def format_scaled_sum(c, Tu, d, Tv, result):
+    sc = fmt(c); sd = fmt(d)
+    m = len(Tu)
+    wt = max((len(fmt(x)) for x in Tu), default=1)
+    wv = max((len(fmt(x)) for x in Tv), default=1)
+    wr = max((len(fmt(x)) for x in result), default=1)
+    ws1 = len(sc); ws2 = len(sd)
+    lines = []
+    for i in range(m):
+        coef1 = sc if i == 0 else " "*ws1
+        coef2 = sd if i == 0 else " "*ws2
+        t = fmt(Tu[i]).rjust(wt)
+        v = fmt(Tv[i]).rjust(wv)
+        r = fmt(result[i]).rjust(wr)
+        if i == 0:
+            lines.append(f"= {coef1} [ {t} ]  +  {coef2} [ {v} ] = [ {r} ]")
+        else:
+            lines.append(f"  {coef1} [ {t} ]     {coef2} [ {v} ]   [ {r} ]")
+    return lines
+
+
+def format_aug(M):
+    """Matriz aumentada [A | b] (m x (n+1)) con columnas alineadas."""
+    m = len(M); n = len(M[0])-1 if m else 0
+    col_w = [0]*n
+    for j in range(n):
+        col_w[j] = max(len(fmt(M[i][j])) for i in range(m)) if m else 1
+    bw = max((len(fmt(M[i][-1])) for i in range(m)), default=1)
+    lines = []
+    for i in range(m):
+        left = " ".join(fmt(M[i][j]).rjust(col_w[j]) for j in range(n))
+        right = fmt(M[i][-1]).rjust(bw)
+        lines.append("[ " + left + "  |  " + right + " ]")
+    return "\n".join(lines)
+
+
+def resolver_axb(A, b, trace=True, progreso=None):
+    """Reduce [A | b] a RREF registrando cada operación.
+
+    Devuelve (M, piv_cols, pasos, tipo, x) con tipo "inconsistente", "unica"
+    o "infinitas"; x solo se calcula cuando la solución es única. Con
+    trace=False no se formatea ningún paso y la reducción de A sale de la
+    caché de factorizaciones (una A repetida solo cuesta E·b).
+    progreso(hecho, total), si se indica, se llama tras cada columna.
+    """
+    m = len(A); n = len(A[0]) if m else 0
+    M = [row[:] + [b[i]] for i, row in enumerate(A)]
+    pasos = ["Matriz aumentada [A | b]:\n" + format_aug(M) + "\n"] if trace else []
+    if not trace and m and n:
+        f = factorizar(A, progreso)
+        columna = f.transformar(b)
+        M = [fila + [x] for fila, x in zip(f.rref(), columna)]
+        return _clasificar_axb(M, list(f.pivotes), pasos, m, n)
+    r = 0; piv_cols = []
+    for c in range(n):
+        p = None
+        for i in range(r, m):
+            if M[i][c] != 0:
+                p = i; break
+        if p is None:
+            continue
+        if p != r:
+            M[r], M[p] = M[p], M[r]
+            if trace:
+                pasos.append(f"Intercambio F{r+1} ↔ F{p+1}\n" + format_aug(M) + "\n")
+        piv = M[r][c]
+        if piv != 1:
+            M[r] = [x / piv for x in M[r]]
+            if trace:
+                pasos.append(f"F{r+1} ← F{r+1} / {fmt(piv)}\n" + format_aug(M) + "\n")
+        for i in range(m):
+            if i != r and M[i][c] != 0:
+                fac = M[i][c]
+                M[i] = [M[i][k] - fac*M[r][k] for k in range(n+1)]
+                if trace:
+                    pasos.append(f"F{i+1} ← F{i+1} - ({fmt(fac)})·F{r+1}\n" + format_aug(M) + "\n")
+        piv_cols.append(c); r += 1
+        if progreso is not None:
+            progreso(c + 1, n)
+        if r == m: break
+    return _clasificar_axb(M, piv_cols, pasos, m, n)
+
+
+def _clasificar_axb(M, piv_cols, pasos, m, n):
+    for i in range(m):
+        if all(M[i][j] == 0 for j in range(n)) and M[i][-1] != 0:
+            return M, piv_cols, pasos, "inconsistente", None
+    if len(piv_cols) == n:
+        x = [Fraction(0)]*n
+        for i, c in enumerate(piv_cols):
+            x[c] = M[i][-1]
+        return M, piv_cols, pasos, "unica", x
+    return M, piv_cols, pasos, "infinitas", None
@@ -0,0 +1,75 @@
+"""Traspuesta como vista: A^T sin copiar los valores de A."""
+
+from collections.abc import Sequence
+
+
+class _Columna(Sequence):
+    """Columna j de A vista como fila de A^T."""
+
+    __slots__ = ("_filas", "_j")
+
+    def __init__(self, filas, j: int):
+        self._filas = filas
+        self._j = j
+
+    def __len__(self):
+        return len(self._filas)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [fila[self._j] for fila in self._filas[i]]
+        return self._filas[i][self._j]
+
+    def __iter__(self):
+        j = self._j
+        return (fila[j] for fila in self._filas)
+
+    def __eq__(self, otra):
+        return isinstance(otra, Sequence) and list(self) == list(otra)
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class Transpuesta(Sequence):
+    """A^T sobre la misma lista de filas de A: T[i][j] es A[j][i].
+
+    Crearla es O(1) y sigue los cambios de A. Las filas de T son vistas de
+    las columnas de A; transpuesta(T) devuelve A tal cual, y los productos de
+    core.producto reconocen T para trabajar con las filas de A (A^T A como
+    matriz de Gram, X B^T fila por fila) sin trasponer nada.
+    """
+
+    __slots__ = ("original",)
+
+    def __init__(self, original):
+        self.original = original
+
+    def __len__(self):
+        return len(self.original[0]) if self.original else 0
+
+    def __getitem__(self, j):
+        if isinstance(j, slice):
+            return [_Columna(self.original, k) for k in range(len(self))[j]]
+        if j < 0:
+            j += len(self)
+        if not 0 <= j < len(self):
+            raise IndexError("fila fuera de la traspuesta")
+        return _Columna(self.original, j)
+
+    def a_lista(self):
+        """Copia de A^T como lista de listas."""
+        return [list(col) for col in zip(*self.original)]
+
+    def __eq__(self, otra):
+        return isinstance(otra, Sequence) and len(self) == len(otra) and all(a == b for a, b in zip(self, otra))
+
+    def __repr__(self):
+        return f"Transpuesta({self.original!r})"
+
+
+def transpuesta(A):
+    """A^T como vista (la traspuesta de una vista es su matriz original)."""
+    if isinstance(A, Transpuesta):
+        return A.original
+    return Transpuesta(A)
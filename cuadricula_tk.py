@@ -0,0 +1,80 @@
+"""Cuadrícula de entradas Tk que se redimensiona reutilizando sus widgets."""
+
+
+class CuadriculaEntradas:
+    """Entradas Tk colocadas con grid() que crecen o encogen sin recrear las
+    que siguen (conservan su texto y sus bind).
+
+    crear_entrada(padre) devuelve una entrada nueva. Con crear_encabezado(padre,
+    texto) la fila 0 lleva x1..xn; con con_b la última columna es la de
+    términos independientes (encabezado "b"), que se desplaza al cambiar el
+    número de incógnitas. opciones_grid se pasan a cada grid().
+    """
+
+    def __init__(self, padre, crear_entrada, crear_encabezado=None, con_b=False, **opciones_grid):
+        self.padre = padre
+        self.crear_entrada = crear_entrada
+        self.crear_encabezado = crear_encabezado
+        self.con_b = con_b
+        self.opciones_grid = opciones_grid
+        self._fila0 = 1 if crear_encabezado is not None else 0
+        self._encabezados = []
+        self._encabezado_b = None
+        self._a = []
+        self._b = []
+
+    @property
+    def entradas(self):
+        """Filas de entradas (con b al final si con_b)."""
+        if self.con_b:
+            return [fila + [b] for fila, b in zip(self._a, self._b)]
+        return [list(fila) for fila in self._a]
+
+    def _colocar(self, w, fila, columna):
+        w.grid(row=fila, column=columna, **self.opciones_grid)
+        return w
+
+    def _entrada(self, fila, columna):
+        return self._colocar(self.crear_entrada(self.padre), fila + self._fila0, columna)
+
+    def redimensionar(self, filas: int, columnas: int) -> None:
+        """Deja filas x columnas entradas (más la columna b si con_b)."""
+        actuales = len(self._a[0]) if self._a else len(self._encabezados)
+        movida = columnas != actuales
+        if self.crear_encabezado is not None:
+            while len(self._encabezados) > columnas:
+                self._encabezados.pop().destroy()
+            while len(self._encabezados) < columnas:
+                j = len(self._encabezados)
+                self._encabezados.append(self._colocar(self.crear_encabezado(self.padre, f"x{j + 1}"), 0, j))
+        for i, fila in enumerate(self._a):
+            while len(fila) > columnas:
+                fila.pop().destroy()
+            while len(fila) < columnas:
+                fila.append(self._entrada(i, len(fila)))
+        while len(self._a) > filas:
+            for e in self._a.pop():
+                e.destroy()
+            if self.con_b:
+                self._b.pop().destroy()
+        if self.con_b:
+            if self.crear_encabezado is not None and self._encabezado_b is None:
+                self._encabezado_b = self._colocar(self.crear_encabezado(self.padre, "b"), 0, columnas)
+            elif movida and self._encabezado_b is not None:
+                self._colocar(self._encabezado_b, 0, columnas)
+            if movida:
+                for i, e in enumerate(self._b):
+                    self._colocar(e, i + self._fila0, columnas)
+        while len(self._a) < filas:
+            i = len(self._a)
+            self._a.append([self._entrada(i, j) for j in range(columnas)])
+            if self.con_b:
+                self._b.append(self._entrada(i, columnas))
+
+    def limpiar(self) -> None:
+        """Destruye todas las entradas y encabezados."""
+        for w in self._encabezados + [e for fila in self._a for e in fila] + self._b:
+            w.destroy()
+        if self._encabezado_b is not None:
+            self._encabezado_b.destroy()
+        self._encabezados, self._encabezado_b, self._a, self._b = [], None, [], []
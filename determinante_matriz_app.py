@@ -4,10 +4,20 @@ from fractions import Fraction
 import tkinter as tk
 from tkinter import ttk, messagebox
 from fractions import Fraction
+from time import perf_counter
 from typing import List, Tuple
 
+from core import determinante as core_det
+from core.actualizacion import UltimoCalculo
+from core.determinante import determinante_con_pasos, determinante_por_metodo, menor as _minor
 
-_SUBSCRIPT_MAP = str.maketrans("0123456789", "₀₁₂₃₄₅₆₇₈₉")
+
+_METODOS = {
+    "Automático": core_det.METODO_AUTO,
+    "Cofactores (con menores reutilizados)": core_det.METODO_COFACTORES,
+    "Eliminación de Bareiss": core_det.METODO_BAREISS,
+    "Cofactores en paralelo (todos los núcleos)": core_det.METODO_COFACTORES_PARALELO,
+}
 
 
 def _fmt(value: Fraction) -> str:
@@ -31,148 +41,15 @@ def _fmt_ascii(value: Fraction) -> str:
     return text  # usa '-' normal si es negativo
 
 
-def _sub(num: int) -> str:
-    return str(num).translate(_SUBSCRIPT_MAP)
-
-
-def _label(prefix: str, row: int, col: int) -> str:
-    return f"{prefix}{_sub(row)}{_sub(col)}"
-
-
-def _sign_factor_text(value: Fraction) -> str:
-    return f"(+{_fmt(value)})" if value >= 0 else f"({_fmt(value)})"
-
-
-def _fmt_factor(value: Fraction) -> str:
-    return _fmt(value) if value >= 0 else f"({_fmt(value)})"
-
-
-def _matrix_lines(matrix: List[List[Fraction]], indent: str = "") -> List[str]:
-    lines = []
-    for row in matrix:
-        line = indent + "[ " + "  ".join(_fmt(col) for col in row) + " ]"
-        lines.append(line)
-    return lines
-
-
-def _is_upper_triangular(matrix: List[List[Fraction]]) -> bool:
-    n = len(matrix)
-    for i in range(1, n):
-        for j in range(0, i):
-            if matrix[i][j] != 0:
-                return False
-    return True
-
-
-def _is_lower_triangular(matrix: List[List[Fraction]]) -> bool:
-    n = len(matrix)
-    for i in range(n):
-        for j in range(i + 1, n):
-            if matrix[i][j] != 0:
-                return False
-    return True
-
-
-def _minor(matrix: List[List[Fraction]], row: int, col: int) -> List[List[Fraction]]:
-    return [
-        [matrix[i][j] for j in range(len(matrix)) if j != col]
-        for i in range(len(matrix))
-        if i != row
-    ]
-
-
-def determinante_con_pasos(matrix: List[List[Fraction]], level: int = 0) -> Tuple[Fraction, List[str]]:
-    n = len(matrix)
-    indent = "    " * level
-    steps: List[str] = []
-    separator = indent + ("—" * 70)
-
-    if n == 1:
-        value = matrix[0][0]
-        steps.append(f"{indent}Caso base 1x1: det(A) = {_fmt(value)}")
-        return value, steps
-
-    if n == 2:
-        a11, a12 = matrix[0]
-        a21, a22 = matrix[1]
-        prod1 = a11 * a22
-        prod2 = a12 * a21
-        det = prod1 - prod2
-        steps.append(f"{indent}Caso base 2x2:")
-        steps.extend(_matrix_lines(matrix, indent + "    "))
-        steps.append(
-            f"{indent}det(A) = ({_fmt(a11)} · {_fmt(a22)}) − ({_fmt(a12)} · {_fmt(a21)}) = {_fmt(prod1)} − {_fmt(prod2)} = {_fmt(det)}"
-        )
-        return det, steps
-
-    es_superior = _is_upper_triangular(matrix)
-    es_inferior = _is_lower_triangular(matrix)
-    if es_superior or es_inferior:
-        tipo = "superior" if es_superior else "inferior"
-        diag = [matrix[i][i] for i in range(n)]
-        det = Fraction(1)
-        for value in diag:
-            det *= value
-        diag_product = " · ".join(_fmt(value) for value in diag)
-        steps.append(f"{indent}La matriz es triangular {tipo}.")
-        steps.append(f"{indent}Producto de la diagonal principal: {diag_product} = {_fmt(det)}")
-        return det, steps
-
-    steps.append(f"{indent}Expansion por cofactores a lo largo de la primera fila")
-    formula = " + ".join(f"{_label('a', 1, j + 1)}{_label('C', 1, j + 1)}" for j in range(n))
-    steps.append(f"{indent}det(A) = {formula}")
-
-    contributions: List[Fraction] = []
-    summary_values: List[Fraction] = []
-    for j in range(n):
-        elemento = matrix[0][j]
-        idx_label = _label("a", 1, j + 1)
-        sign_factor = Fraction(1 if j % 2 == 0 else -1)
-        sign_symbol = "+" if sign_factor >= 0 else "−"
-
-        steps.append(separator)
-        steps.append(f"{indent}Elemento {idx_label} = {_fmt(elemento)} (signo {sign_symbol})")
-        if elemento == 0:
-            steps.append(f"{indent}Como {idx_label} = 0, su contribucion es nula y se omite.")
-            contributions.append(Fraction(0))
-            summary_values.append(Fraction(0))
-            continue
-
-        cofactor_label = _label("C", 1, j + 1)
-        minor_label = _label("M", 1, j + 1)
-        steps.append(f"{indent}Cofactor: {cofactor_label} = (−1)^(1+{j+1}) · det({minor_label})")
-
-        submatriz = _minor(matrix, 0, j)
-        steps.append(f"{indent}Submatriz {minor_label} (eliminando fila 1 y columna {j+1}):")
-        steps.extend(_matrix_lines(submatriz, indent + "    "))
-
-        sub_det, sub_steps = determinante_con_pasos(submatriz, level + 1)
-        steps.extend(sub_steps)
-        steps.append(f"{indent}det({minor_label}) = {_fmt(sub_det)}")
-
-        cofactor_value = sign_factor * sub_det
-        steps.append(
-            f"{indent}{cofactor_label} = {_sign_factor_text(sign_factor)} · {_fmt_factor(sub_det)} = {_fmt(cofactor_value)}"
-        )
-
-        contribucion = elemento * cofactor_value
-        steps.append(
-            f"{indent}Contribucion parcial: {_fmt_factor(elemento)} · {_fmt_factor(cofactor_value)} = {_fmt(contribucion)}"
-        )
-        contributions.append(contribucion)
-        summary_values.append(contribucion)
-
-    steps.append(separator)
-    total = sum(contributions, Fraction(0))
-    partes = " + ".join(_fmt_factor(valor) for valor in summary_values)
-    steps.append(f"{indent}Suma total de contribuciones: det(A) = {partes} = {_fmt(total)}")
-    return total, steps
-
-
 class DeterminanteMatrizApp:
     def __init__(self, root, volver_callback):
         self.root = root
         self.volver_callback = volver_callback
+        # Último cálculo en modo automático, para actualizar en O(n^2) si solo cambia una fila o columna
+        self._ultimo = UltimoCalculo()
+        # Menores repartidos entre procesos (modo en paralelo) y la consulta con after que los espera
+        self._menores = {}
+        self._espera_job = None
 
         self.root.title("Determinante de Matriz")
         self.root.geometry("1020x740")
@@ -212,11 +89,15 @@ class DeterminanteMatrizApp:
         config_frame.columnconfigure(2, weight=1)
 
         ttk.Label(config_frame, text="Orden (n×n):").grid(row=0, column=0, padx=6, pady=6, sticky="w")
-        self.spin_n = tk.Spinbox(config_frame, from_=1, to=8, width=5, justify="center",
+        self.spin_n = tk.Spinbox(config_frame, from_=1, to=16, width=5, justify="center",
                                  textvariable=self.n_var, font=("Segoe UI", 12), bg="#fff0f5")
         self.spin_n.grid(row=0, column=1, padx=6, pady=6, sticky="w")
         ttk.Button(config_frame, text="Generar cuadrícula", style="Primary.TButton",
                    command=self._generar_cuadricula).grid(row=0, column=2, padx=6, pady=6, sticky="w")
+        ttk.Label(config_frame, text="Método:").grid(row=1, column=0, padx=6, pady=6, sticky="w")
+        self.metodo_var = tk.StringVar(value="Automático")
+        ttk.Combobox(config_frame, textvariable=self.metodo_var, values=list(_METODOS), state="readonly",
+                     width=36).grid(row=1, column=1, columnspan=2, padx=6, pady=6, sticky="w")
 
         self.matriz_frame = ttk.LabelFrame(container, text="Matriz A", padding=12)
         self.matriz_frame.grid(row=2, column=0, sticky="ew")
@@ -330,7 +211,20 @@ class DeterminanteMatrizApp:
             messagebox.showwarning("Matriz no cuadrada", "Solo se pueden calcular determinantes de matrices cuadradas.")
             return
 
-        texto_detallado, det = self._formato_procedimiento_ejemplo(matriz)
+        if self._metodo() == core_det.METODO_COFACTORES_PARALELO:
+            self._esperar_menores(matriz, lambda futuros: self._mostrar_resultado(matriz, None, futuros))
+            return
+        actualizacion = None
+        if self._metodo() == core_det.METODO_AUTO:
+            actualizacion = self._ultimo.actualizar(matriz)
+            if actualizacion is None or actualizacion.det is None:
+                actualizacion = None
+        self._mostrar_resultado(matriz, actualizacion)
+
+    def _mostrar_resultado(self, matriz, actualizacion=None, calculados=None):
+        texto_detallado, det = self._formato_procedimiento_ejemplo(matriz, actualizacion, calculados)
+        if actualizacion is None and self._metodo() == core_det.METODO_AUTO:
+            self._ultimo.registrar(matriz, det)
         # Mostrar determinante de forma distintiva
         self.resumen_label.config(text="Determinante calculado")
         self.det_value.config(text=f"det(A) = {_fmt(det)}")
@@ -338,6 +232,58 @@ class DeterminanteMatrizApp:
         self._mostrar_matriz_preview(matriz)
         self._mostrar_pasos(texto_detallado)
 
+    # ---------------------------------------------------------
+    # Cofactores en paralelo sin bloquear la ventana
+    # ---------------------------------------------------------
+    def _esperar_menores(self, matriz, continuar):
+        """Reparte los menores entre procesos y consulta con after (como las
+        animaciones) hasta que todos terminan; luego llama a continuar(futuros)."""
+        self._cancelar_menores()
+        self._menores = core_det.repartir_menores(matriz)
+        self._sondear_menores(self.resumen_label.cget("text"), continuar)
+
+    def _sondear_menores(self, texto_previo, continuar):
+        futuros = self._menores
+        hechos = sum(f.done() for f in futuros.values())
+        if hechos < len(futuros):
+            self.resumen_label.config(text=f"Calculando menores en paralelo... {hechos}/{len(futuros)}")
+            self._espera_job = self.root.after(50, self._sondear_menores, texto_previo, continuar)
+            return
+        self._espera_job = None
+        self._menores = {}
+        self.resumen_label.config(text=texto_previo)
+        continuar(futuros)
+
+    def _cancelar_menores(self):
+        if self._espera_job is not None:
+            self.root.after_cancel(self._espera_job)
+            self._espera_job = None
+        for futuro in self._menores.values():
+            futuro.cancel()
+        self._menores = {}
+
+    def _volcar_pasos(self, text_widget, det_label, pasos):
+        """Inserta las lineas del generador pasos por tandas de ~15 ms (con after)
+        y al terminar muestra det(A) en det_label."""
+        if not text_widget.winfo_exists():
+            pasos.close()
+            return
+        limite = perf_counter() + 0.015
+        lote = []
+        det = None
+        try:
+            while perf_counter() < limite:
+                lote.append(next(pasos))
+        except StopIteration as fin:
+            det = fin.value
+        text_widget.config(state="normal")
+        text_widget.insert("end", "".join(linea + "\n" for linea in lote))
+        text_widget.config(state="disabled")
+        if det is None:
+            self.root.after(1, self._volcar_pasos, text_widget, det_label, pasos)
+        else:
+            det_label.config(text=f"det(A) = {_fmt_ascii(det)}")
+
     def _mostrar_matriz_preview(self, matriz: List[List[Fraction]]):
         grid = ttk.LabelFrame(self.matriz_preview, text="Matriz ingresada", padding=8)
         grid.grid(row=0, column=0, sticky="w")
@@ -412,13 +358,29 @@ class DeterminanteMatrizApp:
             "   las entradas de la diagonal principal.\n\n"
             "Nota: La calculadora usa expansion por cofactores repetidamente hasta llegar\n"
             "a menores 2x2 y aplica det([[a,b],[c,d]]) = a*d - b*c.\n"
+            f"Para matrices de orden mayor que {core_det.UMBRAL_BAREISS} usa eliminacion de Bareiss\n"
+            "(sin fracciones), que requiere O(n^3) operaciones en lugar de O(n!).\n"
+            "El metodo 'Cofactores (con menores reutilizados)' recuerda cada menor ya calculado\n"
+            "(las repeticiones aparecen como 'reutilizado'), lo que permite expandir hasta n = 16.\n"
+            "El metodo 'Cofactores en paralelo' hace la expansion clasica completa (hasta n =\n"
+            f"{core_det.MAX_COFACTORES_PARALELO}) repartiendo los menores de la primera fila entre todos los nucleos;\n"
+            "el resultado muestra el valor de cada menor y 'Mostrar procedimiento' su expansion completa.\n"
         )
 
         texto.insert("1.0", contenido)
         texto.config(state="disabled")
 
-    def _formato_procedimiento_ejemplo(self, matrix: List[List[Fraction]]) -> Tuple[str, Fraction]:
-        """Genera un texto con el procedimiento detallado en el formato de referencia."""
+    def _metodo(self) -> str:
+        metodo_var = getattr(self, "metodo_var", None)
+        return _METODOS.get(metodo_var.get(), core_det.METODO_AUTO) if metodo_var is not None else core_det.METODO_AUTO
+
+    def _formato_procedimiento_ejemplo(self, matrix: List[List[Fraction]], actualizacion=None,
+                                       calculados=None) -> Tuple[str, Fraction]:
+        """Genera un texto con el procedimiento detallado en el formato de referencia.
+
+        Con actualizacion (de UltimoCalculo.actualizar) muestra esa actualización
+        de rango uno en lugar de recalcular; calculados son los menores ya
+        repartidos del modo en paralelo."""
         n = len(matrix)
         lines: List[str] = []
         sep = "-" * 60
@@ -430,6 +392,35 @@ class DeterminanteMatrizApp:
         if n == 0:
             return "", Fraction(0)
 
+        metodo = self._metodo()
+        if actualizacion is not None:
+            resultado = actualizacion.det, actualizacion.lineas
+        else:
+            resultado = determinante_por_metodo(matrix, metodo, calculados=calculados)
+        if resultado is not None:
+            det_total, pasos = resultado
+            titulo = {
+                core_det.METODO_COFACTORES: "EXPANSION POR COFACTORES (MENORES REUTILIZADOS)",
+                core_det.METODO_COFACTORES_PARALELO: "EXPANSION POR COFACTORES (EN PARALELO)",
+            }.get(metodo, "ELIMINACION DE BAREISS")
+            if actualizacion is not None:
+                titulo = "ACTUALIZACION DE RANGO UNO (LEMA DEL DETERMINANTE)"
+            elif metodo == core_det.METODO_AUTO and core_det.usar_modular(matrix):
+                titulo = "ARITMETICA MODULAR (TEOREMA CHINO DEL RESTO)"
+            lines.append(sep)
+            lines.append(f" PROCEDIMIENTO DETALLADO: {titulo} ({n}X{n})")
+            lines.append(sep)
+            lines.append("")
+            lines.extend(pasos)
+            if actualizacion is not None:
+                lines.append("")
+                lines.append("(El procedimiento completo, sin la actualizacion, se ve con 'Mostrar procedimiento'.)")
+            lines.append("")
+            lines.append(sep)
+            lines.append(f"DETERMINANTE FINAL:  {_fmt_ascii(det_total)}")
+            lines.append(sep)
+            return "\n".join(lines), det_total
+
         if n == 1:
             valor = matrix[0][0]
             lines.append(sep)
@@ -526,7 +517,7 @@ class DeterminanteMatrizApp:
                     det_sub = p1 - p2
                     numeric_terms_text.append(f"{op}{_fmt_ascii(a)}({_fmt_ascii(p1)} - {_fmt_ascii(p2)})")
                 else:
-                    det_sub, _ = determinante_con_pasos(sub)
+                    det_sub, _ = determinante_con_pasos(sub, trace=False)
                     numeric_terms_text.append(f"{op}{_fmt_ascii(a)}({_fmt_ascii(det_sub)})")
 
                 contribs.append(Fraction(sign) * a * det_sub)
@@ -610,7 +601,7 @@ class DeterminanteMatrizApp:
                 lines.append(f"              = {_fmt_ascii(det_sub)}")
                 lines.append("")
             else:
-                det_sub, _ = determinante_con_pasos(sub)
+                det_sub, _ = determinante_con_pasos(sub, trace=False)
                 lines.append("Calculo:")
                 lines.append(f"    det(M1{j+1}) = {_fmt_ascii(det_sub)}")
                 lines.append("")
@@ -648,8 +639,21 @@ class DeterminanteMatrizApp:
         except Exception as exc:
             messagebox.showerror("Error", str(exc))
             return
+        if self._metodo() == core_det.METODO_COFACTORES_PARALELO:
+            # la expansion de cada menor se reconstruye aqui, por tandas
+            self._esperar_menores(matriz, lambda futuros: self._procedimiento_paralelo(matriz, futuros))
+            return
         texto, det = self._formato_procedimiento_ejemplo(matriz)
+        self._ventana_procedimiento(texto, det)
+
+    def _procedimiento_paralelo(self, matriz, futuros):
+        text_widget, det_label = self._ventana_procedimiento("", None)
+        pasos = core_det.pasos_determinante_paralelo(matriz, ascii=True, calculados=futuros, detalle=True)
+        self._volcar_pasos(text_widget, det_label, pasos)
 
+    def _ventana_procedimiento(self, texto, det):
+        """Ventana con el procedimiento y el recuadro del determinante (det None:
+        aún se está generando); devuelve (texto, etiqueta del determinante)."""
         ventana = tk.Toplevel(self.root)
         ventana.title("Procedimiento detallado: determinante")
         ventana.geometry("1000x700")
@@ -687,13 +691,16 @@ class DeterminanteMatrizApp:
 
         det_frame = ttk.LabelFrame(right, text="Determinante", padding=12)
         det_frame.pack(fill="both", expand=False, padx=8, pady=8)
-        det_label = tk.Label(det_frame, text=f"det(A) = {_fmt_ascii(det)}", font=("Consolas", 16, "bold"), bg="#fffaf0")
+        det_texto = "det(A) = ..." if det is None else f"det(A) = {_fmt_ascii(det)}"
+        det_label = tk.Label(det_frame, text=det_texto, font=("Consolas", 16, "bold"), bg="#fffaf0")
         det_label.pack(padx=12, pady=12)
 
         cerrar = ttk.Button(right, text="Cerrar", command=ventana.destroy)
         cerrar.pack(pady=8)
+        return text_widget, det_label
 
     def _volver_al_inicio(self):
+        self._cancelar_menores()
         try:
             self.root.destroy()
         finally:
@@ -3,6 +3,15 @@ from tkinter import ttk, messagebox
 from fractions import Fraction
 from copy import deepcopy
 
+from core.gauss_jordan import (
+    gauss_jordan,
+    format_operacion_vertical_lines,
+    format_matriz_lines,
+    extraer_soluciones,
+    vectores_columna_lado_a_lado,
+)
+from cuadricula_tk import CuadriculaEntradas
+
 
 
 class GaussJordanApp:
@@ -16,6 +25,10 @@ class GaussJordanApp:
         self.root.geometry("1250x900")
         self.root.configure(bg="#ffe4e6")  # Fondo rosita pastel
 
+        # CuadrÃ­cula de entradas reutilizable y botÃ³n "Resolver"
+        self._cuadricula = None
+        self.boton_resolver = None
+
         # ConfiguraciÃ³n de estilos y widgets iniciales
         self._setup_styles()
         self._setup_widgets()
@@ -127,9 +140,6 @@ class GaussJordanApp:
     # Crear la matriz en pantalla
     # ---------------------------------------------------------
     def crear_matriz(self):
-        for w in self.frame_matriz.winfo_children():
-            w.destroy()
-
         filas = self.ecuaciones_var.get()
         columnas = self.incognitas_var.get()
         if filas <= 0 or columnas <= 0:
@@ -138,31 +148,21 @@ class GaussJordanApp:
 
         self.filas = filas
         self.columnas = columnas + 1  # Ãºltima columna = tÃ©rminos independientes
-        self.entries = []
-
-        # Encabezados x1, x2, x3...
-        for j in range(columnas):
-            ttk.Label(self.frame_matriz, text=f"x{j + 1}", font=("Segoe UI", 12, "bold"), background="#ffe4e6",
-                      foreground="#b91c1c").grid(row=0, column=j, padx=6, pady=6)
-        ttk.Label(self.frame_matriz, text="b", font=("Segoe UI", 12, "bold"), background="#ffe4e6",
-                  foreground="#b91c1c").grid(row=0, column=columnas, padx=6, pady=6)
-
-        # Entradas de la matriz
-        for i in range(filas):
-            fila_entries = []
-            for j in range(self.columnas):
-                e = ttk.Entry(self.frame_matriz, width=8, justify="center")
-                e.grid(row=i + 1, column=j, padx=6, pady=6)
-                try:
-                    e.bind("<KeyRelease>", lambda _ev=None: self._preview_sistema())
-                except Exception:
-                    pass
-                fila_entries.append(e)
-            self.entries.append(fila_entries)
 
-        # BotÃ³n "Resolver"
-        ttk.Button(self.frame_matriz, text="Resolver", style="Primary.TButton", command=self.resolver).grid(
-            row=self.filas + 1, columnspan=self.columnas, pady=20)
+        # Encabezados x1, x2, ..., b y entradas: solo se crean o destruyen las
+        # filas y columnas que cambian (el resto conserva su contenido)
+        if self._cuadricula is None:
+            self._cuadricula = CuadriculaEntradas(
+                self.frame_matriz, self._crear_entrada, self._crear_encabezado, con_b=True, padx=6, pady=6
+            )
+        self._cuadricula.redimensionar(filas, columnas)
+        self.entries = self._cuadricula.entradas
+
+        # BotÃ³n "Resolver" (se crea una vez y se recoloca bajo la cuadrÃ­cula)
+        if self.boton_resolver is None:
+            self.boton_resolver = ttk.Button(self.frame_matriz, text="Resolver", style="Primary.TButton",
+                                             command=self.resolver)
+        self.boton_resolver.grid(row=self.filas + 1, column=0, columnspan=self.columnas, pady=20)
 
         # Si existen detalles previos, limpiarlos
         if self.detalle_button:
@@ -173,6 +173,18 @@ class GaussJordanApp:
         # Vista previa inicial
         self._preview_sistema()
 
+    def _crear_entrada(self, padre):
+        e = ttk.Entry(padre, width=8, justify="center")
+        try:
+            e.bind("<KeyRelease>", lambda _ev=None: self._preview_sistema())
+        except Exception:
+            pass
+        return e
+
+    def _crear_encabezado(self, padre, texto):
+        return ttk.Label(padre, text=texto, font=("Segoe UI", 12, "bold"), background="#ffe4e6",
+                         foreground="#b91c1c")
+
     # ---------------------------------------------------------
     # Nuevo: limpiar pantalla
     # ---------------------------------------------------------
@@ -180,6 +192,8 @@ class GaussJordanApp:
         # Limpia la matriz
         for w in self.frame_matriz.winfo_children():
             w.destroy()
+        self._cuadricula = None
+        self.boton_resolver = None
 
         # Limpia resultados
         self.text_result.configure(state="normal")
@@ -212,8 +226,9 @@ class GaussJordanApp:
 
             self.matriz_original = deepcopy(matriz_original)
             A = deepcopy(matriz_original)
-            pasos = self.gauss_jordan(A, self.filas, self.columnas)
-            self.pasos_guardados = pasos
+            # Solo el resultado; los pasos se generan al pedir el detalle
+            self.gauss_jordan(A, self.filas, self.columnas, trace=False)
+            self.pasos_guardados = None
             self.matriz_final = A
 
             self.soluciones, _ = self._extraer_soluciones(A)
@@ -235,53 +250,8 @@ class GaussJordanApp:
     # Extraer soluciones de la matriz reducida
     # ---------------------------------------------------------
     def _extraer_soluciones(self, A):
-        n, m = self.filas, self.columnas
-        num_vars = m - 1
-        soluciones = [None] * num_vars
-
-        for i in range(n):
-            if all(A[i][j] == 0 for j in range(num_vars)) and A[i][-1] != 0:
-                return None, "incompatible"
-
-        pivotes = [-1] * n
-        columnas_pivote = []
-        for i in range(n):
-            for j in range(num_vars):
-                if A[i][j] == 1 and all(A[k][j] == 0 for k in range(n) if k != i):
-                    pivotes[i] = j
-                    columnas_pivote.append(j)
-                    break
-
-        libres = [j for j in range(num_vars) if j not in columnas_pivote]
-
-        if libres:
-            expresiones = {}
-            for i in range(n):
-                if pivotes[i] != -1:
-                    partes = []
-                    if A[i][-1] != 0:   # Solo agregar el tÃ©rmino independiente si no es 0
-                        partes.append(str(A[i][-1]))
-                    for j in libres:
-                        coef = -A[i][j]
-                        if coef != 0:
-                            partes.append(f"({coef})*x{j+1}")
-                    # Unir las partes con " + ", sin que empiece con 0 +
-                    expr = " + ".join(partes) if partes else "0"
-                    expresiones[pivotes[i]] = expr
-
-            for j in range(num_vars):
-                if j in expresiones:
-                    soluciones[j] = expresiones[j]
-                elif j in libres:
-                    soluciones[j] = f"x{j+1} es variable libre"
-                else:
-                    soluciones[j] = "0"
-            return soluciones, "indeterminado"
-
-        for i in range(min(n, num_vars)):
-            if pivotes[i] != -1:
-                soluciones[pivotes[i]] = A[i][-1]
-        return soluciones, "determinado"
+        soluciones, tipo, _ = extraer_soluciones(A)
+        return soluciones, tipo
 
     # ---------------------------------------------------------
     # Mostrar resumen final (con forma vectorial extra)
@@ -444,6 +414,9 @@ class GaussJordanApp:
         self.text_result.configure(state="normal")
         self.text_result.delete("1.0", tk.END)
 
+        if self.pasos_guardados is None:
+            A = deepcopy(self.matriz_original)
+            self.pasos_guardados = self.gauss_jordan(A, len(A), len(A[0]))
         for step in self.pasos_guardados:
             self._insert_header(step["titulo"], step.get("comentario", ""))
             oper_lines = step["oper_lines"]
@@ -485,90 +458,17 @@ class GaussJordanApp:
     # ---------------------------------------------------------
     # Algoritmo Gauss-Jordan
     # ---------------------------------------------------------
-    def gauss_jordan(self, A, n, m):
-        pasos = []
-        fila_pivote = 0
-        for col in range(m - 1):
-            pivote = None
-            for f in range(fila_pivote, n):
-                if A[f][col] != 0:
-                    pivote = f
-                    break
-            if pivote is None:
-                continue
-
-            if pivote != fila_pivote:
-                A[fila_pivote], A[pivote] = A[pivote], A[fila_pivote]
-                pasos.append({
-                    "titulo": f"F{fila_pivote+1} \u2194 F{pivote+1}",
-                    "comentario": f"Intercambio de filas para poner un pivote no nulo en la columna {col+1}",
-                    "oper_lines": [],
-                    "matriz_lines": self.format_matriz_lines(A)
-                })
-
-            divisor = A[fila_pivote][col]
-            if divisor == 0:
-                fila_pivote += 1
-                continue
-            if divisor != 1:
-                A[fila_pivote] = [val / divisor for val in A[fila_pivote]]
-                pasos.append({
-                    "titulo": f"F{fila_pivote+1} \u2192 F{fila_pivote+1}/{divisor}",
-                    "comentario": f"NormalizaciÃ³n: se convierte en pivote a 1 en la columna {col+1}",
-                    "oper_lines": [],
-                    "matriz_lines": self.format_matriz_lines(A)
-                })
-
-            for f in range(n):
-                if f != fila_pivote and A[f][col] != 0:
-                    factor = A[f][col]
-                    original_fila = A[f][:]
-                    A[f] = [original_fila[j] - factor * A[fila_pivote][j] for j in range(m)]
-                    oper_lines = self.format_operacion_vertical_lines(
-                        A[fila_pivote], original_fila, factor, A[f], fila_pivote + 1, f + 1
-                    )
-                    pasos.append({
-                        "titulo": f"F{f+1} \u2192 F{f+1} - ({factor})F{fila_pivote+1}",
-                        "comentario": f"Se anula el elemento en la columna {col+1} usando la fila pivote",
-                        "oper_lines": oper_lines,
-                        "matriz_lines": self.format_matriz_lines(A)
-                    })
-            fila_pivote += 1
-            if fila_pivote >= n:
-                break
-        return pasos
+    def gauss_jordan(self, A, n, m, trace=True):
+        return gauss_jordan(A, n, m, trace=trace)
 
     # ---------------------------------------------------------
     # Funciones auxiliares
     # ---------------------------------------------------------
     def format_operacion_vertical_lines(self, fila_pivote, fila_actual, factor, fila_result, idx_piv, idx_obj):
-        ancho = max(len(str(x)) for x in fila_result) if fila_result else 1
-
-        def fmt(lst):
-            return " ".join(str(x).rjust(ancho) for x in lst)
-
-        escala = [(-factor) * val for val in fila_pivote]
-
-        if factor < 0:
-            factor_str = f"+{abs(factor)}"
-        else:
-            factor_str = f"-{factor}"
-
-        lines = [
-            f"{factor_str}F{idx_piv} : {fmt(escala)}",
-            f"+F{idx_obj}   : {fmt(fila_actual)}",
-            " " * 10 + "-" * (ancho * len(fila_result) + len(fila_result) - 1),
-            f"=F{idx_obj}   : {fmt(fila_result)}"
-        ]
-        return lines
+        return format_operacion_vertical_lines(fila_pivote, fila_actual, factor, fila_result, idx_piv, idx_obj)
 
     def format_matriz_lines(self, A):
-        ancho = max((len(str(x)) for fila in A for x in fila), default=1)
-        lines = []
-        for fila in A:
-            line = " ".join(str(x).rjust(ancho) for x in fila)
-            lines.append(line)
-        return lines
+        return format_matriz_lines(A)
 
     # ---------------------------------------------------------
     # Construir representacion del sistema A|b como ecuaciones
@@ -651,43 +551,7 @@ class GaussJordanApp:
     # Imprime varios vectores columna alineados y sumados
     # ---------------------------------------------------------
     def vectores_columna_lado_a_lado(self, vectores, nombres, espacio_entre_vectores=4):
-        n = len(vectores[0])
-        m = len(vectores)
-        # Encabezados: x3, + x4, + x5, ...
-        encabezados = [nombres[0]] + [f"+ {nombres[idx]}" for idx in range(1, m)]
-        max_encabezado = max(len(e) for e in encabezados)
-        max_num_len = max(len(str(v[fila])) for v in vectores for fila in range(n))
-        bloque_ancho = max_encabezado + 3 + max_num_len + 2  # espacios y corchetes
-
-        sep = " " * espacio_entre_vectores
-
-        lines = []
-        for fila in range(n):
-            line = ""
-            for idx, v in enumerate(vectores):
-                valstr = str(v[fila]).rjust(max_num_len)
-                # Corchetes segÃºn la fila
-                if fila == 0:
-                    corchete_izq = "\u23A1"  # âŽ¡
-                    corchete_der = "\u23A4"  # âŽ¤
-                elif fila == n - 1:
-                    corchete_izq = "\u23A3"  # âŽ£
-                    corchete_der = "\u23A6"  # âŽ¦
-                else:
-                    corchete_izq = "\u23A2"  # âŽ¢
-                    corchete_der = "\u23A5"  # âŽ¥
-                # Encabezado solo en la primera fila
-                if fila == 0:
-                    encabezado = encabezados[idx].rjust(max_encabezado)
-                    bloque = f"{encabezado} {corchete_izq} {valstr} {corchete_der}"
-                else:
-                    bloque = " " * max_encabezado + f" {corchete_izq} {valstr} {corchete_der}"
-                bloque = bloque.ljust(bloque_ancho)
-                if idx < m - 1:
-                    bloque += sep
-                line += bloque
-            lines.append(line.rstrip())
-        return lines
+        return vectores_columna_lado_a_lado(vectores, nombres, espacio_entre_vectores)
 
     # ---------------------------------------------------------
     # Verificar independencia de columnas
@@ -2,6 +2,24 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from fractions import Fraction
 
+from core.actualizacion import UltimoCalculo
+from core.inversa import (
+    rref_info,
+    inversa,
+    explicar_invertibilidad,
+    inversa_gauss_jordan,
+    pasos_inversa,
+    fotogramas_inversa,
+)
+from cuadricula_tk import CuadriculaEntradas
+from matriz_canvas_tk import MatrizCanvas
+
+
+# Animación paso a paso: intervalo entre pasos (ms) y duración total aproximada
+INTERVALO_MAX_MS = 350
+INTERVALO_MIN_MS = 40
+DURACION_ANIMACION_MS = 20000
+
 
 def _fmt(x: Fraction) -> str:
     try:
@@ -14,6 +32,8 @@ class InversaMatrizApp:
     def __init__(self, root, volver_callback):
         self.root = root
         self.volver_callback = volver_callback
+        # Último cálculo Gauss-Jordan, para actualizar en O(n^2) si solo cambia una fila o columna
+        self._ultimo = UltimoCalculo()
 
         # ventana
         self.root.title("Inversa de Matriz")
@@ -98,7 +118,9 @@ class InversaMatrizApp:
         self.ingreso_frame = tk.Frame(container, bg=self.bg)
         self.ingreso_frame.pack(pady=(8, 6))
         self.entries_grid = None
+        self._cuadricula = None
         self.n = 0
+        self._anim_job = None
 
         # acciones
         actions = tk.Frame(container, bg=self.bg)
@@ -131,14 +153,9 @@ class InversaMatrizApp:
             w.destroy()
 
     def _render_matrix(self, parent, M):
-        grid = tk.Frame(parent, bg=self.bg)
+        grid = MatrizCanvas(parent, len(M), len(M[0]) if M else 0, bg=self.bg)
         grid.pack(pady=4)
-        for i, fila in enumerate(M):
-            for j, val in enumerate(fila):
-                tk.Label(
-                    grid, text=_fmt(val), bg=self.bg, fg="#111",
-                    font=("Segoe UI", 11), relief="groove", width=10, anchor="center"
-                ).grid(row=i, column=j, padx=4, pady=4, sticky="nsew")
+        grid.mostrar(M, _fmt)
         return grid
 
     # utilidades
@@ -150,8 +167,6 @@ class InversaMatrizApp:
         return Fraction(s)
 
     def _crear_cuadricula(self):
-        for w in self.ingreso_frame.winfo_children():
-            w.destroy()
         self._clear_result()
 
         try:
@@ -165,16 +180,17 @@ class InversaMatrizApp:
             return
 
         self.n = n
-        grid = tk.Frame(self.ingreso_frame, bg=self.bg)
-        grid.pack()
-        self.entries_grid = []
-        for i in range(n):
-            row_entries = []
-            for j in range(n):
-                e = tk.Entry(grid, width=8, justify="center", font=("Segoe UI", 11), bg=self.entry_bg)
-                e.grid(row=i, column=j, padx=6, pady=6)
-                row_entries.append(e)
-            self.entries_grid.append(row_entries)
+        # Al cambiar n solo se crean o destruyen las filas y columnas que cambian
+        if self._cuadricula is None:
+            grid = tk.Frame(self.ingreso_frame, bg=self.bg)
+            grid.pack()
+            self._cuadricula = CuadriculaEntradas(
+                grid,
+                lambda padre: tk.Entry(padre, width=8, justify="center", font=("Segoe UI", 11), bg=self.entry_bg),
+                padx=6, pady=6,
+            )
+        self._cuadricula.redimensionar(n, n)
+        self.entries_grid = self._cuadricula.entradas
 
         try:
             self.btn_calcular.state(["!disabled"])
@@ -198,6 +214,7 @@ class InversaMatrizApp:
     def _build_augmented_view(self, n):
         wrapper = tk.Frame(self.result_frame, bg=self.bg)
         wrapper.pack(pady=6)
+        self._vista_aumentada = wrapper
 
         left_col = tk.Frame(wrapper, bg=self.bg)
         left_col.pack(side="left", padx=(0, 10))
@@ -207,28 +224,11 @@ class InversaMatrizApp:
         tk.Label(left_col, text="A (trabajo)", font=("Segoe UI", 14, "bold"), bg=self.bg, fg="#b91c1c").pack()
         tk.Label(right_col, text="I / Inversa", font=("Segoe UI", 14, "bold"), bg=self.bg, fg="#b91c1c").pack()
 
-        self.grid_A = tk.Frame(left_col, bg=self.bg)
+        self.grid_A = MatrizCanvas(left_col, n, n, bg=self.bg)
         self.grid_A.pack(pady=6)
-        self.grid_I = tk.Frame(right_col, bg=self.bg)
+        self.grid_I = MatrizCanvas(right_col, n, n, bg=self.bg)
         self.grid_I.pack(pady=6)
 
-        self.lbl_A = []
-        self.lbl_I = []
-        for i in range(n):
-            ra = []
-            ri = []
-            for j in range(n):
-                la = tk.Label(self.grid_A, text="", bg=self.bg, fg="#111", font=("Segoe UI", 11),
-                              relief="groove", width=10, anchor="center")
-                la.grid(row=i, column=j, padx=4, pady=4, sticky="nsew")
-                li = tk.Label(self.grid_I, text="", bg=self.bg, fg="#111", font=("Segoe UI", 11),
-                              relief="groove", width=10, anchor="center")
-                li.grid(row=i, column=j, padx=4, pady=4, sticky="nsew")
-                ra.append(la)
-                ri.append(li)
-            self.lbl_A.append(ra)
-            self.lbl_I.append(ri)
-
         # área de pasos
         pasos_title = tk.Label(self.result_frame, text="Pasos detallados", font=("Segoe UI", 14, "bold"),
                                bg=self.bg, fg="#b91c1c")
@@ -253,96 +253,32 @@ class InversaMatrizApp:
 
     def _render_augmented(self, A, I):
         # Si no hay grillas construidas (caso no invertible), no hacer nada
-        if not hasattr(self, 'lbl_A') or not self.lbl_A or not hasattr(self, 'lbl_I') or not self.lbl_I:
+        grids = (getattr(self, "grid_A", None), getattr(self, "grid_I", None))
+        if any(g is None or not g.winfo_exists() for g in grids):
             return
-        n = self.n
-        for i in range(n):
-            for j in range(n):
-                self.lbl_A[i][j].config(text=_fmt(A[i][j]))
-                self.lbl_I[i][j].config(text=_fmt(I[i][j]))
+        # solo se redibujan las celdas que cambian
+        self.grid_A.mostrar(A, _fmt)
+        self.grid_I.mostrar(I, _fmt)
 
     # -----------------------------
     # Comprobación c), d), e) vía RREF
     # -----------------------------
     def _rref_info(self, A):
-        """Devuelve (RREF, columnas_pivote, columnas_libres) usando Fraction.
-
-        Construye una copia de A y aplica GaussJordan completo.
-        """
-        n = len(A)
-        if n == 0:
-            return [], [], []
-        m = len(A[0])
-        M = [row[:] for row in A]
-        row = 0
-        piv_cols = []
-        for col in range(m):
-            if row >= n:
-                break
-            # buscar pivote no nulo en o debajo de 'row'
-            piv = None
-            for r in range(row, n):
-                if M[r][col] != 0:
-                    piv = r
-                    break
-            if piv is None:
-                continue
-            if piv != row:
-                M[row], M[piv] = M[piv], M[row]
-            a = M[row][col]
-            if a != 1:
-                M[row] = [v / a for v in M[row]]
-            for r in range(n):
-                if r == row:
-                    continue
-                f = M[r][col]
-                if f != 0:
-                    M[r] = [M[r][j] - f * M[row][j] for j in range(m)]
-            piv_cols.append(col)
-            row += 1
-        free_cols = [j for j in range(m) if j not in piv_cols]
-        return M, piv_cols, free_cols
+        """Devuelve (RREF, columnas_pivote, columnas_libres) usando Fraction."""
+        return rref_info(A)
 
     def _explain_failure_cde(self, A, text_widget):
         """Escribe en el text_widget la justificación usando c), d) y e)."""
-        R, piv_cols, free_cols = self._rref_info(A)
-        n = len(A)
-        # helper insert
-        def ins(s=""):
+        for linea in explicar_invertibilidad(A):
             try:
-                text_widget.insert("end", s + "\n")
+                text_widget.insert("end", linea + "\n")
             except Exception:
                 pass
-        ins("Comprobacion de invertibilidad (c, d, e)")
-        ins("")
-        ins("RREF de A:")
-        # formato sencillo
-        if R:
-            maxw = max(len(str(v)) for fila in R for v in fila)
-            for fila in R:
-                ins(" ".join(str(v).rjust(maxw) for v in fila))
-        ins("")
-        if len(piv_cols) != n:
-            ins(f"- (c) No tiene n posiciones pivote: {len(piv_cols)} de {n}.")
-        else:
-            ins(f"- (c) Tiene n posiciones pivote: {len(piv_cols)} de {n}.")
-        # (d) Construir una solución no trivial si hay libres
-        if free_cols:
-            j0 = free_cols[0]
-            x = [Fraction(0) for _ in range(n)]
-            x[j0] = Fraction(1)
-            for r, pc in enumerate(piv_cols):
-                if j0 < len(R[0]):
-                    x[pc] = -R[r][j0]
-            ins("")
-            ins("- (d) Existe solucion no trivial para Ax = 0. Ejemplo:")
-            ins("x = [ " + ", ".join(str(v) for v in x) + " ]^t")
-            ins("")
-            ins("- (e) Por consiguiente, las columnas de A son linealmente dependientes (no LI).")
-        else:
-            ins("")
-            ins("- (d) Ax=0 solo tiene la solucion trivial.")
-    def _calcular_inversa(self):
+
+    def _calcular_inversa(self, atajo=True):
+        """Calcula la inversa; con atajo=False no se prueba Sherman-Morrison y
+        se muestran siempre los pasos de Gauss-Jordan."""
+        self._detener_animacion()
         for w in self.result_frame.winfo_children():
             w.destroy()
         try:
@@ -359,8 +295,22 @@ class InversaMatrizApp:
             # identidad
             I = [[Fraction(1 if i == j else 0) for j in range(n)] for i in range(n)]
 
+            # Sherman-Morrison desde el cálculo anterior (si A' es singular se recalcula entero)
+            if atajo and not self.var_animar.get():
+                actualizacion = self._ultimo.actualizar(A)
+                if actualizacion is not None and actualizacion.inversa is not None:
+                    self._build_augmented_view(n)
+                    self._render_augmented(I, actualizacion.inversa)
+                    for linea in actualizacion.lineas:
+                        self.pasos_text.insert("end", linea + "\n")
+                    ttk.Button(self.result_frame, text="Ver pasos de Gauss-Jordan",
+                               command=lambda: self._calcular_inversa(atajo=False)).pack(pady=6)
+                    return
+
                         # Verificar invertibilidad antes de construir las grillas A/I
             ok, _ = self._gauss_jordan_steps(A, I, collect_only=True)
+            # la comprobación ya dejó la factorización de A en la caché
+            self._ultimo.registrar(A)
 
             if self.var_animar.get():
                 if not ok:
@@ -549,34 +499,11 @@ class InversaMatrizApp:
 
     # Construye la lista de pasos (descriptores) para Gauss-Jordan
     def _gauss_jordan_steps(self, A, I, collect_only=False):
-        n = self.n
-        pasos = []
-
-        def find_pivot_row(k):
-            best = None
-            best_abs = Fraction(0)
-            for r in range(k, n):
-                val = A[r][k]
-                if val != 0 and abs(val) >= best_abs:
-                    best = r
-                    best_abs = abs(val)
-            return best
-
-        # Usamos descriptores de pasos genéricos; los valores exactos (pivote/factor)
-        # se calculan al aplicar el paso, para que funcionen con animación.
-        for k in range(n):
-            pasos.append(("pivot", k))
-            pasos.append(("scale", k))
-            for i in range(n):
-                if i != k:
-                    pasos.append(("elim", i, k))
+        pasos = pasos_inversa(self.n)
 
         if collect_only:
-            # Validación mínima: intentamos simular para detectar singularidad
-            Atest = [row[:] for row in A]
-            Itest = [row[:] for row in I]
-            ok = self._apply_steps(Atest, Itest, pasos, log_to_text=False, simulate=True)
-            return ok, pasos
+            # Validación mínima: basta el resultado (sin pasos) para detectar singularidad
+            return inversa(A) is not None, pasos
         return True, pasos
 
     # ---------------------------------------------------------
@@ -659,82 +586,41 @@ class InversaMatrizApp:
     # ---------------------------------------------------------
     def _render_detailed_gauss_jordan(self, A, I):
         n = self.n
-        # copias de trabajo
-        Aw = [row[:] for row in A]
-        Iw = [row[:] for row in I]
 
         # limpiar área de pasos
         self.pasos_text.delete("1.0", "end")
 
-        fila_pivote = 0
-        columnas_pivote = []
-        for col in range(n):
-            # buscar pivote no nulo
-            piv = None
-            for r in range(fila_pivote, n):
-                if Aw[r][col] != 0:
-                    piv = r
-                    break
-            if piv is None:
-                continue
-
-            # Intercambio si es necesario
-            if piv != fila_pivote:
-                Aw[fila_pivote], Aw[piv] = Aw[piv], Aw[fila_pivote]
-                Iw[fila_pivote], Iw[piv] = Iw[piv], Iw[fila_pivote]
+        Aw, Iw, columnas_pivote, pasos = inversa_gauss_jordan(A)
+        for paso in pasos:
+            fila = paso["fila"]
+            col = paso["col"]
+            if paso["tipo"] == "intercambio":
                 self._insert_header_to_text(
-                    f"R{fila_pivote+1}  R{piv+1}",
+                    f"R{fila+1}  R{paso['otra']+1}",
                     f"Intercambio de filas para poner pivote  0 en columna {col+1}"
                 )
-                for line in self._format_augmented_lines(Aw, Iw):
+                for line in self._format_augmented_lines(paso["A"], paso["I"]):
                     self.pasos_text.insert("end", line + "\n")
-                self.pasos_text.insert("end", "\n" + "-" * 110 + "\n\n")
-
-            # Normalizar fila pivote
-            a = Aw[fila_pivote][col]
-            if a == 0:
-                fila_pivote += 1
-                if fila_pivote >= n:
-                    break
-                continue
-            if a != 1:
-                Aw[fila_pivote] = [val / a for val in Aw[fila_pivote]]
-                Iw[fila_pivote] = [val / a for val in Iw[fila_pivote]]
+            elif paso["tipo"] == "escala":
                 self._insert_header_to_text(
-                    f"R{fila_pivote+1}  R{fila_pivote+1}/{_fmt(a)}",
+                    f"R{fila+1}  R{fila+1}/{_fmt(paso['valor'])}",
                     f"Normalización: pivote 1 en columna {col+1}"
                 )
-                for line in self._format_augmented_lines(Aw, Iw):
+                for line in self._format_augmented_lines(paso["A"], paso["I"]):
                     self.pasos_text.insert("end", line + "\n")
-                self.pasos_text.insert("end", "\n" + "-" * 110 + "\n\n")
-
-            # Eliminar en otras filas
-            for r in range(n):
-                if r == fila_pivote:
-                    continue
-                f = Aw[r][col]
-                if f == 0:
-                    continue
-                fila_orig_A = Aw[r][:]
-                fila_orig_I = Iw[r][:]
-                fila_piv_A = Aw[fila_pivote][:]
-                fila_piv_I = Iw[fila_pivote][:]
-                # resultado
-                Aw[r] = [fila_orig_A[j] - f * fila_piv_A[j] for j in range(n)]
-                Iw[r] = [fila_orig_I[j] - f * fila_piv_I[j] for j in range(n)]
+            else:
+                fila_pivote = paso["fila_pivote"]
                 # formateo operación vertical sobre fila completa (A|I)
-                fila_piv_full = fila_piv_A + fila_piv_I
-                fila_orig_full = fila_orig_A + fila_orig_I
-                fila_res_full = Aw[r] + Iw[r]
                 oper_lines = self._format_operacion_vertical_lines(
-                    fila_piv_full, fila_orig_full, f, fila_res_full, fila_pivote + 1, r + 1
+                    paso["pivote"], paso["antes"], paso["valor"], paso["A"][fila] + paso["I"][fila],
+                    fila_pivote + 1, fila + 1
                 )
                 self._insert_header_to_text(
-                    f"R{r+1}  R{r+1} - ({_fmt(f)})R{fila_pivote+1}",
+                    f"R{fila+1}  R{fila+1} - ({_fmt(paso['valor'])})R{fila_pivote+1}",
                     f"Anular elemento en columna {col+1} usando la fila pivote"
                 )
                 # ensamblar lado a lado: oper_lines (izq) y matriz (der)
-                matriz_lines = self._format_augmented_lines(Aw, Iw)
+                matriz_lines = self._format_augmented_lines(paso["A"], paso["I"])
                 max_left = max((len(s) for s in oper_lines), default=0)
                 sep = "   |   "
                 max_len = max(len(oper_lines), len(matriz_lines))
@@ -743,12 +629,7 @@ class InversaMatrizApp:
                     right = matriz_lines[i] if i < len(matriz_lines) else ""
                     line_text = left.ljust(max_left) + (sep if right else "") + right + "\n"
                     self.pasos_text.insert("end", line_text)
-                self.pasos_text.insert("end", "\n" + "-" * 110 + "\n\n")
-
-            columnas_pivote.append(col)
-            fila_pivote += 1
-            if fila_pivote >= n:
-                break
+            self.pasos_text.insert("end", "\n" + "-" * 110 + "\n\n")
 
         # render final en las grillas superiores
         self._render_augmented(Aw, Iw)
@@ -781,116 +662,140 @@ class InversaMatrizApp:
                 "No tiene n posiciones pivote (c). Entonces Ax=0 tiene solucion no trivial (d) y las columnas de A son dependientes (e)."
             )
             return
-    def _apply_steps(self, A, I, pasos, log_to_text=True, simulate=False):
-        n = self.n
-        for step in pasos:
-            if step[0] == "pivot":
-                _, k = step
-                # seleccionar mejor pivote y/o intercambiar
-                p = None
-                best_abs = Fraction(0)
-                for r in range(k, n):
-                    v = A[r][k]
-                    if v != 0 and abs(v) >= best_abs:
-                        best_abs = abs(v)
-                        p = r
-                if p is None or A[p][k] == 0:
-                    # singular
-                    return False
-                if p != k:
-                    A[k], A[p] = A[p], A[k]
-                    I[k], I[p] = I[p], I[k]
-                    if log_to_text:
-                        self.pasos_text.insert("end", f"Intercambiar R{k+1} -> R{p+1}\n")
-                else:
-                    if log_to_text:
-                        self.pasos_text.insert("end", f"Pivote en R{k+1} ya adecuado\n")
-            elif step[0] == "scale":
-                _, k = step
-                a = A[k][k]
-                if a == 0:
-                    return False
-                if a != 1:
-                    for j in range(n):
-                        A[k][j] /= a
-                        I[k][j] /= a
-                    if log_to_text:
-                        self.pasos_text.insert("end", f"R{k+1} := R{k+1} / {a}\n")
-                else:
-                    if log_to_text:
-                        self.pasos_text.insert("end", f"Pivote R{k+1} ya es 1\n")
-            elif step[0] == "elim":
-                _, i, k = step
-                if i == k:
-                    continue
-                f = A[i][k]
-                if f != 0:
-                    for j in range(n):
-                        A[i][j] -= f * A[k][j]
-                        I[i][j] -= f * I[k][j]
-                    if log_to_text:
-                        self.pasos_text.insert("end", f"R{i+1} := R{i+1} - ({_fmt(f)})*R{k+1}\n")
-                else:
-                    if log_to_text:
-                        self.pasos_text.insert("end", f"Columna {k+1}: R{i+1} ya tiene 0\n")
-
-            if not simulate:
-                self._render_augmented(A, I)
-        return True
 
+    # ---------------------------------------------------------
+    # Animación: fotogramas precalculados; cada paso solo toca sus celdas
+    # ---------------------------------------------------------
     def _start_animation(self, A, I):
-        ok, pasos = self._gauss_jordan_steps(A, I, collect_only=True)
+        ok, fotogramas = fotogramas_inversa(A)
         if not ok:
             # No animamos; explicamos inmediatamente por (c), (d) y (e)
             self.pasos_text.delete("1.0", "end")
             self._explain_failure_cde(A, self.pasos_text)
             messagebox.showerror("Sin inversa", "No tiene n posiciones pivote (c). Entonces Ax=0 tiene solucion no trivial (d) y las columnas de A son dependientes (e).")
             return
-        # Copias mutables para animación
-        self.A_anim = [row[:] for row in A]
-        self.I_anim = [row[:] for row in I]
-        self.steps = pasos
-        self.step_index = 0
+        self._detener_animacion()
+        self._anim_fotogramas = fotogramas
+        self._anim_pos = 0
+        total = len(fotogramas)
+        # unos DURACION_ANIMACION_MS en total: en matrices grandes baja el intervalo y,
+        # si llega al mínimo, se avanzan varios pasos por tick
+        self._anim_intervalo = max(INTERVALO_MIN_MS, min(INTERVALO_MAX_MS, DURACION_ANIMACION_MS // max(1, total)))
+        self._anim_por_tick = max(1, -(-total * self._anim_intervalo // DURACION_ANIMACION_MS))
+        self._crear_controles_animacion(total)
         # limpiar pasos
         self.pasos_text.delete("1.0", "end")
-        self._render_augmented(self.A_anim, self.I_anim)
-        self._animate_next()
-
-    def _animate_next(self):
-        if self.step_index >= len(self.steps):
-            # Animación terminada: confirmar (c), (d) y (e) si A quedó en identidad
+        self._render_augmented(A, I)
+        self._anim_reproducir()
+
+    def _crear_controles_animacion(self, total):
+        controles = tk.Frame(self.result_frame, bg=self.bg)
+        controles.pack(after=self._vista_aumentada, pady=(0, 6))
+        ttk.Button(controles, text="|<", width=4, command=lambda: self._anim_saltar(0)).pack(side="left", padx=2)
+        ttk.Button(controles, text="<", width=4, command=lambda: self._anim_saltar(self._anim_pos - 1)).pack(side="left", padx=2)
+        self._anim_boton = ttk.Button(controles, text="Pausa", width=11, command=self._anim_alternar)
+        self._anim_boton.pack(side="left", padx=2)
+        ttk.Button(controles, text=">", width=4, command=lambda: self._anim_saltar(self._anim_pos + 1)).pack(side="left", padx=2)
+        ttk.Button(controles, text=">|", width=4, command=lambda: self._anim_saltar(total)).pack(side="left", padx=2)
+        self._anim_escala = tk.Scale(controles, from_=0, to=total, orient="horizontal", length=320,
+                                     bg=self.bg, highlightthickness=0, label="Paso")
+        self._anim_escala.pack(side="left", padx=(12, 0))
+        # solo los movimientos del usuario (el valor se lee cuando la clase Scale ya lo movió)
+        for evento in ("<B1-Motion>", "<ButtonRelease-1>"):
+            self._anim_escala.bind(evento, lambda _e: self.root.after_idle(
+                lambda: self._anim_saltar(int(self._anim_escala.get()))))
+
+    def _vista_animacion_viva(self):
+        grid = getattr(self, "grid_A", None)
+        return grid is not None and grid.winfo_exists()
+
+    def _detener_animacion(self):
+        if self._anim_job is not None:
             try:
-                n = self.n
-                A = self.A_anim
-                is_I = True
-                for i in range(n):
-                    for j in range(n):
-                        if A[i][j] != (1 if i == j else 0):
-                            is_I = False
-                            break
-                    if not is_I:
-                        break
-                if is_I:
-                    try:
-                        self.pasos_text.insert("end", "Comprobación de invertibilidad (c, d, e)\n", ("bold",))
-                    except Exception:
-                        self.pasos_text.insert("end", "Comprobación de invertibilidad (c, d, e)\n")
-                    self.pasos_text.insert("end", f"(c) Pivotes encontrados: {n} de n = {n}  OK.\n")
-                    self.pasos_text.insert("end", "(d) Ax = 0 solo tiene la solución trivial.\n")
-                    self.pasos_text.insert("end", "(e) Las columnas de A forman un conjunto linealmente independiente.\n")
-            finally:
-                return
-        # aplicar un paso
-        step = [self.steps[self.step_index]]
-        ok = self._apply_steps(self.A_anim, self.I_anim, step, log_to_text=True, simulate=False)
-        if not ok:
-            self.pasos_text.insert("end", "\nSe detecta que no hay n pivotes.\n")
-            self._explain_failure_cde(self.A_anim, self.pasos_text)
-            messagebox.showerror("Sin inversa", "No tiene n posiciones pivote (c). Entonces Ax=0 tiene solucion no trivial (d) y las columnas de A son dependientes (e).")
+                self.root.after_cancel(self._anim_job)
+            except Exception:
+                pass
+            self._anim_job = None
+
+    def _anim_reproducir(self):
+        if self._anim_pos >= len(self._anim_fotogramas):
+            self._anim_ir(0)
+        self._anim_boton.config(text="Pausa")
+        self._anim_job = self.root.after(self._anim_intervalo, self._anim_tick)
+
+    def _anim_alternar(self):
+        if self._anim_job is not None:
+            self._detener_animacion()
+            self._anim_boton.config(text="Reproducir")
+        else:
+            self._anim_reproducir()
+
+    def _anim_saltar(self, destino):
+        """Movimiento del usuario (botones o barra): pausa y va al paso destino."""
+        if destino == self._anim_pos or not self._vista_animacion_viva():
             return
-        self.step_index += 1
+        self._detener_animacion()
+        self._anim_boton.config(text="Reproducir")
+        self._anim_ir(destino)
+
+    def _anim_tick(self):
+        self._anim_job = None
+        if not self._vista_animacion_viva():
+            return
+        self._anim_ir(self._anim_pos + self._anim_por_tick)
+        if self._anim_pos < len(self._anim_fotogramas):
+            self._anim_job = self.root.after(self._anim_intervalo, self._anim_tick)
+        else:
+            self._anim_boton.config(text="Reproducir")
+
+    def _anim_ir(self, destino):
+        """Deja [A | I] y los pasos como tras `destino` fotogramas, aplicando solo
+        las celdas que cambian entre la posición actual y la nueva."""
+        fotogramas = self._anim_fotogramas
+        destino = max(0, min(len(fotogramas), destino))
+        actual = self._anim_pos
+        if destino == actual or not self._vista_animacion_viva():
+            return
+        celdas = {}
+        if destino > actual:
+            for _texto, cambios in fotogramas[actual:destino]:
+                for i, j, _antes, despues in cambios:
+                    celdas[i, j] = despues
+        else:
+            for _texto, cambios in reversed(fotogramas[destino:actual]):
+                for i, j, antes, _despues in cambios:
+                    celdas[i, j] = antes
+        n = self.n
+        for (i, j), valor in celdas.items():
+            if j < n:
+                self.grid_A.poner(i, j, _fmt(valor))
+            else:
+                self.grid_I.poner(i, j - n, _fmt(valor))
+        ultimo = fotogramas[destino - 1][1] if destino else []
+        self.grid_A.resaltar((i, j) for i, j, _a, _d in ultimo if j < n)
+        self.grid_I.resaltar((i, j - n) for i, j, _a, _d in ultimo if j >= n)
+
+        # una línea por fotograma: avanzar añade líneas y retroceder las borra
+        if destino > actual:
+            self.pasos_text.insert("end", "".join(texto + "\n" for texto, _c in fotogramas[actual:destino]))
+        else:
+            self.pasos_text.delete(f"{destino + 1}.0", "end")
+        if destino == len(fotogramas):
+            self._anim_conclusion()
         self.pasos_text.see("end")
-        self.root.after(350, self._animate_next)
+        self._anim_pos = destino
+        self._anim_escala.set(destino)
+
+    def _anim_conclusion(self):
+        # A quedó en la identidad: confirmar (c), (d) y (e)
+        n = self.n
+        try:
+            self.pasos_text.insert("end", "Comprobación de invertibilidad (c, d, e)\n", ("bold",))
+        except Exception:
+            self.pasos_text.insert("end", "Comprobación de invertibilidad (c, d, e)\n")
+        self.pasos_text.insert("end", f"(c) Pivotes encontrados: {n} de n = {n}  OK.\n")
+        self.pasos_text.insert("end", "(d) Ax = 0 solo tiene la solución trivial.\n")
+        self.pasos_text.insert("end", "(e) Las columnas de A forman un conjunto linealmente independiente.\n")
 
     def _volver_al_inicio(self):
         try:
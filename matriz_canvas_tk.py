@@ -0,0 +1,95 @@
+"""Matriz de solo lectura dibujada en un único tk.Canvas."""
+
+import tkinter as tk
+import tkinter.font as tkfont
+from tkinter import ttk
+
+# Tamaño máximo del lienzo visible; por encima aparecen barras de desplazamiento
+ANCHO_MAXIMO = 860
+ALTO_MAXIMO = 420
+
+
+class MatrizCanvas(tk.Frame):
+    """Matriz filas x columnas como texto sobre un Canvas (un rectángulo y un
+    texto por celda) en vez de un tk.Label por celda.
+
+    mostrar(M) y poner(i, j, valor) solo tocan los textos que cambian, así
+    que repintar durante una animación cuesta lo que cambia el paso. Cada
+    celda muestra hasta `caracteres` caracteres (como los Label de width=10
+    a los que sustituye); si la matriz no cabe en ANCHO_MAXIMO x ALTO_MAXIMO
+    el lienzo se desplaza.
+    """
+
+    def __init__(self, padre, filas: int, columnas: int, bg="#ffe4e6", fg="#111",
+                 font=("Segoe UI", 11), caracteres: int = 10, borde="#d4d4d8", separacion: int = 4):
+        super().__init__(padre, bg=bg)
+        self.filas = filas
+        self.columnas = columnas
+        self.caracteres = caracteres
+        # referencia propia: Tk borra la fuente con nombre cuando se libera el objeto
+        self._fuente = fuente = tkfont.Font(root=padre, font=font)
+        self._ancho = fuente.measure("0" * caracteres) + 8
+        self._alto = fuente.metrics("linespace") + 10
+        paso_x = self._ancho + 2 * separacion
+        paso_y = self._alto + 2 * separacion
+        total_x = columnas * paso_x
+        total_y = filas * paso_y
+
+        self.canvas = tk.Canvas(self, bg=bg, highlightthickness=0,
+                                width=min(total_x, ANCHO_MAXIMO), height=min(total_y, ALTO_MAXIMO),
+                                scrollregion=(0, 0, total_x, total_y))
+        if total_y > ALTO_MAXIMO:
+            barra_y = ttk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
+            barra_y.grid(row=0, column=1, sticky="ns")
+            self.canvas.configure(yscrollcommand=barra_y.set)
+        if total_x > ANCHO_MAXIMO:
+            barra_x = ttk.Scrollbar(self, orient="horizontal", command=self.canvas.xview)
+            barra_x.grid(row=1, column=0, sticky="ew")
+            self.canvas.configure(xscrollcommand=barra_x.set)
+        self.canvas.grid(row=0, column=0)
+
+        self.bg = bg
+        self._textos = []
+        self._items = []
+        self._rectangulos = []
+        self._resaltadas = set()
+        for i in range(filas):
+            y0 = i * paso_y + separacion
+            items = []
+            rectangulos = []
+            for j in range(columnas):
+                x0 = j * paso_x + separacion
+                rectangulos.append(self.canvas.create_rectangle(x0, y0, x0 + self._ancho, y0 + self._alto,
+                                                                outline=borde, fill=bg))
+                items.append(self.canvas.create_text(x0 + self._ancho / 2, y0 + self._alto / 2,
+                                                     text="", fill=fg, font=fuente))
+            self._items.append(items)
+            self._rectangulos.append(rectangulos)
+            self._textos.append([""] * columnas)
+
+    def _recortar(self, texto: str) -> str:
+        if len(texto) <= self.caracteres:
+            return texto
+        return texto[:self.caracteres - 1] + "…"
+
+    def poner(self, i: int, j: int, valor) -> None:
+        """Cambia el texto de la celda (i, j) si es distinto del que tiene."""
+        texto = self._recortar(str(valor))
+        if self._textos[i][j] != texto:
+            self._textos[i][j] = texto
+            self.canvas.itemconfigure(self._items[i][j], text=texto)
+
+    def mostrar(self, M, formatear=str) -> None:
+        """Muestra la matriz M tocando solo las celdas que cambian."""
+        for i, fila in enumerate(M):
+            for j, valor in enumerate(fila):
+                self.poner(i, j, formatear(valor))
+
+    def resaltar(self, celdas, color="#fde68a") -> None:
+        """Pinta el fondo de las celdas (i, j) indicadas y quita el resaltado anterior."""
+        celdas = set(celdas)
+        for i, j in self._resaltadas - celdas:
+            self.canvas.itemconfigure(self._rectangulos[i][j], fill=self.bg)
+        for i, j in celdas - self._resaltadas:
+            self.canvas.itemconfigure(self._rectangulos[i][j], fill=color)
+        self._resaltadas = celdas
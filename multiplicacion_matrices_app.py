@@ -2,6 +2,10 @@ import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 from fractions import Fraction
 
+from core.producto import (
+    multiplicar_cadena, aplicar_escalar, sumar_matrices, restar_matrices,
+)
+
 
 class MultiplicacionMatricesApp:
     def __init__(self, root, volver_callback):
@@ -438,13 +442,16 @@ class MultiplicacionMatricesApp:
                     mats_escaladas.append(Ms)
                 else:
                     mats_escaladas.append(M)
-            parcial = mats_escaladas[0]
-            for ix in range(1, len(self.matrices)):
+            # Orden de la cadena por programación dinámica (menos productos escalares)
+            parcial, pasos, orden, costo, costo_sec = multiplicar_cadena(mats_escaladas)
+            if len(mats_escaladas) > 2:
                 pasos_general.append("")
-                pasos_general.append(f"Multiplicación {ix}: cálculo de c_ij de Matriz {ix} x Matriz {ix+1}")
-                R, pasos = self._multiplicar_con_detalle(parcial, mats_escaladas[ix])
-                pasos_general.extend(pasos)
-                parcial = R
+                pasos_general.append(f"Orden de multiplicación elegido (M_i = Matriz i): {orden}")
+                pasos_general.append(
+                    f"Multiplicaciones escalares: {costo} (de izquierda a derecha serían {costo_sec}; "
+                    f"se ahorran {costo_sec - costo})"
+                )
+            pasos_general.extend(pasos)
             # Escalar global (de la pantalla de configuración), si se activó
             if getattr(self, 'use_scalar', False) and getattr(self, 'scalar_k', Fraction(1)) != 1:
                 parcial, pasos_k = self._aplicar_escalar(parcial, self.scalar_k)
@@ -456,62 +463,14 @@ class MultiplicacionMatricesApp:
         except Exception as e:
             messagebox.showerror("Error", f"Ocurrio un problema: {e}")
 
-    def _multiplicar_con_detalle(self, A, B):
-        fa, ca = len(A), len(A[0])
-        fb, cb = len(B), len(B[0])
-        if ca != fb:
-            raise ValueError("Las columnas de A deben coincidir con las filas de B.")
-        R = [[Fraction(0) for _ in range(cb)] for _ in range(fa)]
-        pasos = []
-        for i in range(fa):
-            for j in range(cb):
-                terms = []
-                s = Fraction(0)
-                for k in range(ca):
-                    a = A[i][k]; b = B[k][j]
-                    terms.append(f"{a}*{b}")
-                    s += a * b
-                R[i][j] = s
-                pasos.append(f"c{i+1}{j+1} = " + " + ".join(terms) + f" = {s}")
-        return R, pasos
-
     def _aplicar_escalar(self, M, k):
-        filas = len(M); cols = len(M[0]) if filas else 0
-        R = [[Fraction(0) for _ in range(cols)] for _ in range(filas)]
-        pasos = []
-        for i in range(filas):
-            row_terms = []
-            for j in range(cols):
-                R[i][j] = M[i][j] * k
-                row_terms.append(f"c{i+1}{j+1} = {k}*{M[i][j]} = {R[i][j]}")
-            pasos.extend(row_terms)
-        return R, pasos
+        return aplicar_escalar(M, k)
 
     def _sumar_matrices(self, A, B):
-        fa, ca = len(A), len(A[0])
-        fb, cb = len(B), len(B[0])
-        if fa != fb or ca != cb:
-            raise ValueError("Para sumar, las matrices deben tener las mismas dimensiones.")
-        R = [[Fraction(0) for _ in range(ca)] for _ in range(fa)]
-        pasos = []
-        for i in range(fa):
-            for j in range(ca):
-                R[i][j] = A[i][j] + B[i][j]
-                pasos.append(f"c{i+1}{j+1} = {A[i][j]} + {B[i][j]} = {R[i][j]}")
-        return R, pasos
+        return sumar_matrices(A, B)
 
     def _restar_matrices(self, A, B):
-        fa, ca = len(A), len(A[0])
-        fb, cb = len(B), len(B[0])
-        if fa != fb or ca != cb:
-            raise ValueError("Para restar, las matrices deben tener las mismas dimensiones.")
-        R = [[Fraction(0) for _ in range(ca)] for _ in range(fa)]
-        pasos = []
-        for i in range(fa):
-            for j in range(ca):
-                R[i][j] = A[i][j] - B[i][j]
-                pasos.append(f"c{i+1}{j+1} = {A[i][j]} - {B[i][j]} = {R[i][j]}")
-        return R, pasos
+        return restar_matrices(A, B)
 
     def _calcular_suma_resta(self):
         try:
@@ -577,7 +536,7 @@ class MultiplicacionMatricesApp:
             w.destroy()
 
         if titulo is None:
-            titulo = "Resultado de la Multiplicacin"
+            titulo = "Resultado de la Multiplicación"
         self._ultimo_titulo_resultado = titulo
         tk.Label(self.result_container, text=titulo,
                  font=("Segoe UI", 18, "bold"), bg=self.bg, fg="#b91c1c").pack(pady=(10, 10))
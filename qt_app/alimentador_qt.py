@@ -0,0 +1,92 @@
+"""Volcado incremental de pasos en los paneles de texto (QTextEdit / QPlainTextEdit)."""
+
+import time
+
+from PySide6.QtCore import QObject, QTimer
+from PySide6.QtGui import QTextCursor
+
+
+# Fragmentos por página antes de pedir "Cargar más" y tiempo máximo por tanda
+PASOS_POR_PAGINA = 200
+PRESUPUESTO_MS = 15
+
+
+class AlimentadorTexto(QObject):
+    """Escribe en un panel de texto los fragmentos de un iterable, por tandas.
+
+    La primera tanda se inserta en el acto y el resto desde un QTimer, sin
+    pasar de PRESUPUESTO_MS por tanda, así la ventana no se congela. Tras
+    PASOS_POR_PAGINA fragmentos se detiene y muestra boton_mas ("Cargar más"),
+    que sigue desde el mismo punto del iterable. Los fragmentos se insertan
+    tal cual (incluyen sus propios saltos de línea).
+    """
+
+    def __init__(self, destino, boton_mas=None, por_pagina: int = PASOS_POR_PAGINA, parent=None):
+        super().__init__(parent if parent is not None else destino)
+        self.destino = destino
+        self.boton_mas = boton_mas
+        self.por_pagina = max(1, int(por_pagina))
+        self._fuente = None
+        self._restantes = 0
+        self._timer = QTimer(self)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._tanda)
+        if boton_mas is not None:
+            boton_mas.clicked.connect(self.cargar_mas)
+            boton_mas.setVisible(False)
+
+    def en_curso(self) -> bool:
+        return self._fuente is not None
+
+    def iniciar(self, fragmentos, limpiar: bool = True):
+        self.detener()
+        if limpiar:
+            self.destino.clear()
+        self._fuente = iter(fragmentos)
+        self.cargar_mas()
+
+    def cargar_mas(self):
+        if self._fuente is None:
+            return
+        self._restantes = self.por_pagina
+        if self.boton_mas is not None:
+            self.boton_mas.setEnabled(False)
+        self._tanda()
+        if self._fuente is not None and self._restantes > 0:
+            self._timer.start()
+
+    def detener(self):
+        self._timer.stop()
+        self._fuente = None
+        self._restantes = 0
+        if self.boton_mas is not None:
+            self.boton_mas.setVisible(False)
+
+    def _tanda(self):
+        if self._fuente is None:
+            self._timer.stop()
+            return
+        limite = time.perf_counter() + PRESUPUESTO_MS / 1000.0
+        partes = []
+        agotado = False
+        while self._restantes > 0:
+            try:
+                partes.append(next(self._fuente))
+            except StopIteration:
+                agotado = True
+                break
+            self._restantes -= 1
+            if time.perf_counter() >= limite:
+                break
+        if partes:
+            # cursor propio: no mueve la vista del usuario
+            cursor = QTextCursor(self.destino.document())
+            cursor.movePosition(QTextCursor.End)
+            cursor.insertText("".join(partes))
+        if agotado:
+            self.detener()
+        elif self._restantes == 0:
+            self._timer.stop()
+            if self.boton_mas is not None:
+                self.boton_mas.setEnabled(True)
+                self.boton_mas.setVisible(True)
@@ -0,0 +1,84 @@
+"""Cuadrícula de entradas [A | b] que se redimensiona reutilizando sus widgets."""
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QLabel, QLineEdit
+
+
+class CuadriculaEntradas:
+    """QLineEdit de la matriz aumentada [A | b] sobre un QGridLayout.
+
+    La fila 0 lleva los encabezados x1..xn y b. redimensionar() solo crea o
+    destruye las filas y columnas que cambian: las entradas que siguen
+    conservan su texto y sus conexiones, y la columna b se desplaza cuando
+    cambia el número de incógnitas.
+    """
+
+    def __init__(self, layout, estilo_encabezado: str = "font-weight:700;"):
+        self.layout = layout
+        self.estilo_encabezado = estilo_encabezado
+        self._encabezados = []
+        self._encabezado_b = None
+        self._a = []
+        self._b = []
+
+    @property
+    def entradas(self):
+        """Filas de QLineEdit: incógnitas y, al final, b."""
+        return [fila + [b] for fila, b in zip(self._a, self._b)]
+
+    def _encabezado(self, texto, columna):
+        h = QLabel(texto)
+        h.setStyleSheet(self.estilo_encabezado)
+        self.layout.addWidget(h, 0, columna)
+        return h
+
+    def _entrada(self, fila, columna):
+        e = QLineEdit()
+        e.setPlaceholderText("0")
+        e.setAlignment(Qt.AlignCenter)
+        self.layout.addWidget(e, fila + 1, columna)
+        return e
+
+    def _mover(self, w, fila, columna):
+        self.layout.removeWidget(w)
+        self.layout.addWidget(w, fila, columna)
+
+    def _destruir(self, w):
+        self.layout.removeWidget(w)
+        w.hide()
+        w.deleteLater()
+
+    def redimensionar(self, filas: int, columnas: int) -> None:
+        """Deja filas x columnas incógnitas más la columna b."""
+        movida = columnas != len(self._encabezados)
+        while len(self._encabezados) > columnas:
+            self._destruir(self._encabezados.pop())
+            for fila in self._a:
+                self._destruir(fila.pop())
+        while len(self._encabezados) < columnas:
+            j = len(self._encabezados)
+            self._encabezados.append(self._encabezado(f"x{j+1}", j))
+            for i, fila in enumerate(self._a):
+                fila.append(self._entrada(i, j))
+        while len(self._a) > filas:
+            for e in self._a.pop():
+                self._destruir(e)
+            self._destruir(self._b.pop())
+        if self._encabezado_b is None:
+            self._encabezado_b = self._encabezado("b", columnas)
+        elif movida:
+            self._mover(self._encabezado_b, 0, columnas)
+            for i, e in enumerate(self._b):
+                self._mover(e, i + 1, columnas)
+        while len(self._a) < filas:
+            i = len(self._a)
+            self._a.append([self._entrada(i, j) for j in range(columnas)])
+            self._b.append(self._entrada(i, columnas))
+
+    def limpiar(self) -> None:
+        """Destruye todas las entradas y encabezados."""
+        for w in self._encabezados + [e for fila in self._a for e in fila] + self._b:
+            self._destruir(w)
+        if self._encabezado_b is not None:
+            self._destruir(self._encabezado_b)
+        self._encabezados, self._encabezado_b, self._a, self._b = [], None, [], []
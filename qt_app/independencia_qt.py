@@ -4,7 +4,7 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt
 from fractions import Fraction
-from independencia_lineal import son_linealmente_independientes
+from core.independencia import BaseEscalonada, verificar_independencia
 from .theme import bind_font_scale_stylesheet
 
 
@@ -15,6 +15,8 @@ class IndependenciaWindow(QMainWindow):
         self._rows = 3
         self._cols = 3
         self.entries = []
+        # Base reducida de la última comprobación (solo se reducen los vectores que cambien)
+        self._base = BaseEscalonada()
 
         outer = QWidget(); self.setCentralWidget(outer)
         lay = QVBoxLayout(outer)
@@ -93,7 +95,7 @@ class IndependenciaWindow(QMainWindow):
                     fila.append(float(Fraction(s)))
                 matriz.append(fila)
             columnas = [[matriz[i][j] for i in range(f)] for j in range(c)]
-            ok, texto = son_linealmente_independientes(columnas)
+            ok, texto = verificar_independencia(self._base, columnas)
             self.out.clear()
             self.out.insertPlainText(texto)
         except Exception as exc:
@@ -1,6 +1,7 @@
 from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from .menu_principal_qt import MenuPrincipalWindow
+from .settings_qt import restaurar_backend
 from .theme import apply_theme
 import sys
 
@@ -11,4 +12,6 @@ def run():
     w = MenuPrincipalWindow()
     # A pantalla completa SIEMPRE (maximizado conserva marcos de ventana)
     w.showMaximized()
+    # core se importa después de mostrar el menú, no antes
+    QTimer.singleShot(0, restaurar_backend)
     sys.exit(app.exec())
@@ -1,11 +1,24 @@
 ﻿from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QScrollArea, QGridLayout, QLineEdit, QTextEdit, QMessageBox, QFrame,
-    QRadioButton, QCheckBox
+    QRadioButton, QCheckBox, QComboBox
 )
 from PySide6.QtCore import Qt
+from concurrent.futures import wait
 from fractions import Fraction
 from .theme import bind_font_scale_stylesheet
+from .tabla_matriz_qt import TablaMatriz, vista_matriz
+from .trabajos_qt import BarraTrabajo, TrabajoCancelado
+from core import determinante as core_det
+from core.actualizacion import UltimoCalculo
+from core.determinante import (
+    determinante_con_pasos as _determinante_con_pasos,
+    pasos_determinante as _pasos_determinante,
+    pasos_por_metodo,
+)
+from core.inversa import explicar_invertibilidad, inversa_gauss_jordan
+from core.producto import multiplicar_con_detalle, sumar_matrices, restar_matrices
+from core.transpuesta import Transpuesta
 
 
 def _parse_fraction(s: str) -> Fraction:
@@ -16,22 +29,8 @@ def _parse_fraction(s: str) -> Fraction:
 
 
 def _matrix_widget(parent: QWidget, mat):
-    grid = QGridLayout()
-    grid.setHorizontalSpacing(6)
-    grid.setVerticalSpacing(6)
-    wrapper = QWidget(parent)
-    wrapper.setLayout(grid)
-    for i, row in enumerate(mat):
-        for j, val in enumerate(row):
-            lbl = QLabel(str(val))
-            lbl.setAlignment(Qt.AlignCenter)
-            bind_font_scale_stylesheet(
-                lbl,
-                "background:#ffffff;border:1px solid #ccc;padding:6px;font-family:Segoe UI;font-size:{body}px;color:#000;font-weight:600;",
-                body=14,
-            )
-            grid.addWidget(lbl, i, j)
-    return wrapper
+    # Una sola vista por matriz: solo se pintan las celdas visibles
+    return vista_matriz(mat, parent)
 
 
 class _BaseMatrixWindow(QMainWindow):
@@ -71,6 +70,10 @@ class _BaseMatrixWindow(QMainWindow):
         self.btn_run.clicked.connect(self._run)
         self.lay.addWidget(self.btn_run)
 
+        # Progreso y cancelación de los cálculos en segundo plano
+        self.trabajo = BarraTrabajo(self)
+        self.lay.addWidget(self.trabajo)
+
         # Área visual para mostrar la matriz resultante en cuadritos
         self.result_matrix_area = QScrollArea(); self.result_matrix_area.setWidgetResizable(True)
         self.result_matrix_area.setMinimumHeight(200)
@@ -89,7 +92,7 @@ class _BaseMatrixWindow(QMainWindow):
         )
         self.lay.addWidget(self.result_box, 1)
 
-        self.entries = []
+        self.tablas = []
         try:
             self.op_label.setText("Operacion: Multiplicacion (A x B)")
         except Exception:
@@ -101,62 +104,33 @@ class _BaseMatrixWindow(QMainWindow):
         except Exception as exc:
             QMessageBox.warning(self, "Aviso", f"Datos invalidos: {exc}")
 
-    def _setup_entries(self):
-        # override in subclasses for multiple matrices
+    def _crear_tablas(self, matrices):
+        """Sustituye las tablas de entrada por una TablaMatriz por cada
+        (titulo, filas, columnas) de matrices, en columnas de self.grid."""
         for i in reversed(range(self.grid.count())):
             w = self.grid.itemAt(i).widget()
             if w: w.setParent(None)
-        filas = int(self.f_edit.text()); cols = int(self.c_edit.text())
-        self.entries = []
-        g = QGridLayout(); g.setHorizontalSpacing(6); g.setVerticalSpacing(6)
-        box = QFrame(); box.setLayout(g)
-        self.grid.addWidget(QLabel("Matriz"), 0, 0, alignment=Qt.AlignHCenter)
-        self.grid.addWidget(box, 1, 0)
-        for i in range(filas):
-            row = []
-            for j in range(cols):
-                e = QLineEdit(); e.setAlignment(Qt.AlignCenter); e.setPlaceholderText("0")
-                g.addWidget(e, i, j)
-                row.append(e)
-            self.entries.append(row)
+        self.tablas = []
+        for m, (titulo, filas, cols) in enumerate(matrices):
+            tabla = TablaMatriz(filas, cols, convertir=_parse_fraction)
+            self.grid.addWidget(QLabel(titulo), 0, m, alignment=Qt.AlignHCenter)
+            self.grid.addWidget(tabla, 1, m)
+            self.tablas.append(tabla)
         self.btn_run.setEnabled(True)
 
+    def _setup_entries(self):
+        # override in subclasses for multiple matrices
+        filas = int(self.f_edit.text()); cols = int(self.c_edit.text())
+        self._crear_tablas([("Matriz", filas, cols)])
+
     def _setup_entries_addsub(self, f: int, c: int):
-        # Construye dos grillas f x c (A y B) para suma/resta; A se rellena con el último resultado
-        for i in reversed(range(self.grid.count())):
-            w = self.grid.itemAt(i).widget()
-            if w:
-                w.setParent(None)
-        self.entries = []
-        for m in range(2):
-            g = QGridLayout(); g.setHorizontalSpacing(6); g.setVerticalSpacing(6)
-            box = QFrame(); box.setLayout(g)
-            title = "Matriz A (resultado)" if m == 0 else "Matriz B (nueva)"
-            self.grid.addWidget(QLabel(title), 0, m, alignment=Qt.AlignHCenter)
-            self.grid.addWidget(box, 1, m)
-            mat_entries = []
-            for i in range(f):
-                row = []
-                for j in range(c):
-                    e = QLineEdit(); e.setAlignment(Qt.AlignCenter); e.setPlaceholderText("0")
-                    if m == 0 and hasattr(self, "_last_result") and self._last_result and i < len(self._last_result) and j < len(self._last_result[0]):
-                        e.setText(str(self._last_result[i][j]))
-                    g.addWidget(e, i, j)
-                    row.append(e)
-                mat_entries.append(row)
-            self.entries.append(mat_entries)
-        self.btn_run.setEnabled(True)
+        # Construye dos tablas f x c (A y B) para suma/resta; A se rellena con el último resultado
+        self._crear_tablas([("Matriz A (resultado)", f, c), ("Matriz B (nueva)", f, c)])
+        if hasattr(self, "_last_result") and self._last_result:
+            self.tablas[0].establecer([fila[:c] for fila in self._last_result[:f]])
 
     def _leer(self):
-        filas = len(self.entries)
-        cols = len(self.entries[0]) if filas else 0
-        A = []
-        for i in range(filas):
-            row = []
-            for j in range(cols):
-                row.append(_parse_fraction(self.entries[i][j].text()))
-            A.append(row)
-        return A
+        return self.tablas[0].valores() if self.tablas else []
 
     def _show_matrix_result(self, M, title: str = "Matriz resultante"):
         """Muestra la matriz M en el contenedor visual como cuadritos con un título.
@@ -193,6 +167,20 @@ class _BaseMatrixWindow(QMainWindow):
     def _run(self):
         raise NotImplementedError
 
+    def _en_segundo_plano(self, funcion, *args, al_terminar=None):
+        """Ejecuta funcion(control, *args) fuera del hilo de la interfaz y pasa su
+        resultado a al_terminar; "Calcular" queda desactivado mientras tanto."""
+        self.trabajo.ejecutar(
+            funcion, *args,
+            al_terminar=al_terminar,
+            al_fallar=self._fallo_calculo,
+            al_cancelar=lambda: self.result_box.insertPlainText("\nCálculo cancelado.\n"),
+            deshabilitar=(self.btn_run,),
+        )
+
+    def _fallo_calculo(self, exc):
+        QMessageBox.warning(self, "Aviso", f"No se pudo completar el cálculo: {exc}")
+
 
 class SumaMatricesWindow(_BaseMatrixWindow):
     def __init__(self, parent=None):
@@ -202,39 +190,11 @@ class SumaMatricesWindow(_BaseMatrixWindow):
         self.lay.itemAt(1).layout().insertWidget(1, self.num_edit)
 
     def _setup_entries(self):
-        for i in reversed(range(self.grid.count())):
-            w = self.grid.itemAt(i).widget()
-            if w: w.setParent(None)
         filas = int(self.f_edit.text()); cols = int(self.c_edit.text()); n = int(self.num_edit.text())
-        self.entries = []
-        for m in range(n):
-            g = QGridLayout(); g.setHorizontalSpacing(6); g.setVerticalSpacing(6)
-            box = QFrame(); box.setLayout(g)
-            self.grid.addWidget(QLabel(f"Matriz {m+1}"), 0, m, alignment=Qt.AlignHCenter)
-            self.grid.addWidget(box, 1, m)
-            mat_entries = []
-            for i in range(filas):
-                row = []
-                for j in range(cols):
-                    e = QLineEdit(); e.setAlignment(Qt.AlignCenter); e.setPlaceholderText("0")
-                    g.addWidget(e, i, j)
-                    row.append(e)
-                mat_entries.append(row)
-            self.entries.append(mat_entries)
-        self.btn_run.setEnabled(True)
+        self._crear_tablas([(f"Matriz {m+1}", filas, cols) for m in range(n)])
 
     def _leer_all(self):
-        mats = []
-        for grid in self.entries:
-            filas = len(grid); cols = len(grid[0]) if filas else 0
-            M = []
-            for i in range(filas):
-                row = []
-                for j in range(cols):
-                    row.append(_parse_fraction(grid[i][j].text()))
-                M.append(row)
-            mats.append(M)
-        return mats
+        return [tabla.valores() for tabla in self.tablas]
 
     def _run(self):
         mats = self._leer_all()
@@ -348,31 +308,11 @@ class MultiplicacionMatricesWindow(_BaseMatrixWindow):
         self.lay.addLayout(chain_row)
 
     def _setup_entries(self):
-        for i in reversed(range(self.grid.count())):
-            w = self.grid.itemAt(i).widget()
-            if w: w.setParent(None)
         f = int(self.f_edit.text()); c = int(self.c_edit.text()); p = int(self.p_edit.text())
-        self.entries = []
-        for m, (rows, cols) in enumerate(((f, c), (c, p))):
-            g = QGridLayout(); g.setHorizontalSpacing(6); g.setVerticalSpacing(6)
-            box = QFrame(); box.setLayout(g)
-            self.grid.addWidget(QLabel("Matriz A" if m == 0 else "Matriz B"), 0, m, alignment=Qt.AlignHCenter)
-            self.grid.addWidget(box, 1, m)
-            mat_entries = []
-            for i in range(rows):
-                row = []
-                for j in range(cols):
-                    e = QLineEdit(); e.setAlignment(Qt.AlignCenter); e.setPlaceholderText("0")
-                    g.addWidget(e, i, j)
-                    row.append(e)
-                mat_entries.append(row)
-            self.entries.append(mat_entries)
-        self.btn_run.setEnabled(True)
+        self._crear_tablas([("Matriz A", f, c), ("Matriz B", c, p)])
 
     def _run(self):
-        Agrid, Bgrid = self.entries
-        A = [[_parse_fraction(e.text()) for e in row] for row in Agrid]
-        B = [[_parse_fraction(e.text()) for e in row] for row in Bgrid]
+        A, B = (tabla.valores() for tabla in self.tablas)
         # Si hay una operación de suma/resta pendiente
         if hasattr(self, "_op_mode") and self._op_mode in ("add", "sub"):
             fa, ca = len(A), len(A[0]) if A else 0
@@ -407,16 +347,7 @@ class MultiplicacionMatricesWindow(_BaseMatrixWindow):
                                 Bs[i][j] = kB * Bs[i][j]
             except Exception:
                 pass
-            R = [[Fraction(0) for _ in range(ca)] for _ in range(fa)]
-            pasos = []
-            for i in range(fa):
-                for j in range(ca):
-                    if self._op_mode == "add":
-                        R[i][j] = As[i][j] + Bs[i][j]
-                        pasos.append(f"c{i+1}{j+1} = {As[i][j]} + {Bs[i][j]} = {R[i][j]}")
-                    else:
-                        R[i][j] = As[i][j] - Bs[i][j]
-                        pasos.append(f"c{i+1}{j+1} = {As[i][j]} - {Bs[i][j]} = {R[i][j]}")
+            R, pasos = sumar_matrices(As, Bs) if self._op_mode == "add" else restar_matrices(As, Bs)
             # Mostrar resultado y pasos
             def _fmt_mat(M):
                 if not M: return []
@@ -487,18 +418,11 @@ class MultiplicacionMatricesWindow(_BaseMatrixWindow):
         except Exception:
             pass
 
-        R = [[Fraction(0) for _ in range(cb)] for _ in range(fa)]
-        pasos = []
-        for i in range(fa):
-            for j in range(cb):
-                terms = []
-                s = Fraction(0)
-                for k in range(ca):
-                    a = As[i][k]; b = Bs[k][j]
-                    terms.append(f"{a}*{b}")
-                    s += a * b
-                R[i][j] = s
-                pasos.append(f"c{i+1}{j+1} = " + " + ".join(terms) + f" = {s}")
+        self._en_segundo_plano(_trabajo_producto, As, Bs,
+                               al_terminar=lambda res: self._mostrar_producto(res, pasos_pre))
+
+    def _mostrar_producto(self, resultado, pasos_pre):
+        R, pasos = resultado
         # Precedencia: primero pasos de escalares (A y B), luego sección de multiplicación
         pasos_total = []
         if pasos_pre:
@@ -552,13 +476,8 @@ class MultiplicacionMatricesWindow(_BaseMatrixWindow):
             self.op_label.setText("Operacion: Multiplicacion (A x B)")
         except Exception:
             pass
-        try:
-            Agrid, _Bgrid = self.entries
-        except Exception:
-            return
-        for i in range(fa):
-            for j in range(cb):
-                Agrid[i][j].setText(str(self._last_result[i][j]))
+        if self.tablas:
+            self.tablas[0].establecer(self._last_result)
 
     def _prepare_add_sub(self, op: str):
         # Prepara entradas para suma/resta mostrando A = resultado previo y B vacía
@@ -574,6 +493,10 @@ class MultiplicacionMatricesWindow(_BaseMatrixWindow):
         self._setup_entries_addsub(fa, cb)
 
 
+def _trabajo_producto(control, A, B):
+    return multiplicar_con_detalle(A, B, progreso=control.progreso)
+
+
 class TranspuestaMatrizWindow(_BaseMatrixWindow):
     def __init__(self, parent=None):
         super().__init__("Transpuesta de Matriz", parent)
@@ -581,7 +504,7 @@ class TranspuestaMatrizWindow(_BaseMatrixWindow):
     def _run(self):
         A = self._leer()
         f = len(A); c = len(A[0]) if f else 0
-        T = [[A[i][j] for i in range(f)] for j in range(c)]
+        T = Transpuesta(A)  # vista: no copia A
         pasos = []
         for i in range(f):
             for j in range(c):
@@ -594,108 +517,181 @@ class TranspuestaMatrizWindow(_BaseMatrixWindow):
         self.result_box.clear()
         self.result_box.insertPlainText("Resultado (Transpuesta)\n\n")
         self.result_box.insertPlainText("\n".join(" ".join(str(v) for v in row) for row in T) + "\n\n")
-        self.result_box.insertPlainText("Pasos detallados\n")
-        for line in pasos:
-            self.result_box.insertPlainText(line + "\n")
+        self.result_box.insertPlainText("Pasos detallados\n" + "".join(line + "\n" for line in pasos))
 
 
 class DeterminanteMatrizWindow(_BaseMatrixWindow):
     def __init__(self, parent=None):
         super().__init__("Determinante de Matriz", parent)
+        method_row = QHBoxLayout()
+        method_row.addWidget(QLabel("Método:"))
+        self.metodo_combo = QComboBox()
+        self.metodo_combo.addItem("Automático", core_det.METODO_AUTO)
+        self.metodo_combo.addItem("Cofactores (con menores reutilizados)", core_det.METODO_COFACTORES)
+        self.metodo_combo.addItem("Eliminación de Bareiss", core_det.METODO_BAREISS)
+        self.metodo_combo.addItem("Cofactores en paralelo (todos los núcleos)", core_det.METODO_COFACTORES_PARALELO)
+        method_row.addWidget(self.metodo_combo)
+        method_row.addStretch(1)
+        # Solo visible si el resultado salió de la actualización de rango uno
+        self.btn_completo = QPushButton("Ver procedimiento completo")
+        self.btn_completo.setVisible(False)
+        self.btn_completo.clicked.connect(self._run_completo)
+        method_row.addWidget(self.btn_completo)
+        self.lay.insertLayout(self.lay.count() - 1, method_row)
+        # Último cálculo en modo automático, para actualizar en O(n^2) si solo cambia una fila o columna
+        self._ultimo = UltimoCalculo()
+        self._usar_atajo = True
 
     def _run(self):
         A = self._leer()
-        det, steps = determinante_con_pasos_ascii(A)
         self.result_box.clear()
-        self.result_box.insertPlainText("Pasos detallados\n\n")
-        for s in steps:
-            self.result_box.insertPlainText(s + "\n")
-        self.result_box.insertPlainText(f"\nDeterminante: {det}\n")
+        self.btn_completo.setVisible(False)
+        self._en_segundo_plano(_trabajo_determinante, A, self.metodo_combo.currentData(), self._ultimo,
+                               self._usar_atajo, al_terminar=self._mostrar_determinante)
+
+    def _run_completo(self):
+        """Repite el cálculo sin la actualización de rango uno, con todos los pasos."""
+        self._usar_atajo = False
+        try:
+            self._run()
+        finally:
+            self._usar_atajo = True
+
+    def _mostrar_determinante(self, resultado):
+        det, steps, por_atajo = resultado
+        self.result_box.clear()
+        self.result_box.setPlainText(
+            "Pasos detallados\n\n" + "".join(s + "\n" for s in steps) + f"\nDeterminante: {det}\n"
+        )
+        self.btn_completo.setVisible(por_atajo)
+
+
+def _esperar_menores(control, futuros):
+    """Espera a los menores repartidos entre procesos avisando del progreso."""
+    pendientes = set(futuros.values())
+    try:
+        while pendientes:
+            _, pendientes = wait(pendientes, timeout=0.1)
+            control.progreso(len(futuros) - len(pendientes), len(futuros))
+    except TrabajoCancelado:
+        for futuro in pendientes:
+            futuro.cancel()
+        raise
+
+
+def _trabajo_determinante(control, A, metodo, ultimo, atajo=True):
+    """Devuelve (det, lineas, por_atajo); con atajo=False no se prueba la
+    actualización de rango uno y siempre se genera el procedimiento completo."""
+    if metodo == core_det.METODO_COFACTORES_PARALELO:
+        futuros = core_det.repartir_menores(A)
+        _esperar_menores(control, futuros)
+        det, lineas = control.recoger(core_det.pasos_determinante_paralelo(A, ascii=True, calculados=futuros))
+        return det, lineas, False
+    if metodo != core_det.METODO_AUTO:
+        pasos = pasos_por_metodo(A, metodo)
+        if pasos is None:
+            pasos = _pasos_determinante(A, ascii=True)
+        det, lineas = control.recoger(pasos)
+        return det, lineas, False
+    if atajo:
+        actualizacion = ultimo.actualizar(A, progreso=control.progreso)
+        if actualizacion is not None and actualizacion.det is not None:
+            return actualizacion.det, actualizacion.lineas, True
+    pasos = pasos_por_metodo(A, metodo)
+    if pasos is None:
+        pasos = _pasos_determinante(A, ascii=True)
+    det, lineas = control.recoger(pasos)
+    ultimo.registrar(A, det)
+    return det, lineas, False
 
 
 # LÃ³gica de determinante con el mismo formato que Tk
-def determinante_con_pasos(matrix, level: int = 0):
+def determinante_con_pasos(matrix, level: int = 0, trace: bool = True):
     # Wrapper hacia versión ASCII limpia
-    return determinante_con_pasos_ascii(matrix, level)
-
-def determinante_con_pasos_ascii(matrix, level: int = 0):
-    n = len(matrix)
-    indent = "    " * level
-    steps = []
-    sep = indent + ("-" * 70)
-
-    def fmt(x: Fraction) -> str:
-        return str(x.numerator) if isinstance(x, Fraction) and x.denominator == 1 else str(x)
-
-    def mat_lines(M, ind=""):
-        return [ind + "[ " + "  ".join(fmt(c) for c in r) + " ]" for r in M]
-
-    def is_upper(M):
-        for i in range(1, len(M)):
-            for j in range(0, i):
-                if M[i][j] != 0: return False
-        return True
-
-    def is_lower(M):
-        for i in range(len(M)):
-            for j in range(i+1, len(M)):
-                if M[i][j] != 0: return False
-        return True
-
-    def minor(M, r, c):
-        return [[M[i][j] for j in range(len(M)) if j != c] for i in range(len(M)) if i != r]
-
-    if n == 1:
-        value = matrix[0][0]
-        steps.append(f"{indent}Caso base 1x1: det(A) = {fmt(value)}")
-        return value, steps
-
-    if n == 2:
-        a11, a12 = matrix[0]
-        a21, a22 = matrix[1]
-        p1 = a11*a22; p2 = a12*a21; det = p1-p2
-        steps.append(f"{indent}Caso base 2x2:")
-        steps.extend(mat_lines(matrix, indent+"    "))
-        steps.append(f"{indent}|A| = {fmt(a11)}*{fmt(a22)} - {fmt(a12)}*{fmt(a21)}")
-        steps.append(f"{indent}    = {fmt(p1)} - {fmt(p2)}")
-        steps.append(f"{indent}    = {fmt(det)}")
-        return det, steps
-
-    if is_upper(matrix) or is_lower(matrix):
-        tipo = "superior" if is_upper(matrix) else "inferior"
-        diag = [matrix[i][i] for i in range(n)]
-        det = Fraction(1)
-        for v in diag: det *= v
-        steps.append(f"{indent}La matriz es triangular {tipo}.")
-        steps.append(f"{indent}Producto de la diagonal principal: {' * '.join(fmt(v) for v in diag)} = {fmt(det)}")
-        return det, steps
-
-    steps.append(f"{indent}Expansion por cofactores a lo largo de la primera fila")
-    steps.append(f"{indent}det(A) = " + " + ".join(f"a1{j+1}C1{j+1}" for j in range(n)))
-    contrib = []
-    for j in range(n):
-        a = matrix[0][j]
-        sgn = Fraction(1 if j%2==0 else -1)
-        steps.append(sep)
-        steps.append(f"{indent}Elemento a1{j+1} = {fmt(a)} (signo {'+' if sgn>0 else '-'})")
-        if a == 0:
-            steps.append(f"{indent}Como a1{j+1} = 0, su contribucion es nula y se omite.")
-            contrib.append(Fraction(0)); continue
-        sub = minor(matrix,0,j)
-        steps.append(f"{indent}Submatriz M1{j+1} (eliminando fila 1 y columna {j+1}):")
-        steps.extend(mat_lines(sub, indent+"    "))
-        sd, sd_steps = determinante_con_pasos_ascii(sub, level+1)
-        steps.extend(sd_steps)
-        steps.append(f"{indent}det(M1{j+1}) = {fmt(sd)}")
-        c = sgn*sd
-        steps.append(f"{indent}C1{j+1} = ({'+' if sgn>0 else '-'}1) * {fmt(sd)} = {fmt(c)}")
-        term = a*c
-        steps.append(f"{indent}Contribucion parcial: {fmt(a)} * {fmt(c)} = {fmt(term)}")
-        contrib.append(term)
-    steps.append(sep)
-    total = sum(contrib, Fraction(0))
-    steps.append(f"{indent}Suma total de contribuciones: det(A) = " + " + ".join(fmt(x) for x in contrib) + f" = {fmt(total)}")
-    return total, steps
+    return determinante_con_pasos_ascii(matrix, level, trace)
+
+def determinante_con_pasos_ascii(matrix, level: int = 0, trace: bool = True):
+    return _determinante_con_pasos(matrix, level, ascii=True, trace=trace)
+
+
+def _lineas_aumentada(Ax, Ix):
+    n = len(Ax)
+    ancho = 1
+    for i in range(n):
+        for v in Ax[i] + Ix[i]:
+            ancho = max(ancho, len(str(v)))
+    lines = []
+    for i in range(n):
+        left = " ".join(str(x).rjust(ancho) for x in Ax[i])
+        right = " ".join(str(x).rjust(ancho) for x in Ix[i])
+        lines.append(f"{left}   |   {right}")
+    return lines
+
+
+def _operacion_vertical_aug(fp, fa, f, fr):
+    # fp, fa, fr ya son filas completas (A|I) como listas
+    ancho = max(len(str(x)) for x in fr) if fr else 1
+    def fmt(lst):
+        return " ".join(str(x).rjust(ancho) for x in lst)
+    escala = [(-f) * val for val in fp]
+    factor_str = f"+{abs(f)}" if f < 0 else f"-{f}"
+    lines = [
+        f"{factor_str}R : {fmt(escala)}",
+        f"+R        : {fmt(fa)}",
+        " " * 10 + "-" * (ancho * len(fr) + len(fr) - 1),
+        f"=R        : {fmt(fr)}",
+    ]
+    return lines
+
+
+def _trabajo_inversa_gj(control, Aw, ultimo, atajo=True):
+    """Gauss-Jordan sobre [A | I] y texto de sus pasos (se ejecuta en segundo plano).
+
+    Con atajo, si A solo cambió en una fila o columna desde el cálculo anterior
+    y sigue siendo invertible, la inversa sale de Sherman-Morrison en O(n^2);
+    el último elemento del resultado indica si fue así."""
+    n = len(Aw)
+    if atajo:
+        actualizacion = ultimo.actualizar(Aw, progreso=control.progreso)
+        if actualizacion is not None and actualizacion.inversa is not None:
+            identidad = [[Fraction(1 if i == j else 0) for j in range(n)] for i in range(n)]
+            texto = "\n".join(actualizacion.lineas) + "\n\n"
+            return identidad, actualizacion.inversa, list(range(n)), texto, True
+    A = [fila[:] for fila in Aw]
+    Aw, Iw, pivot_cols, pasos = inversa_gauss_jordan(Aw, progreso=control.progreso)
+    if len(pivot_cols) == n:
+        ultimo.registrar(A, inversa=Iw)
+    else:
+        ultimo.olvidar()
+    partes = []
+    for paso in pasos:
+        control.comprobar()
+        partes.append("Operación: ")
+        fila = paso["fila"]
+        if paso["tipo"] == "intercambio":
+            partes.append(f"R{fila+1} \u2194 R{paso['otra']+1}\n\n")
+        elif paso["tipo"] == "escala":
+            partes.append(f"R{fila+1} \u2192 R{fila+1}/{paso['valor']}\n\n")
+        else:
+            partes.append(f"R{fila+1} \u2192 R{fila+1} - ({paso['valor']})R{paso['fila_pivote']+1}\n\n")
+        right_lines = _lineas_aumentada(paso["A"], paso["I"])
+        if paso["tipo"] != "eliminacion":
+            for ln in right_lines:
+                partes.append(ln + "\n")
+        else:
+            fr = paso["A"][fila] + paso["I"][fila]
+            left_lines = _operacion_vertical_aug(paso["pivote"], paso["antes"], paso["valor"], fr)
+            max_left = max(len(s) for s in left_lines) if left_lines else 0
+            sep = "   |   "
+            max_len = max(len(left_lines), len(right_lines))
+            for i in range(max_len):
+                l = left_lines[i] if i < len(left_lines) else ""
+                rr = right_lines[i] if i < len(right_lines) else ""
+                partes.append(l.ljust(max_left) + (sep if rr else "") + rr + "\n")
+        partes.append("\n" + ("-" * 110) + "\n\n")
+    return Aw, Iw, pivot_cols, "".join(partes), False
+
+
 class InversaMatrizWindow(_BaseMatrixWindow):
     def __init__(self, parent=None):
         super().__init__("Inversa de Matriz", parent)
@@ -710,6 +706,11 @@ class InversaMatrizWindow(_BaseMatrixWindow):
         method_row.addStretch(1)
         self.cb_anim = QCheckBox("Animar paso a paso")
         method_row.addWidget(self.cb_anim)
+        # Solo visible si la inversa salió de Sherman-Morrison
+        self.btn_completo = QPushButton("Ver pasos de Gauss-Jordan")
+        self.btn_completo.setVisible(False)
+        self.btn_completo.clicked.connect(self._run_completo)
+        method_row.addWidget(self.btn_completo)
         # Insertar el row antes del resultado (result_box está al final); lo insertamos
         # en la posición anterior al último widget para que aparezca sobre el resultado.
         self.lay.insertLayout(self.lay.count() - 1, method_row)
@@ -719,27 +720,22 @@ class InversaMatrizWindow(_BaseMatrixWindow):
         self.visual_frame.setLayout(QHBoxLayout())
         self.visual_frame.layout().setSpacing(18)
         self.lay.insertWidget(self.lay.count() - 1, self.visual_frame)
+        # Último cálculo Gauss-Jordan, para actualizar en O(n^2) si solo cambia una fila o columna
+        self._ultimo = UltimoCalculo()
+        self._usar_atajo = True
 
     def _setup_entries(self):
         # Fuerza matriz cuadrada: usa filas para columnas
-        for i in reversed(range(self.grid.count())):
-            w = self.grid.itemAt(i).widget()
-            if w: w.setParent(None)
         n = int(self.f_edit.text())
         self.c_edit.setText(str(n))
-        self.entries = []
-        g = QGridLayout(); g.setHorizontalSpacing(6); g.setVerticalSpacing(6)
-        box = QFrame(); box.setLayout(g)
-        self.grid.addWidget(QLabel("Matriz A (nÃ—n)"), 0, 0, alignment=Qt.AlignHCenter)
-        self.grid.addWidget(box, 1, 0)
-        for i in range(n):
-            row = []
-            for j in range(n):
-                e = QLineEdit(); e.setAlignment(Qt.AlignCenter); e.setPlaceholderText("0")
-                g.addWidget(e, i, j)
-                row.append(e)
-            self.entries.append(row)
-        self.btn_run.setEnabled(True)
+        self._crear_tablas([("Matriz A (nÃ—n)", n, n)])
+
+    def _limpiar_visuales(self):
+        lay = self.visual_frame.layout()
+        for i in reversed(range(lay.count())):
+            w = lay.itemAt(i).widget()
+            if w:
+                w.setParent(None)
 
     def _run(self):
         A = self._leer()
@@ -751,192 +747,54 @@ class InversaMatrizWindow(_BaseMatrixWindow):
         Aw = [[_parse_fraction(str(x)) for x in row] for row in A]
         Iw = [[Fraction(1 if i == j else 0) for j in range(n)] for i in range(n)]
 
-        def augmented_lines(Ax, Ix):
-            ancho = 1
-            for i in range(n):
-                for v in Ax[i] + Ix[i]:
-                    ancho = max(ancho, len(str(v)))
-            lines = []
-            for i in range(n):
-                left = " ".join(str(x).rjust(ancho) for x in Ax[i])
-                right = " ".join(str(x).rjust(ancho) for x in Ix[i])
-                lines.append(f"{left}   |   {right}")
-            return lines
-
-        def operacion_vertical_aug(fp, fa, f, fr):
-            # fp, fa, fr ya son filas completas (A|I) como listas
-            ancho = max(len(str(x)) for x in fr) if fr else 1
-            def fmt(lst):
-                return " ".join(str(x).rjust(ancho) for x in lst)
-            escala = [(-f) * val for val in fp]
-            factor_str = f"+{abs(f)}" if f < 0 else f"-{f}"
-            lines = [
-                f"{factor_str}R : {fmt(escala)}",
-                f"+R        : {fmt(fa)}",
-                " " * 10 + "-" * (ancho * len(fr) + len(fr) - 1),
-                f"=R        : {fmt(fr)}",
-            ]
-            return lines
+        self._limpiar_visuales()
+        self.result_box.clear()
+        self.btn_completo.setVisible(False)
 
-        # helper: limpiar visuales y resultado
-        def _clear_visuals():
-            lay = self.visual_frame.layout()
-            for i in reversed(range(lay.count())):
-                w = lay.itemAt(i).widget()
-                if w:
-                    w.setParent(None)
+        # Adjunta solo si se eligió explícitamente y n <= 3 (cálculo inmediato)
+        if self.rb_adj.isChecked() and n <= 3:
+            self._inversa_adjunta(Aw)
+            return
 
-        _clear_visuals()
-        self.result_box.clear()
+        # Mostrar la matriz aumentada inicial [A | I]
+        box_start = QFrame(); box_start.setLayout(QVBoxLayout())
+        box_start.layout().addWidget(QLabel("Matriz aumentada [A | I]:"))
+        h = QHBoxLayout()
+        h.addWidget(_matrix_widget(self, Aw))
+        h.addWidget(_matrix_widget(self, Iw))
+        box_start.layout().addLayout(h)
+        self.visual_frame.layout().addWidget(box_start)
+
+        # Gauss-Jordan (y el texto de sus pasos) fuera del hilo de la interfaz; al
+        # animar se quieren todos los pasos, así que no se prueba Sherman-Morrison
+        atajo = self._usar_atajo and not self.cb_anim.isChecked()
+        self._en_segundo_plano(_trabajo_inversa_gj, Aw, self._ultimo, atajo, al_terminar=self._mostrar_inversa_gj)
+
+    def _run_completo(self):
+        """Repite el cálculo por Gauss-Jordan aunque valga Sherman-Morrison."""
+        self._usar_atajo = False
+        try:
+            self._run()
+        finally:
+            self._usar_atajo = True
 
-        # RREF helper (copiado y adaptado de la versión Tk)
-        def rref_info(A_matrix):
-            M = [row[:] for row in A_matrix]
-            rows = len(M); cols = len(M[0]) if rows else 0
-            row = 0
-            piv_cols = []
-            for col in range(cols):
-                if row >= rows:
-                    break
-                piv = None
-                for r in range(row, rows):
-                    if M[r][col] != 0:
-                        piv = r; break
-                if piv is None:
-                    continue
-                if piv != row:
-                    M[row], M[piv] = M[piv], M[row]
-                a = M[row][col]
-                if a != 1:
-                    M[row] = [v / a for v in M[row]]
-                for r in range(rows):
-                    if r == row: continue
-                    f = M[r][col]
-                    if f != 0:
-                        M[r] = [M[r][j] - f * M[row][j] for j in range(cols)]
-                piv_cols.append(col)
-                row += 1
-            free_cols = [j for j in range(cols) if j not in piv_cols]
-            return M, piv_cols, free_cols
-
-        def explain_cde(A_matrix):
-            R, piv_cols, free_cols = rref_info(A_matrix)
-            lines = []
-            lines.append("Comprobación de invertibilidad (c, d, e):")
-            lines.append("")
-            lines.append("RREF de A:")
-            if R:
-                maxw = max(len(str(v)) for fila in R for v in fila)
-                for fila in R:
-                    lines.append(" ".join(str(v).rjust(maxw) for v in fila))
-            lines.append("")
-            nA = len(A_matrix)
-            if len(piv_cols) != nA:
-                lines.append(f"- (c) No tiene n posiciones pivote: {len(piv_cols)} de {nA}.")
-            else:
-                lines.append(f"- (c) Tiene n posiciones pivote: {len(piv_cols)} de {nA}.")
-            if free_cols:
-                j0 = free_cols[0]
-                x = [Fraction(0) for _ in range(nA)]
-                x[j0] = Fraction(1)
-                for r, pc in enumerate(piv_cols):
-                    if j0 < len(R[0]):
-                        x[pc] = -R[r][j0]
-                lines.append("")
-                lines.append("- (d) Existe solución no trivial para Ax = 0. Ejemplo:")
-                lines.append("x = [ " + ", ".join(str(v) for v in x) + " ]^t")
-                lines.append("")
-                lines.append("- (e) Por consiguiente, las columnas de A son linealmente dependientes (no LI).")
-            else:
-                lines.append("")
-                lines.append("- (d) Ax=0 solo tiene la solución trivial.")
-                lines.append("- (e) Las columnas de A son linealmente independientes.")
-            return lines
+    def _mostrar_inversa_gj(self, resultado):
+        Aw, Iw, pivot_cols, texto_pasos, por_atajo = resultado
+        n = len(Aw)
+        self.result_box.insertPlainText(texto_pasos)
+        self.btn_completo.setVisible(por_atajo)
 
         def explain_cde_text(A_matrix):
             """Return a single string with the explanation lines joined for message boxes."""
-            return "\n".join(explain_cde(A_matrix))
-
-        # Ejecutar Gauss-Jordan solo si no se eligió explícitamente el método Adjunta
-        pivot_cols = []
-        if not (self.rb_adj.isChecked() and n <= 3):
-            # Mostrar la matriz aumentada inicial [A | I]
-            _clear_visuals()
-            box_start = QFrame(); box_start.setLayout(QVBoxLayout())
-            box_start.layout().addWidget(QLabel("Matriz aumentada [A | I]:"))
-            h = QHBoxLayout()
-            h.addWidget(_matrix_widget(self, Aw))
-            h.addWidget(_matrix_widget(self, Iw))
-            box_start.layout().addLayout(h)
-            self.visual_frame.layout().addWidget(box_start)
-
-            fila_pivote = 0
-            for col in range(n):
-                piv = None
-                for r in range(fila_pivote, n):
-                    if Aw[r][col] != 0:
-                        piv = r; break
-                if piv is None:
-                    continue
-                if piv != fila_pivote:
-                    Aw[fila_pivote], Aw[piv] = Aw[piv], Aw[fila_pivote]
-                    Iw[fila_pivote], Iw[piv] = Iw[piv], Iw[fila_pivote]
-                    self.result_box.insertPlainText("Operación: ")
-                    self.result_box.insertPlainText(f"R{fila_pivote+1} \u2194 R{piv+1}\n\n")
-                    for ln in augmented_lines(Aw, Iw):
-                        self.result_box.insertPlainText(ln + "\n")
-                    self.result_box.insertPlainText("\n" + ("-" * 110) + "\n\n")
-
-                a = Aw[fila_pivote][col]
-                if a == 0:
-                    fila_pivote += 1
-                    if fila_pivote >= n:
-                        break
-                    continue
-                if a != 1:
-                    Aw[fila_pivote] = [v / a for v in Aw[fila_pivote]]
-                    Iw[fila_pivote] = [v / a for v in Iw[fila_pivote]]
-                    self.result_box.insertPlainText("Operación: ")
-                    self.result_box.insertPlainText(f"R{fila_pivote+1} \u2192 R{fila_pivote+1}/{a}\n\n")
-                    for ln in augmented_lines(Aw, Iw):
-                        self.result_box.insertPlainText(ln + "\n")
-                    self.result_box.insertPlainText("\n" + ("-" * 110) + "\n\n")
-
-                for r in range(n):
-                    if r == fila_pivote: continue
-                    f = Aw[r][col]
-                    if f == 0: continue
-                    origA = Aw[r][:]; origI = Iw[r][:]
-                    pivA = Aw[fila_pivote][:]; pivI = Iw[fila_pivote][:]
-                    Aw[r] = [origA[j] - f * pivA[j] for j in range(n)]
-                    Iw[r] = [origI[j] - f * pivI[j] for j in range(n)]
-                    fp = pivA + pivI
-                    fa = origA + origI
-                    fr = Aw[r] + Iw[r]
-                    left_lines = operacion_vertical_aug(fp, fa, f, fr)
-                    right_lines = augmented_lines(Aw, Iw)
-                    self.result_box.insertPlainText("Operación: ")
-                    self.result_box.insertPlainText(f"R{r+1} \u2192 R{r+1} - ({f})R{fila_pivote+1}\n\n")
-                    max_left = max(len(s) for s in left_lines) if left_lines else 0
-                    sep = "   |   "
-                    max_len = max(len(left_lines), len(right_lines))
-                    for i in range(max_len):
-                        l = left_lines[i] if i < len(left_lines) else ""
-                        rr = right_lines[i] if i < len(right_lines) else ""
-                        self.result_box.insertPlainText(l.ljust(max_left) + (sep if rr else "") + rr + "\n")
-                    self.result_box.insertPlainText("\n" + ("-" * 110) + "\n\n")
-
-                pivot_cols.append(col)
-                fila_pivote += 1
-                if fila_pivote >= n: break
-
-        # Determinar si hay n pivotes (nota: si se saltó GJ, pivot_cols estará vacío)
+            return "\n".join(explicar_invertibilidad(A_matrix))
+
+        # Determinar si hay n pivotes
         invertible_by_piv = (len(pivot_cols) == n)
 
-        # Si Gauss-Jordan se ejecutó y la matriz es invertible, mostrar visualmente
+        # Si la matriz es invertible, mostrar visualmente
         # la transformación final [I | A^-1] de forma ordenada en la interfaz.
-        if not (self.rb_adj.isChecked() and n <= 3) and invertible_by_piv:
-            _clear_visuals()
+        if invertible_by_piv:
+            self._limpiar_visuales()
             box_final_left = QFrame(); box_final_left.setLayout(QVBoxLayout())
             box_final_left.layout().addWidget(QLabel("Matriz Identidad(I):"))
             box_final_left.layout().addWidget(_matrix_widget(self, Aw))
@@ -947,188 +805,20 @@ class InversaMatrizWindow(_BaseMatrixWindow):
             self.visual_frame.layout().addWidget(box_final_right)
             # También añadir una sección textual final en el recuadro de pasos
             self.result_box.insertPlainText("\nMatriz aumentada final [I | A^-1]:\n")
-            for ln in augmented_lines(Aw, Iw):
+            for ln in _lineas_aumentada(Aw, Iw):
                 self.result_box.insertPlainText(ln + "\n")
 
-        # Si Gauss-Jordan se ejecutó (pivot_cols no vacío) y no es invertible, mostrar diálogo
+        # Si Gauss-Jordan encontró pivotes pero no n, mostrar diálogo
         if pivot_cols and len(pivot_cols) != n:
             # Construir mensaje explicativo usando las reglas c/d/e
             expl = explain_cde_text(Aw)
             QMessageBox.critical(self, "Sin inversa (Gauss-Jordan)", "La matriz no es invertible.\n\n" + expl)
             # Además anexar la explicación al cuadro de pasos para evidencia
             self.result_box.insertPlainText("\n" + expl + "\n")
-            # Si se llegó aquí por elegir Adjunta pero n>3, no return — dejar que flujo continúe.
-            # Si se llegó por GJ deliberado, no continuar con adjunta mostrando matrices.
-            if not (self.rb_adj.isChecked() and n <= 3):
-                return
+            return
 
-        # Si el usuario eligió adjunta y la dimensión es adecuada, usar adjunta
         if self.rb_adj.isChecked():
-            if n > 3:
-                QMessageBox.information(self, "Info", "Adjunta solo disponible para n ≤ 3. Usando Gauss-Jordan.")
-            else:
-                # Calcular determinante
-                det, det_steps = determinante_con_pasos_ascii(Aw)
-
-                # Helper para submatrices
-                def minor(M, r, c):
-                    return [[M[i][j] for j in range(len(M)) if j != c] for i in range(len(M)) if i != r]
-
-                # Helper para formatear submatrices en varias líneas
-                def format_submatrix(M):
-                    if not M:
-                        return "[]"
-                    rows = ["[" + ", ".join(str(x) for x in r) + "]" for r in M]
-                    if len(rows) == 1:
-                        return "[" + rows[0] + "]"
-                    return "[" + ",\n           ".join(rows) + "]"
-
-                # Mostrar el procedimiento del determinante de forma ordenada (expansión por cofactores
-                # en la primera fila). Si resulta 0, NO se muestran matrices, sólo este procedimiento
-                # y un mensaje claro al usuario.
-                self.result_box.insertPlainText("1) Cálculo del determinante |A|\n")
-                self.result_box.insertPlainText("Expansión por cofactores en la primera fila:\n\n")
-
-                # Para cada elemento de la primera fila mostrar su menor y el valor del cofactor
-                first_row_contribs = []
-                for j in range(n):
-                    sub = minor(Aw, 0, j)
-                    sub_det, _ = determinante_con_pasos_ascii(sub)
-                    sign = 1 if (j % 2 == 0) else -1
-                    cofactor = Fraction(sign) * sub_det
-
-                    # Formatear submatriz en bloque alineado (cada fila en su propia línea)
-                    sub_rows = ["[" + ", ".join(str(x) for x in r) + "]" for r in sub]
-                    if len(sub_rows) == 1:
-                        sub_block = sub_rows[0]
-                        self.result_box.insertPlainText(
-                            f"M1{j+1} = det({sub_block}) = {sub_det}   →  C1{j+1} = ({'+' if sign>0 else '-'})·{sub_det} = {cofactor}\n\n"
-                        )
-                    else:
-                        sub_block = "[\n" + "\n".join("    " + r for r in sub_rows) + "\n]"
-                        self.result_box.insertPlainText(
-                            f"M1{j+1} = det({sub_block}) = {sub_det}   →  C1{j+1} = ({'+' if sign>0 else '-'})·{sub_det} = {cofactor}\n\n"
-                        )
-
-                    first_row_contribs.append((Aw[0][j], cofactor))
-
-                # Fórmula por cofactores y evaluación
-                terms = " + ".join(f"a1{j+1}·C1{j+1}" for j in range(n))
-                self.result_box.insertPlainText("|A| = " + terms + "\n")
-                eval_terms = " + ".join(f"({Aw[0][j]})({first_row_contribs[j][1]})" for j in range(n))
-                self.result_box.insertPlainText("    = " + eval_terms + "\n")
-                total = sum(Aw[0][j] * first_row_contribs[j][1] for j in range(n))
-                self.result_box.insertPlainText(f"    = {total}\n\n")
-
-                # Si el determinante es cero, mostrar mensaje crítico y un bloque de conclusión
-                if total == 0:
-                    QMessageBox.critical(self, "Sin inversa", "La matriz no es invertible porque su determinante es 0.")
-                    # Mensaje final con formato claro y alineado
-                    self.result_box.insertPlainText("Resultado:\n\n")
-                    self.result_box.insertPlainText("El determinante de la matriz es 0.\n\n")
-                    self.result_box.insertPlainText("Esto significa que la matriz no es invertible,\n")
-                    self.result_box.insertPlainText("ya que su determinante es igual a cero.\n\n")
-                    self.result_box.insertPlainText("Por lo tanto, no existe la matriz inversa A^-1.\n\n")
-                    # además mostrar la explicación c/d/e en el recuadro para aportar evidencia adicional
-                    for l in explain_cde(Aw):
-                        self.result_box.insertPlainText(l + "\n")
-                    return
-
-                # Si det != 0, entonces construir cofactores y adjunta
-                cof = [[None for _ in range(n)] for __ in range(n)]
-                for i in range(n):
-                    for j in range(n):
-                        sub = minor(Aw, i, j)
-                        sub_det, _ = determinante_con_pasos(sub)
-                        cof[i][j] = Fraction((1 if ((i + j) % 2 == 0) else -1)) * sub_det
-
-                # adjunta = transpuesta de cofactores
-                adj = [[cof[j][i] for j in range(n)] for i in range(n)]
-
-                # Mostrar visualmente: A, Adj(A), A^{-1}
-                _clear_visuals()
-                boxA = QFrame(); boxA.setLayout(QVBoxLayout())
-                boxA.layout().addWidget(QLabel("Matriz A:"))
-                boxA.layout().addWidget(_matrix_widget(self, Aw))
-                boxAdj = QFrame(); boxAdj.setLayout(QVBoxLayout())
-                boxAdj.layout().addWidget(QLabel("Adj(A) (transpuesta de la matriz de cofactores):"))
-                boxAdj.layout().addWidget(_matrix_widget(self, adj))
-
-                # preparar contenedor para la inversa
-                boxInv = QFrame(); boxInv.setLayout(QVBoxLayout())
-                boxInv.layout().addWidget(QLabel("A^{-1} (inversa):"))
-
-                self.visual_frame.layout().addWidget(boxA)
-                self.visual_frame.layout().addWidget(boxAdj)
-                self.visual_frame.layout().addWidget(boxInv)
-
-                # Formato mejorado y legible del recuadro de pasos
-                # 1) Cálculo del determinante |A| por expansión por cofactores en la primera fila
-                self.result_box.insertPlainText("1) Calculo del determinante |A|\n")
-                self.result_box.insertPlainText("Expansión por cofactores en la primera fila:\n\n")
-                # Listar M1j y C1j para j=1..n con espacios y saltos claros
-                for j in range(n):
-                    sub = minor(Aw, 0, j)
-                    sub_det, sub_steps = determinante_con_pasos_ascii(sub)
-                    sign = 1 if (j % 2 == 0) else -1
-                    sub_fmt = format_submatrix(sub)
-                    self.result_box.insertPlainText(f"M1{j+1} = det({sub_fmt}) = {sub_det}\n")
-                    # añadir una línea con flecha → C1j
-                    self.result_box.insertPlainText(f"    -> C1{j+1} = ({'+' if sign>0 else '-'})·{sub_det} = {Fraction(sign)*sub_det}\n\n")
-
-                # fórmula del determinante por cofactores (primera fila) y evaluación
-                terms = " + ".join(f"a1{j+1}·C1{j+1}" for j in range(n))
-                self.result_box.insertPlainText("|A| = " + terms + "\n")
-                eval_terms = " + ".join(f"({Aw[0][j]})({Fraction(cof[0][j])})" for j in range(n))
-                self.result_box.insertPlainText("    = " + eval_terms + "\n")
-                total = sum(Aw[0][j] * cof[0][j] for j in range(n))
-                self.result_box.insertPlainText(f"    = {total}\n\n")
-
-                # Si el determinante es cero, informar y mostrar el diálogo de error.
-                if total == 0:
-                    QMessageBox.critical(self, "Sin inversa", "La matriz no es invertible porque su determinante es 0.")
-                    # Ya mostramos el procedimiento del determinante arriba; terminar.
-                    return
-
-                # 2) Matriz de cofactores de A (tabla compacta)
-                self.result_box.insertPlainText("2) Matriz de cofactores de A\n")
-                sep = "-" * 75
-                self.result_box.insertPlainText(sep + "\n")
-                self.result_box.insertPlainText("| Posición |       M_ij (submatriz)       | det(M_ij) |  C_ij  |\n")
-                self.result_box.insertPlainText(sep + "\n")
-                for i in range(n):
-                    for j in range(n):
-                        sub = minor(Aw, i, j)
-                        sub_det, _ = determinante_con_pasos_ascii(sub)
-                        cij = cof[i][j]
-                        sub_str = format_submatrix(sub)
-                        # separar visualmente cada fila
-                        self.result_box.insertPlainText(f"| C{i+1}{j+1} | {sub_str:<30} | {str(sub_det):>8} | {str(cij):>6} |\n")
-
-                # 3) Matriz Adjunta
-                self.result_box.insertPlainText("3) Matriz Adjunta\n")
-                self.result_box.insertPlainText("Adj(A) = (Cof(A))^T  (traspuesta de la matriz de cofactores)\n\n")
-                for ln in (" ".join(str(v) for v in row) for row in adj):
-                    self.result_box.insertPlainText(ln + "\n")
-                self.result_box.insertPlainText("\n")
-
-                # 4) Cálculo de la inversa (det != 0 en este punto)
-                inv = [[adj[i][j] / total for j in range(n)] for i in range(n)]
-                # Mostrar resultado numérico y visual
-                boxInv.layout().addWidget(_matrix_widget(self, inv))
-                self.visual_frame.layout().addWidget(boxInv)
-                self.result_box.insertPlainText("4) Cálculo de la inversa\n")
-                self.result_box.insertPlainText(f"Como |A| = {total},\nA^-1 = (1 / |A|) · Adj(A)\n")
-                self.result_box.insertPlainText(f"A^-1 = (1 / {total}) · Adj(A)\n\n")
-                self.result_box.insertPlainText("A^-1 =\n")
-                for ln in (" ".join(str(v) for v in row) for row in inv):
-                    self.result_box.insertPlainText(ln + "\n")
-
-                # Conclusión (comprobación c/d/e)
-                self.result_box.insertPlainText("\nConclusión: la matriz es invertible y la inversa se ha calculado como arriba.\n\n")
-                for l in explain_cde(Aw):
-                    self.result_box.insertPlainText(l + "\n")
-                return
+            QMessageBox.information(self, "Info", "Adjunta solo disponible para n ≤ 3. Usando Gauss-Jordan.")
 
         # Si llegamos aquí, proceder con Gauss-Jordan (sea por selección o por limitación de adjunta)
         if not self.cb_anim.isChecked():
@@ -1138,7 +828,7 @@ class InversaMatrizWindow(_BaseMatrixWindow):
         if not invertible_by_piv:
             # Mostrar pasos (ya se hicieron) y justificar con c/d/e
             self.result_box.insertPlainText("\nLa matriz no es invertible (no se encontraron n pivotes).\n\n")
-            for l in explain_cde(Aw):
+            for l in explicar_invertibilidad(Aw):
                 self.result_box.insertPlainText(l + "\n")
             return
 
@@ -1147,11 +837,169 @@ class InversaMatrizWindow(_BaseMatrixWindow):
         self.result_box.insertPlainText("\n".join(" ".join(str(v) for v in row) for row in Iw) + "\n")
         # mensaje final: es invertible y por qué
         self.result_box.insertPlainText("\nConclusión: La matriz es invertible porque:\n")
-        for l in explain_cde(Aw):
+        for l in explicar_invertibilidad(Aw):
             self.result_box.insertPlainText(l + "\n")
 
+    def _inversa_adjunta(self, Aw):
+        n = len(Aw)
+        # Calcular determinante
+        det, det_steps = determinante_con_pasos_ascii(Aw)
+
+        # Helper para submatrices
+        def minor(M, r, c):
+            return [[M[i][j] for j in range(len(M)) if j != c] for i in range(len(M)) if i != r]
+
+        # Helper para formatear submatrices en varias líneas
+        def format_submatrix(M):
+            if not M:
+                return "[]"
+            rows = ["[" + ", ".join(str(x) for x in r) + "]" for r in M]
+            if len(rows) == 1:
+                return "[" + rows[0] + "]"
+            return "[" + ",\n           ".join(rows) + "]"
+
+        # Mostrar el procedimiento del determinante de forma ordenada (expansión por cofactores
+        # en la primera fila). Si resulta 0, NO se muestran matrices, sólo este procedimiento
+        # y un mensaje claro al usuario.
+        self.result_box.insertPlainText("1) Cálculo del determinante |A|\n")
+        self.result_box.insertPlainText("Expansión por cofactores en la primera fila:\n\n")
+
+        # Para cada elemento de la primera fila mostrar su menor y el valor del cofactor
+        first_row_contribs = []
+        for j in range(n):
+            sub = minor(Aw, 0, j)
+            sub_det, _ = determinante_con_pasos_ascii(sub, trace=False)
+            sign = 1 if (j % 2 == 0) else -1
+            cofactor = Fraction(sign) * sub_det
+
+            # Formatear submatriz en bloque alineado (cada fila en su propia línea)
+            sub_rows = ["[" + ", ".join(str(x) for x in r) + "]" for r in sub]
+            if len(sub_rows) == 1:
+                sub_block = sub_rows[0]
+                self.result_box.insertPlainText(
+                    f"M1{j+1} = det({sub_block}) = {sub_det}   →  C1{j+1} = ({'+' if sign>0 else '-'})·{sub_det} = {cofactor}\n\n"
+                )
+            else:
+                sub_block = "[\n" + "\n".join("    " + r for r in sub_rows) + "\n]"
+                self.result_box.insertPlainText(
+                    f"M1{j+1} = det({sub_block}) = {sub_det}   →  C1{j+1} = ({'+' if sign>0 else '-'})·{sub_det} = {cofactor}\n\n"
+                )
+
+            first_row_contribs.append((Aw[0][j], cofactor))
+
+        # Fórmula por cofactores y evaluación
+        terms = " + ".join(f"a1{j+1}·C1{j+1}" for j in range(n))
+        self.result_box.insertPlainText("|A| = " + terms + "\n")
+        eval_terms = " + ".join(f"({Aw[0][j]})({first_row_contribs[j][1]})" for j in range(n))
+        self.result_box.insertPlainText("    = " + eval_terms + "\n")
+        total = sum(Aw[0][j] * first_row_contribs[j][1] for j in range(n))
+        self.result_box.insertPlainText(f"    = {total}\n\n")
+
+        # Si el determinante es cero, mostrar mensaje crítico y un bloque de conclusión
+        if total == 0:
+            QMessageBox.critical(self, "Sin inversa", "La matriz no es invertible porque su determinante es 0.")
+            # Mensaje final con formato claro y alineado
+            self.result_box.insertPlainText("Resultado:\n\n")
+            self.result_box.insertPlainText("El determinante de la matriz es 0.\n\n")
+            self.result_box.insertPlainText("Esto significa que la matriz no es invertible,\n")
+            self.result_box.insertPlainText("ya que su determinante es igual a cero.\n\n")
+            self.result_box.insertPlainText("Por lo tanto, no existe la matriz inversa A^-1.\n\n")
+            # además mostrar la explicación c/d/e en el recuadro para aportar evidencia adicional
+            for l in explicar_invertibilidad(Aw):
+                self.result_box.insertPlainText(l + "\n")
+            return
 
+        # Si det != 0, entonces construir cofactores y adjunta
+        cof = [[None for _ in range(n)] for __ in range(n)]
+        for i in range(n):
+            for j in range(n):
+                sub = minor(Aw, i, j)
+                sub_det, _ = determinante_con_pasos(sub, trace=False)
+                cof[i][j] = Fraction((1 if ((i + j) % 2 == 0) else -1)) * sub_det
+
+        # adjunta = transpuesta de cofactores
+        adj = [[cof[j][i] for j in range(n)] for i in range(n)]
+
+        # Mostrar visualmente: A, Adj(A), A^{-1}
+        self._limpiar_visuales()
+        boxA = QFrame(); boxA.setLayout(QVBoxLayout())
+        boxA.layout().addWidget(QLabel("Matriz A:"))
+        boxA.layout().addWidget(_matrix_widget(self, Aw))
+        boxAdj = QFrame(); boxAdj.setLayout(QVBoxLayout())
+        boxAdj.layout().addWidget(QLabel("Adj(A) (transpuesta de la matriz de cofactores):"))
+        boxAdj.layout().addWidget(_matrix_widget(self, adj))
+
+        # preparar contenedor para la inversa
+        boxInv = QFrame(); boxInv.setLayout(QVBoxLayout())
+        boxInv.layout().addWidget(QLabel("A^{-1} (inversa):"))
+
+        self.visual_frame.layout().addWidget(boxA)
+        self.visual_frame.layout().addWidget(boxAdj)
+        self.visual_frame.layout().addWidget(boxInv)
+
+        # Formato mejorado y legible del recuadro de pasos
+        # 1) Cálculo del determinante |A| por expansión por cofactores en la primera fila
+        self.result_box.insertPlainText("1) Calculo del determinante |A|\n")
+        self.result_box.insertPlainText("Expansión por cofactores en la primera fila:\n\n")
+        # Listar M1j y C1j para j=1..n con espacios y saltos claros
+        for j in range(n):
+            sub = minor(Aw, 0, j)
+            sub_det, _ = determinante_con_pasos_ascii(sub, trace=False)
+            sign = 1 if (j % 2 == 0) else -1
+            sub_fmt = format_submatrix(sub)
+            self.result_box.insertPlainText(f"M1{j+1} = det({sub_fmt}) = {sub_det}\n")
+            # añadir una línea con flecha → C1j
+            self.result_box.insertPlainText(f"    -> C1{j+1} = ({'+' if sign>0 else '-'})·{sub_det} = {Fraction(sign)*sub_det}\n\n")
+
+        # fórmula del determinante por cofactores (primera fila) y evaluación
+        terms = " + ".join(f"a1{j+1}·C1{j+1}" for j in range(n))
+        self.result_box.insertPlainText("|A| = " + terms + "\n")
+        eval_terms = " + ".join(f"({Aw[0][j]})({Fraction(cof[0][j])})" for j in range(n))
+        self.result_box.insertPlainText("    = " + eval_terms + "\n")
+        total = sum(Aw[0][j] * cof[0][j] for j in range(n))
+        self.result_box.insertPlainText(f"    = {total}\n\n")
+
+        # Si el determinante es cero, informar y mostrar el diálogo de error.
+        if total == 0:
+            QMessageBox.critical(self, "Sin inversa", "La matriz no es invertible porque su determinante es 0.")
+            # Ya mostramos el procedimiento del determinante arriba; terminar.
+            return
 
+        # 2) Matriz de cofactores de A (tabla compacta)
+        self.result_box.insertPlainText("2) Matriz de cofactores de A\n")
+        sep = "-" * 75
+        self.result_box.insertPlainText(sep + "\n")
+        self.result_box.insertPlainText("| Posición |       M_ij (submatriz)       | det(M_ij) |  C_ij  |\n")
+        self.result_box.insertPlainText(sep + "\n")
+        for i in range(n):
+            for j in range(n):
+                sub = minor(Aw, i, j)
+                sub_det, _ = determinante_con_pasos_ascii(sub, trace=False)
+                cij = cof[i][j]
+                sub_str = format_submatrix(sub)
+                # separar visualmente cada fila
+                self.result_box.insertPlainText(f"| C{i+1}{j+1} | {sub_str:<30} | {str(sub_det):>8} | {str(cij):>6} |\n")
+
+        # 3) Matriz Adjunta
+        self.result_box.insertPlainText("3) Matriz Adjunta\n")
+        self.result_box.insertPlainText("Adj(A) = (Cof(A))^T  (traspuesta de la matriz de cofactores)\n\n")
+        for ln in (" ".join(str(v) for v in row) for row in adj):
+            self.result_box.insertPlainText(ln + "\n")
+        self.result_box.insertPlainText("\n")
 
+        # 4) Cálculo de la inversa (det != 0 en este punto)
+        inv = [[adj[i][j] / total for j in range(n)] for i in range(n)]
+        # Mostrar resultado numérico y visual
+        boxInv.layout().addWidget(_matrix_widget(self, inv))
+        self.visual_frame.layout().addWidget(boxInv)
+        self.result_box.insertPlainText("4) Cálculo de la inversa\n")
+        self.result_box.insertPlainText(f"Como |A| = {total},\nA^-1 = (1 / |A|) · Adj(A)\n")
+        self.result_box.insertPlainText(f"A^-1 = (1 / {total}) · Adj(A)\n\n")
+        self.result_box.insertPlainText("A^-1 =\n")
+        for ln in (" ".join(str(v) for v in row) for row in inv):
+            self.result_box.insertPlainText(ln + "\n")
 
-
+        # Conclusión (comprobación c/d/e)
+        self.result_box.insertPlainText("\nConclusión: la matriz es invertible y la inversa se ha calculado como arriba.\n\n")
+        for l in explicar_invertibilidad(Aw):
+            self.result_box.insertPlainText(l + "\n")
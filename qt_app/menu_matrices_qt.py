@@ -10,6 +10,7 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, QSize
 from .theme import install_toggle_shortcut
 from .settings_qt import open_settings_dialog
+from .ventanas_qt import abrir_ventana
 
 
 class MenuMatricesWindow(QMainWindow):
@@ -123,40 +124,22 @@ class MenuMatricesWindow(QMainWindow):
             self.close()
 
     def _open_suma(self):
-        from .matrices_qt import SumaMatricesWindow
-        w = SumaMatricesWindow(parent=self)
-        w.showMaximized()
-        self._child = w
+        self._child = abrir_ventana(self, "matrices_qt", "SumaMatricesWindow")
 
     def _open_resta(self):
-        from .matrices_qt import RestaMatricesWindow
-        w = RestaMatricesWindow(parent=self)
-        w.showMaximized()
-        self._child = w
+        self._child = abrir_ventana(self, "matrices_qt", "RestaMatricesWindow")
 
     def _open_mult(self):
-        from .matrices_qt import MultiplicacionMatricesWindow
-        w = MultiplicacionMatricesWindow(parent=self)
-        w.showMaximized()
-        self._child = w
+        self._child = abrir_ventana(self, "matrices_qt", "MultiplicacionMatricesWindow")
 
     def _open_det(self):
-        from .matrices_qt import DeterminanteMatrizWindow
-        w = DeterminanteMatrizWindow(parent=self)
-        w.showMaximized()
-        self._child = w
+        self._child = abrir_ventana(self, "matrices_qt", "DeterminanteMatrizWindow")
 
     def _open_trans(self):
-        from .matrices_qt import TranspuestaMatrizWindow
-        w = TranspuestaMatrizWindow(parent=self)
-        w.showMaximized()
-        self._child = w
+        self._child = abrir_ventana(self, "matrices_qt", "TranspuestaMatrizWindow")
 
     def _open_inv(self):
-        from .matrices_qt import InversaMatrizWindow
-        w = InversaMatrizWindow(parent=self)
-        w.showMaximized()
-        self._child = w
+        self._child = abrir_ventana(self, "matrices_qt", "InversaMatrizWindow")
 
     def _open_settings(self):
         open_settings_dialog(self)
@@ -9,10 +9,7 @@ from PySide6.QtWidgets import (
     QSizePolicy,
 )
 from PySide6.QtCore import Qt
-from .menu_matrices_qt import MenuMatricesWindow
-from .menu_sistemas_qt import MenuSistemasWindow
-from .independencia_qt import IndependenciaWindow
-from .transformaciones_qt import TransformacionesWindow
+from .ventanas_qt import abrir_ventana
 from .theme import install_toggle_shortcut, bind_font_scale_stylesheet
 from .settings_qt import open_settings_dialog
 
@@ -165,21 +162,18 @@ class MenuPrincipalWindow(QMainWindow):
 
         install_toggle_shortcut(self)
 
+    # Cada módulo se importa en el primer clic (arranque más rápido)
     def _open_sistemas(self):
-        self.s = MenuSistemasWindow(parent=self)
-        self.s.showMaximized()
+        self.s = abrir_ventana(self, "menu_sistemas_qt", "MenuSistemasWindow")
 
     def _open_matrices(self):
-        self.m = MenuMatricesWindow(parent=self)
-        self.m.showMaximized()
+        self.m = abrir_ventana(self, "menu_matrices_qt", "MenuMatricesWindow")
 
     def _open_independencia(self):
-        self.w = IndependenciaWindow(parent=self)
-        self.w.showMaximized()
+        self.w = abrir_ventana(self, "independencia_qt", "IndependenciaWindow")
 
     def _open_transformaciones(self):
-        self.w = TransformacionesWindow(parent=self)
-        self.w.showMaximized()
+        self.w = abrir_ventana(self, "transformaciones_qt", "TransformacionesWindow")
 
     def _open_settings(self):
         open_settings_dialog(self)
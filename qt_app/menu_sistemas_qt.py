@@ -10,6 +10,7 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt
 from .theme import install_toggle_shortcut
 from .settings_qt import open_settings_dialog
+from .ventanas_qt import abrir_ventana
 
 
 class MenuSistemasWindow(QMainWindow):
@@ -96,18 +97,10 @@ class MenuSistemasWindow(QMainWindow):
             self.close()
 
     def _open_gauss(self):
-        from .sistemas.gauss_jordan_qt import GaussJordanWindow
-
-        w = GaussJordanWindow(parent=self)
-        w.showMaximized()
-        self._child = w
+        self._child = abrir_ventana(self, "sistemas.gauss_jordan_qt", "GaussJordanWindow")
 
     def _open_cramer(self):
-        from .sistemas.cramer_qt import CramerWindow
-
-        w = CramerWindow(parent=self)
-        w.showMaximized()
-        self._child = w
+        self._child = abrir_ventana(self, "sistemas.cramer_qt", "CramerWindow")
 
     def _open_settings(self):
         open_settings_dialog(self)
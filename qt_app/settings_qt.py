@@ -6,8 +6,9 @@ from PySide6.QtWidgets import (
     QDialogButtonBox,
     QFormLayout,
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QSettings
 
+from .trabajos_qt import trabajos_en_curso
 from .theme import (
     current_font_scale,
     set_font_scale,
@@ -37,6 +38,24 @@ _FONT_FAMILY_OPTIONS = [
 ]
 
 
+_CLAVE_BACKEND = "aritmetica/backend"
+
+
+def _ajustes():
+    return QSettings("CalculadoraAlgebraLineal", "Calculadora")
+
+
+def restaurar_backend():
+    """Activa el backend numérico guardado en una sesión anterior, si sigue instalado."""
+    nombre = _ajustes().value(_CLAVE_BACKEND)
+    if not nombre:
+        return
+    from core import aritmetica
+
+    if nombre in aritmetica.backends_disponibles() and nombre != aritmetica.backend_actual():
+        aritmetica.usar_backend(nombre)
+
+
 class SettingsDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -86,6 +105,23 @@ class SettingsDialog(QDialog):
         self.font_family_combo.setCurrentText(current_family)
         form.addRow("Tipo de letra:", self.font_family_combo)
 
+        # Backend numerico (core se importa aqui para no cargarlo al arrancar)
+        from core import aritmetica
+
+        self.backend_combo = QComboBox()
+        for nombre in aritmetica.backends_disponibles():
+            self.backend_combo.addItem(aritmetica.NOMBRES_BACKEND[nombre], nombre)
+        self.backend_combo.setCurrentIndex(
+            max(0, self.backend_combo.findData(aritmetica.backend_actual()))
+        )
+        if self.backend_combo.count() < 2:
+            self.backend_combo.setToolTip("Instala gmpy2 para usar la aritmetica de GMP.")
+        elif trabajos_en_curso():
+            # usar_backend() cambia los enteros de core bajo los pies del calculo
+            self.backend_combo.setEnabled(False)
+            self.backend_combo.setToolTip("Hay un calculo en curso; cambia la aritmetica cuando termine.")
+        form.addRow("Aritmetica exacta:", self.backend_combo)
+
         info = QLabel(
             "Los cambios se aplican inmediatamente y se recuerdan para futuras sesiones."
         )
@@ -125,6 +161,14 @@ class SettingsDialog(QDialog):
             set_font_scale(app, chosen_scale)
             changed = True
 
+        # Backend numerico (no afecta a la apariencia)
+        from core import aritmetica
+
+        chosen_backend = self.backend_combo.currentData()
+        if chosen_backend != aritmetica.backend_actual() and not trabajos_en_curso():
+            aritmetica.usar_backend(chosen_backend)
+            _ajustes().setValue(_CLAVE_BACKEND, chosen_backend)
+
         # Tema
         chosen_theme = self.theme_combo.currentData()
         if chosen_theme != current_mode(app):
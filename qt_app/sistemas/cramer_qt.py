@@ -1,19 +1,26 @@
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFrame,
-    QScrollArea, QGridLayout, QLineEdit, QTextEdit, QMessageBox, QSlider
+    QScrollArea, QGridLayout, QTextEdit, QMessageBox, QSlider
 )
 from PySide6.QtWidgets import QDialog, QDialogButtonBox, QPlainTextEdit
 from PySide6.QtCore import Qt
+from PySide6.QtGui import QFont, QTextCharFormat
 from ..theme import install_toggle_shortcut, bind_font_scale_stylesheet, scaled_font_px
 from ..settings_qt import open_settings_dialog
 from fractions import Fraction
-from qt_app.matrices_qt import determinante_con_pasos as determinante_con_pasos_ascii
+from ..alimentador_qt import AlimentadorTexto
+from ..trabajos_qt import BarraTrabajo
+from ..cuadricula_qt import CuadriculaEntradas
+from ..vista_previa_qt import VistaPreviaSistema
+from core.cramer import determinantes_cramer, matriz_sustituida
+from core import aritmetica
+from core.determinante import pasos_determinante
 import re
 
 
 def _fmt_fraction(x: Fraction) -> str:
     try:
-        if isinstance(x, Fraction):
+        if isinstance(x, aritmetica.RACIONALES):
             if x.denominator == 1:
                 return str(x.numerator)
             return f"{x.numerator}/{x.denominator}"
@@ -23,12 +30,29 @@ def _fmt_fraction(x: Fraction) -> str:
 
 
 
+def _formatos_vista_previa():
+    """Encabezado en negrita y ecuaciones en monoespaciada (como el antiguo <pre>)."""
+    encabezado = QTextCharFormat()
+    encabezado.setFontFamilies(["Segoe UI"])
+    encabezado.setFontWeight(QFont.Bold)
+    fuente = QFont()
+    fuente.setFamilies(["Consolas", "monospace"])
+    fuente.setPixelSize(scaled_font_px(13))
+    filas = QTextCharFormat()
+    filas.setFont(fuente)
+    return encabezado, filas
+
+
+def _trabajo_cramer(control, A, b):
+    return determinantes_cramer(A, b, progreso=control.progreso)
+
+
 class DetallesDeterminantesWindow(QMainWindow):
     """Ventana que muestra los procedimientos de determinantes uno por uno con navegación."""
     def __init__(self, parent=None, items=None):
         super().__init__(parent)
         self.setWindowTitle("Cálculos de determinantes")
-        self.items = items or []  # lista de (titulo, lineas[])
+        self.items = list(items or [])  # lista de (titulo, lineas[] o funcion que devuelve un generador de lineas)
         self.index = 0
 
         outer = QWidget()
@@ -58,9 +82,11 @@ class DetallesDeterminantesWindow(QMainWindow):
         btns = QHBoxLayout()
         self.prev_btn = QPushButton("Anterior")
         self.next_btn = QPushButton("Siguiente")
+        self.more_btn = QPushButton("Cargar más pasos")
         self.close_btn = QPushButton("Cerrar")
         btns.addWidget(self.prev_btn)
         btns.addWidget(self.next_btn)
+        btns.addWidget(self.more_btn)
         btns.addStretch(1)
         btns.addWidget(self.close_btn)
         lay.addLayout(btns)
@@ -68,19 +94,25 @@ class DetallesDeterminantesWindow(QMainWindow):
         self.prev_btn.clicked.connect(self._prev)
         self.next_btn.clicked.connect(self._next)
         self.close_btn.clicked.connect(self.close)
+        self._alimentador = AlimentadorTexto(self.text, self.more_btn)
 
         self._update_view()
 
     def _update_view(self):
         if not self.items:
             self.header.setText("No hay cálculos disponibles")
+            self._alimentador.detener()
             self.text.setPlainText("")
             self.prev_btn.setEnabled(False)
             self.next_btn.setEnabled(False)
             return
         title, lines = self.items[self.index]
+        if callable(lines):
+            # los pasos se generan solo cuando se visita la pagina, y se
+            # muestran a medida que el motor los produce
+            lines = lines()
         self.header.setText(title)
-        self.text.setPlainText("\n".join(lines))
+        self._alimentador.iniciar(ln + "\n" for ln in lines)
         self.prev_btn.setEnabled(self.index > 0)
         self.next_btn.setEnabled(self.index < len(self.items) - 1)
 
@@ -204,6 +236,7 @@ class CramerWindow(QMainWindow):
         self.grid_layout = QGridLayout(self.grid_container)
         self.grid_layout.setHorizontalSpacing(10)
         self.grid_layout.setVerticalSpacing(8)
+        self._cuadricula = CuadriculaEntradas(self.grid_layout, "font-weight:700;")
         self.scroll.setWidget(self.grid_container)
 
         title = QLabel("Resultados")
@@ -238,6 +271,8 @@ class CramerWindow(QMainWindow):
         self.btn_resolver.clicked.connect(self._resolver)
         self.btn_resolver.setEnabled(False)
         main.addWidget(self.btn_resolver)
+        self.trabajo = BarraTrabajo(self)
+        main.addWidget(self.trabajo)
 
         # Panel de procedimiento (alto nivel) y panel ocultable para cálculos de determinantes
         self.procedimiento = QTextEdit()
@@ -248,6 +283,12 @@ class CramerWindow(QMainWindow):
             body=12,
         )
         main.addWidget(self.procedimiento, 1)
+        self._vista_previa = VistaPreviaSistema(
+            self.procedimiento,
+            convertir=lambda s: Fraction(s.replace(",", ".")),
+            formatear=_fmt_fraction,
+            estilo=_formatos_vista_previa,
+        )
 
         self.toggle_det_btn = QPushButton("Mostrar cálculos de determinantes")
         self.toggle_det_btn.setCheckable(True)
@@ -266,6 +307,9 @@ class CramerWindow(QMainWindow):
             body=12,
         )
         det_l.addWidget(self.detalles_text)
+        self.detalles_mas_btn = QPushButton("Cargar más pasos")
+        det_l.addWidget(self.detalles_mas_btn)
+        self._alimentador = AlimentadorTexto(self.detalles_text, self.detalles_mas_btn)
         main.addWidget(self.detalles_container, 1)
 
         self._rebuild_grid(self._rows, self._cols_no_b + 1)
@@ -282,47 +326,28 @@ class CramerWindow(QMainWindow):
             self.close()
 
     def _limpiar(self):
+        self._cuadricula.limpiar()
         self._entries = []
-        while self.grid_layout.count():
-            w = self.grid_layout.takeAt(0).widget()
-            if w:
-                w.deleteLater()
+        self._vista_previa.conectar([])
+        self._limpiar_resultados()
+
+    def _limpiar_resultados(self):
+        self.trabajo.cancelar()
         self.procedimiento.clear()
+        self._alimentador.detener()
         self.detalles_text.clear()
         self.det_label.setText("det(A) = —")
         self.vars_box.clear()
         self.btn_resolver.setEnabled(False)
 
     def _rebuild_grid(self, filas: int, columnas: int):
-        old = [[e.text() for e in row] for row in self._entries] if self._entries else []
-        self._limpiar()
-        # encabezados para variables x1..xn y columna b
-        for j in range(columnas - 1):
-            h = QLabel(f"x{j+1}")
-            h.setStyleSheet("font-weight:700;")
-            self.grid_layout.addWidget(h, 0, j)
-        hb = QLabel("b")
-        hb.setStyleSheet("font-weight:700;")
-        self.grid_layout.addWidget(hb, 0, columnas - 1)
-        self._entries = []
-        for i in range(filas):
-            row = []
-            for j in range(columnas):
-                e = QLineEdit()
-                e.setPlaceholderText("0")
-                e.setAlignment(Qt.AlignCenter)
-                if old and i < len(old) and j < len(old[i]):
-                    e.setText(old[i][j])
-                try:
-                    e.textChanged.connect(self._preview_sistema)
-                except Exception:
-                    pass
-                self.grid_layout.addWidget(e, i + 1, j)
-                row.append(e)
-            self._entries.append(row)
+        self._limpiar_resultados()
+        # Solo se crean o destruyen las filas y columnas que cambian
+        self._cuadricula.redimensionar(filas, columnas - 1)
+        self._entries = self._cuadricula.entradas
         self.btn_resolver.setEnabled(True)
-        # Vista previa inicial
-        self._preview_sistema()
+        # Vista previa inicial; después solo se releen las celdas editadas
+        self._vista_previa.conectar(self._entries)
 
     def _on_rows_changed(self, value: int):
         value = max(1, value)
@@ -484,62 +509,19 @@ class CramerWindow(QMainWindow):
             A.append(vals)
         return A
 
-    def _preview_sistema(self):
-        # Construye y muestra el sistema mientras se ingresa la matriz
-        try:
-            A_aug = self._leer_matriz()
-        except Exception:
-            A_aug = []
-        if not A_aug:
-            try:
-                self.procedimiento.clear()
-            except Exception:
-                pass
-            return
-        try:
-            n = len(A_aug); m = len(A_aug[0]); num_vars = max(0, m-1)
-            def coef_term(c, j):
-                if c == 0: return None
-                var = f"x{j+1}"
-                if c == 1: return var
-                if c == -1: return f"- {var}"
-                return f"{_fmt_fraction(c)}{var}"
-            lines = []
-            for i in range(n):
-                parts = []
-                for j in range(num_vars):
-                    t = coef_term(A_aug[i][j], j)
-                    if t is None: continue
-                    if not parts:
-                        parts.append(str(t))
-                    else:
-                        tt = str(t)
-                        if tt.startswith("-"):
-                            clean = tt[2:] if tt.startswith("- ") else tt[1:]
-                            parts.append(f"- {clean}")
-                        else:
-                            parts.append(f"+ {tt}")
-                left = " ".join(parts) if parts else "0"
-                right = _fmt_fraction(A_aug[i][-1]) if m>0 else "0"
-                lines.append(f"{left} = {right}")
-            mono_pre = scaled_font_px(13)
-            html = (
-                "<div style='font-family:Segoe UI;'>"
-                "<div style='font-weight:700;margin-bottom:4px;'>Sistema de ecuaciones ingresado:</div>"
-                f"<pre style='font-family:Consolas,monospace;font-size:{mono_pre}px;margin:0;'>"
-                + "\n".join(lines)
-                + "</pre></div>"
-            )
-            try:
-                self.procedimiento.setHtml(html)
-            except Exception:
-                self.procedimiento.setPlainText("Sistema de ecuaciones ingresado:\n" + "\n".join(lines))
-        except Exception:
-            pass
-
     def _toggle_detalles(self):
         # kept for backward compatibility but not used; prefer popup
         visible = self.detalles_container.isVisible()
+        items = getattr(self, "_det_steps_items", None) or []
+        if not visible and items and not self.detalles_text.toPlainText():
+            def fragmentos():
+                yield "Cálculos detallados de determinantes:\n\n"
+                for title, lines in items:
+                    yield f"-- {title} --\n"
+                    for ln in (lines() if callable(lines) else lines):
+                        yield ln + "\n"
+                    yield "\n\n"
+            self._alimentador.iniciar(fragmentos())
         self.detalles_container.setVisible(not visible)
         self.toggle_det_btn.setText("Ocultar cálculos de determinantes" if not visible else "Mostrar cálculos de determinantes")
 
@@ -576,34 +558,35 @@ class CramerWindow(QMainWindow):
         A = [[A_aug[i][j] for j in range(m - 1)] for i in range(n)]
         b = [A_aug[i][-1] for i in range(n)]
 
-        # calculo de det(A)
-        detA, pasosA = determinante_con_pasos_ascii(A)
+        # det(A) y todos los det(A_k) en una sola eliminacion (fuera del hilo de la
+        # interfaz); se detiene si det(A) = 0
+        self.trabajo.ejecutar(
+            _trabajo_cramer, A, b,
+            al_terminar=lambda res: self._mostrar_cramer(A, b, *res),
+            al_fallar=lambda exc: QMessageBox.critical(self, "Error", f"No se pudo resolver: {exc}"),
+            deshabilitar=(self.btn_resolver,),
+        )
+
+    def _mostrar_cramer(self, A, b, detA, det_vars):
+        n = len(A)
         # mostrar detA distintivo
         self.det_label.setText(f"det(A) = {_fmt_fraction(detA)}")
 
         if detA == 0:
             # mostrar mensaje y detallar pasos en la sección de determinantes
             QMessageBox.critical(self, "No se puede aplicar Cramer", "El determinante de la matriz de coeficientes es cero. No se puede resolver por el método de Cramer.")
-        # calcular determinantes para cada variable
-        det_vars = []
-        det_steps = {"detA": pasosA}
-        for col in range(n):
-            # construir matriz con columna col reemplazada por b
-            M = [row[:] for row in A]
-            for i in range(n):
-                M[i][col] = b[i]
-            detk, pasosk = determinante_con_pasos_ascii(M)
-            det_vars.append(detk)
-            det_steps[f"det_var_{col+1}"] = pasosk
-
-        # preparar items paginados para la ventana de detalles: lista de (titulo, lineas)
-        self._det_steps_items = []
-        # primer item: det(A)
-        self._det_steps_items.append(("|A| — determinante general", pasosA))
-        for idx in range(n):
-            key = f"det_var_{idx+1}"
-            lines = det_steps.get(key, [])
-            self._det_steps_items.append((f"|A{idx+1}| — determinante sustituyendo columna {idx+1}", lines))
+
+        # items paginados para la ventana de detalles: (titulo, funcion que genera las lineas).
+        # Las trazas solo se construyen cuando el usuario abre esa ventana.
+        def _pasos(M):
+            return lambda: pasos_determinante(M, ascii=True)
+
+        self._det_steps_items = [("|A| — determinante general", _pasos(A))]
+        if det_vars is not None:
+            for idx in range(n):
+                self._det_steps_items.append(
+                    (f"|A{idx+1}| — determinante sustituyendo columna {idx+1}", _pasos(matriz_sustituida(A, b, idx)))
+                )
 
         # preparar y mostrar resultados
         self.vars_box.clear()
@@ -614,8 +597,7 @@ class CramerWindow(QMainWindow):
                 lines.append(f"x{i+1} = {_fmt_fraction(detk)} / {_fmt_fraction(detA)} = {_fmt_fraction(val)}")
             self.vars_box.setPlainText("\n".join(lines))
         else:
-            # si detA == 0 ofrecer interpretación: mostrar det vars si se desea
-            self.vars_box.setPlainText("Determinante cero: no aplicable. Se muestran los determinantes sustituidos si los desea ver.")
+            self.vars_box.setPlainText("Determinante cero: el método de Cramer no es aplicable.")
 
         # procedimiento principal (alto nivel) — ahora formateado en HTML + <pre>
         mono_small = scaled_font_px(13)
@@ -747,12 +729,9 @@ class CramerWindow(QMainWindow):
         html_parts.append(f"<div style='margin-top:6px; font-weight:700;'>= {_fmt_fraction(detA)}</div>")
         html_parts.append("</div>")
 
-        # cada det Ai
-        for idx in range(n):
-            # construir Ai
-            M = [row[:] for row in A]
-            for i in range(n):
-                M[i][idx] = b[i]
+        # cada det Ai (solo si det(A) != 0)
+        for idx in range(n if det_vars is not None else 0):
+            M = matriz_sustituida(A, b, idx)
             html_parts.append("<div style='display:inline-block; margin:6px 18px; text-align:center;'>")
             html_parts.append(f"<div style='font-weight:600'>&#124;A<sub>{idx+1}</sub>&#124; =</div>")
             html_parts.append(_matrix_block_html(M))
@@ -790,15 +769,6 @@ class CramerWindow(QMainWindow):
             # fallback a texto simple
             self.procedimiento.setPlainText("Regla de Cramer:\n" + "\n".join(sol_html_lines))
 
-        # rellenar detalles de cálculos de determinantes (no visible por defecto)
-        detalles_text = []
-        detalles_text.append("Cálculos detallados de determinantes:\n")
-        detalles_text.append("-- det(A) --")
-        detalles_text.extend(pasosA)
-        detalles_text.append("\n")
-        for idx in range(n):
-            detalles_text.append(f"-- det sustituyendo columna x{idx+1} --")
-            detalles_text.extend(det_steps[f"det_var_{idx+1}"])
-            detalles_text.append("\n")
-
-        self.detalles_text.setPlainText("\n".join(detalles_text))
+        # los detalles (panel oculto) se rellenan al mostrarse, ver _toggle_detalles
+        self._alimentador.detener()
+        self.detalles_text.clear()
@@ -1,6 +1,6 @@
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QScrollArea, QGridLayout, QLineEdit, QTextEdit, QMessageBox, QFrame,
+    QScrollArea, QGridLayout, QTextEdit, QMessageBox, QFrame,
     QDialog, QDialogButtonBox, QPlainTextEdit, QSlider
 )
 from PySide6.QtCore import Qt
@@ -9,13 +9,24 @@ from copy import deepcopy
 import re
 from ..theme import bind_font_scale_stylesheet
 from ..settings_qt import open_settings_dialog
+from ..alimentador_qt import AlimentadorTexto
+from ..trabajos_qt import BarraTrabajo
+from ..cuadricula_qt import CuadriculaEntradas
+from ..vista_previa_qt import VistaPreviaSistema
+from core.gauss_jordan import (
+    gauss_jordan,
+    extraer_soluciones as _extraer_soluciones,
+    vectores_columna_lado_a_lado,
+)
+
+
+def _trabajo_gauss_jordan(control, A):
+    gauss_jordan(A, len(A), len(A[0]), trace=False, progreso=control.progreso)
+    return A
 
 
-def _fmt(x):
-    try:
-        return str(x)
-    except Exception:
-        return f"{x}"
+def _trabajo_detalles(control, A):
+    return gauss_jordan(A, len(A), len(A[0]), progreso=control.progreso)
 
 
 class GaussJordanWindow(QMainWindow):
@@ -126,6 +137,7 @@ class GaussJordanWindow(QMainWindow):
         self.grid_layout = QGridLayout(self.grid_container)
         self.grid_layout.setHorizontalSpacing(10)
         self.grid_layout.setVerticalSpacing(8)
+        self._cuadricula = CuadriculaEntradas(self.grid_layout, "font-weight: 700;")
         self.scroll.setWidget(self.grid_container)
 
         title = QLabel("Resultados")
@@ -139,14 +151,21 @@ class GaussJordanWindow(QMainWindow):
             body=12,
         )
         main.addWidget(self.result, 1)
+        # No sobreescribir resultados si ya se resolvió
+        self._vista_previa = VistaPreviaSistema(self.result, activa=lambda: self.matriz_final is None)
 
         self.btn_resolver = QPushButton("Resolver")
         self.btn_resolver.clicked.connect(self._resolver)
         self.btn_resolver.setEnabled(False)
         main.addWidget(self.btn_resolver)
+        self.trabajo = BarraTrabajo(self)
+        main.addWidget(self.trabajo)
 
         bottom = QHBoxLayout()
         main.addLayout(bottom)
+        self.btn_cargar_mas = QPushButton("Cargar más pasos")
+        bottom.addWidget(self.btn_cargar_mas)
+        self._alimentador = AlimentadorTexto(self.result, self.btn_cargar_mas)
         bottom.addStretch(1)
         self.detalle_button = QPushButton("Ver pasos detallados")
         self.detalle_button.setEnabled(False)
@@ -156,11 +175,14 @@ class GaussJordanWindow(QMainWindow):
         self._rebuild_grid(self._rows, self._cols_no_b + 1)
 
     def _limpiar(self):
+        self._cuadricula.limpiar()
         self._entries = []
-        while self.grid_layout.count():
-            w = self.grid_layout.takeAt(0).widget()
-            if w:
-                w.deleteLater()
+        self._vista_previa.conectar([])
+        self._limpiar_resultados()
+
+    def _limpiar_resultados(self):
+        self.trabajo.cancelar()
+        self._alimentador.detener()
         self.result.clear()
         self.btn_resolver.setEnabled(False)
         # Resetear estado para permitir vista previa y nuevas resoluciones
@@ -175,34 +197,13 @@ class GaussJordanWindow(QMainWindow):
             pass
 
     def _rebuild_grid(self, filas: int, columnas: int):
-        old = [[e.text() for e in row] for row in self._entries] if self._entries else []
-        self._limpiar()
-        for j in range(columnas - 1):
-            h = QLabel(f"x{j+1}")
-            h.setStyleSheet("font-weight: 700;")
-            self.grid_layout.addWidget(h, 0, j)
-        hb = QLabel("b")
-        hb.setStyleSheet("font-weight: 700;")
-        self.grid_layout.addWidget(hb, 0, columnas - 1)
-        self._entries = []
-        for i in range(filas):
-            row = []
-            for j in range(columnas):
-                e = QLineEdit()
-                e.setPlaceholderText("0")
-                e.setAlignment(Qt.AlignCenter)
-                if old and i < len(old) and j < len(old[i]):
-                    e.setText(old[i][j])
-                try:
-                    e.textChanged.connect(self._preview_sistema)
-                except Exception:
-                    pass
-                self.grid_layout.addWidget(e, i + 1, j)
-                row.append(e)
-            self._entries.append(row)
+        self._limpiar_resultados()
+        # Solo se crean o destruyen las filas y columnas que cambian
+        self._cuadricula.redimensionar(filas, columnas - 1)
+        self._entries = self._cuadricula.entradas
         self.btn_resolver.setEnabled(True)
-        # Vista previa inicial
-        self._preview_sistema()
+        # Vista previa inicial; después solo se releen las celdas editadas
+        self._vista_previa.conectar(self._entries)
 
     def _on_rows_changed(self, value: int):
         value = max(1, value)
@@ -390,132 +391,39 @@ class GaussJordanWindow(QMainWindow):
             A.append(vals)
         return A
 
-    def _equations_from_aug(self, A_aug):
-        if not A_aug:
-            return []
-        n = len(A_aug)
-        m = len(A_aug[0])
-        num_vars = max(0, m - 1)
-
-        def coef_term(c, j):
-            if c == 0:
-                return None
-            var = f"x{j+1}"
-            if c == 1:
-                return f"{var}"
-            if c == -1:
-                return f"- {var}"
-            return f"{c}{var}"
-
-        lines = []
-        for i in range(n):
-            parts = []
-            for j in range(num_vars):
-                t = coef_term(A_aug[i][j], j)
-                if t is None:
-                    continue
-                if not parts:
-                    parts.append(str(t))
-                else:
-                    tt = str(t)
-                    if tt.startswith("-"):
-                        clean = tt[2:] if tt.startswith("- ") else tt[1:]
-                        parts.append(f"- {clean}")
-                    else:
-                        parts.append(f"+ {tt}")
-            left = " ".join(parts) if parts else "0"
-            right = str(A_aug[i][-1]) if m > 0 else "0"
-            lines.append(f"{left} = {right}")
-        return lines
-
-    def _preview_sistema(self):
-        # No sobreescribir resultados si ya se resolvi
-        if self.matriz_final is not None:
-            return
-        try:
-            A = []
-            for row in self._entries:
-                vals = []
-                for e in row:
-                    s = (e.text() or "0").strip()
-                    vals.append(Fraction(s))
-                A.append(vals)
-            lines = self._equations_from_aug(A)
-        except Exception:
-            lines = []
-        try:
-            self.result.clear()
-            if lines:
-                self.result.insertPlainText("Sistema de ecuaciones ingresado:\n")
-                for ln in lines:
-                    self.result.insertPlainText(ln + "\n")
-        except Exception:
-            pass
-
-    def _equations_from_aug(self, A_aug):
-        if not A_aug:
-            return []
-        n = len(A_aug)
-        m = len(A_aug[0])
-        num_vars = max(0, m - 1)
-
-        def coef_term(c, j):
-            if c == 0:
-                return None
-            var = f"x{j+1}"
-            if c == 1:
-                return f"{var}"
-            if c == -1:
-                return f"- {var}"
-            return f"{c}{var}"
-
-        lines = []
-        for i in range(n):
-            parts = []
-            for j in range(num_vars):
-                t = coef_term(A_aug[i][j], j)
-                if t is None:
-                    continue
-                if not parts:
-                    parts.append(str(t))
-                else:
-                    tt = str(t)
-                    if tt.startswith("-"):
-                        clean = tt[2:] if tt.startswith("- ") else tt[1:]
-                        parts.append(f"- {clean}")
-                    else:
-                        parts.append(f"+ {tt}")
-            left = " ".join(parts) if parts else "0"
-            right = str(A_aug[i][-1]) if m > 0 else "0"
-            lines.append(f"{left} = {right}")
-        return lines
-
     def _resolver(self):
         try:
             A = self._leer_matriz()
-            filas = len(A)
-            cols = len(A[0])
-            self.matriz_original = deepcopy(A)
-            pasos = gauss_jordan(A, filas, cols)
-            self.pasos_guardados = pasos
-            self.matriz_final = A
-            self._mostrar_resumen()
-            self.detalle_button.setEnabled(True)
         except Exception as exc:
             QMessageBox.critical(self, "Error", f"Entrada inválida: {exc}")
+            return
+        original = deepcopy(A)
+        # Solo el resultado, fuera del hilo de la interfaz; los pasos se generan al pedir el detalle
+        self.trabajo.ejecutar(
+            _trabajo_gauss_jordan, A,
+            al_terminar=lambda res: self._fin_resolver(original, res),
+            al_fallar=lambda exc: QMessageBox.critical(self, "Error", f"Entrada inválida: {exc}"),
+            deshabilitar=(self.btn_resolver,),
+        )
 
-    def _insert_header(self, titulo: str, comentario: str = ""):
-        self.result.insertPlainText("Operación: ")
-        self.result.insertPlainText(titulo)
+    def _fin_resolver(self, original, A):
+        self.matriz_original = original
+        self.pasos_guardados = None
+        self.matriz_final = A
+        self._mostrar_resumen()
+        self.detalle_button.setEnabled(True)
+
+    @staticmethod
+    def _texto_encabezado(titulo: str, comentario: str = "") -> str:
+        texto = "Operación: " + titulo
         if comentario:
-            self.result.insertPlainText("  \u2014  ")
-            self.result.insertPlainText(comentario)
-        self.result.insertPlainText("\n\n")
+            texto += "  \u2014  " + comentario
+        return texto + "\n\n"
 
-    def _mostrar_detalles(self):
-        self.result.clear()
+    def _fragmentos_detalles(self):
+        # Un fragmento de texto por paso; el registro los va generando al pedirlos
         for step in self.pasos_guardados:
-            self._insert_header(step.get("titulo", ""), step.get("comentario", ""))
+            partes = [self._texto_encabezado(step.get("titulo", ""), step.get("comentario", ""))]
             oper_lines = step.get("oper_lines", [])
             matriz_lines = step.get("matriz_lines", [])
             max_left = max((len(s) for s in oper_lines), default=0)
@@ -524,15 +432,49 @@ class GaussJordanWindow(QMainWindow):
             for i in range(max_len):
                 left = oper_lines[i] if i < len(oper_lines) else ""
                 right = matriz_lines[i] if i < len(matriz_lines) else ""
-                line_text = left.ljust(max_left) + (sep if right else "") + right
-                self.result.insertPlainText(line_text + "\n")
-            self.result.insertPlainText("\n" + ("-" * 110) + "\n\n")
-        self.result.insertPlainText("===== SOLUCIÓN FINAL =====\n")
+                partes.append(left.ljust(max_left) + (sep if right else "") + right + "\n")
+            partes.append("\n" + ("-" * 110) + "\n\n")
+            yield "".join(partes)
+        final = ["===== SOLUCIÓN FINAL =====\n"]
         soluciones, tipo, _ = _extraer_soluciones(self.matriz_final)
-        for i, val in enumerate(soluciones):
-            self.result.insertPlainText(f"x{i+1} = {val}\n")
+        for i, val in enumerate(soluciones or []):
+            final.append(f"x{i+1} = {val}\n")
+        yield "".join(final)
+
+    def _mostrar_detalles(self):
+        if self.pasos_guardados is None:
+            # El registro de pasos se construye fuera del hilo de la interfaz
+            self._alimentador.detener()
+            self.result.clear()
+            self.result.insertPlainText("Generando los pasos detallados...\n")
+            self.trabajo.ejecutar(
+                _trabajo_detalles, deepcopy(self.matriz_original),
+                al_terminar=self._fin_detalles,
+                al_fallar=self._fallo_detalles,
+                al_cancelar=self._ocultar_detalles,
+                deshabilitar=(self.btn_resolver, self.detalle_button),
+            )
+            return
+        # Los pasos se vuelcan por tandas (primera pantalla inmediata, resto con
+        # un temporizador y el botón "Cargar más pasos")
+        self._alimentador.iniciar(self._fragmentos_detalles())
+
+    def _fin_detalles(self, registro):
+        self.pasos_guardados = registro
+        if self.mostrando_detalles:
+            self._alimentador.iniciar(self._fragmentos_detalles())
+
+    def _fallo_detalles(self, exc):
+        QMessageBox.critical(self, "Error", f"No se pudieron generar los pasos: {exc}")
+        self._ocultar_detalles()
+
+    def _ocultar_detalles(self):
+        self._mostrar_resumen()
+        self.detalle_button.setText("Ver pasos detallados")
+        self.mostrando_detalles = False
 
     def _mostrar_resumen(self):
+        self._alimentador.detener()
         self.result.clear()
         self.result.insertPlainText("===== SOLUCIÓN FINAL =====\n")
         if self.matriz_final is None:
@@ -586,12 +528,10 @@ class GaussJordanWindow(QMainWindow):
                 self.result.insertPlainText("\nDonde " + ", ".join([f"x{l+1}" for l in free_cols]) + " ∈ ℝ (parámetros libres).\n")
 
     def _toggle_detalles(self):
-        if not self.pasos_guardados:
+        if self.matriz_final is None:
             return
         if self.mostrando_detalles:
-            self._mostrar_resumen()
-            self.detalle_button.setText("Ver pasos detallados")
-            self.mostrando_detalles = False
+            self._ocultar_detalles()
         else:
             self._mostrar_detalles()
             self.detalle_button.setText("Ocultar pasos detallados")
@@ -610,175 +550,6 @@ class GaussJordanWindow(QMainWindow):
             self.close()
 
 
-def gauss_jordan(A, n, m):
-    pasos = []
-    fila_pivote = 0
-    for col in range(m - 1):
-        pivote = None
-        for f in range(fila_pivote, n):
-            if A[f][col] != 0:
-                pivote = f
-                break
-        if pivote is None:
-            continue
-        if pivote != fila_pivote:
-            A[fila_pivote], A[pivote] = A[pivote], A[fila_pivote]
-            pasos.append({
-                "titulo": f"F{fila_pivote+1} \u2194 F{pivote+1}",
-                "comentario": f"Intercambio de filas para poner un pivote no nulo en la columna {col+1}",
-                "oper_lines": [],
-                "matriz_lines": format_matriz_lines(A)
-            })
-        divisor = A[fila_pivote][col]
-        if divisor == 0:
-            fila_pivote += 1
-            continue
-        if divisor != 1:
-            A[fila_pivote] = [val / divisor for val in A[fila_pivote]]
-            pasos.append({
-                "titulo": f"F{fila_pivote+1} \u2192 F{fila_pivote+1}/{_fmt(divisor)}",
-                "comentario": f"Normalización: se convierte en pivote a 1 en la columna {col+1}",
-                "oper_lines": [],
-                "matriz_lines": format_matriz_lines(A)
-            })
-        for f in range(n):
-            if f != fila_pivote and A[f][col] != 0:
-                factor = A[f][col]
-                original_fila = A[f][:]
-                A[f] = [original_fila[j] - factor * A[fila_pivote][j] for j in range(m)]
-                oper_lines = format_operacion_vertical_lines(
-                    A[fila_pivote], original_fila, factor, A[f], fila_pivote + 1, f + 1
-                )
-                pasos.append({
-                    "titulo": f"F{f+1} \u2192 F{f+1} - ({_fmt(factor)})F{fila_pivote+1}",
-                    "comentario": f"Se anula el elemento en la columna {col+1} usando la fila pivote",
-                    "oper_lines": oper_lines,
-                    "matriz_lines": format_matriz_lines(A)
-                })
-        fila_pivote += 1
-        if fila_pivote >= n:
-            break
-    return pasos
-
-
-def format_operacion_vertical_lines(fila_pivote, fila_actual, factor, fila_result, idx_piv, idx_obj):
-    ancho = max(len(str(x)) for x in fila_result) if fila_result else 1
-
-    def fmt(lst):
-        return " ".join(str(x).rjust(ancho) for x in lst)
-
-    escala = [(-factor) * val for val in fila_pivote]
-
-    if factor < 0:
-        factor_str = f"+{abs(factor)}"
-    else:
-        factor_str = f"-{factor}"
-
-    lines = [
-        f"{factor_str}F{idx_piv} : {fmt(escala)}",
-        f"+F{idx_obj}   : {fmt(fila_actual)}",
-        " " * 10 + "-" * (ancho * len(fila_result) + len(fila_result) - 1),
-        f"=F{idx_obj}   : {fmt(fila_result)}"
-    ]
-    return lines
-
-
-def format_matriz_lines(A):
-    ancho = 1
-    for fila in A:
-        for x in fila:
-            ancho = max(ancho, len(str(x)))
-    lines = []
-    for fila in A:
-        line = " ".join(str(x).rjust(ancho) for x in fila)
-        lines.append(line)
-    return lines
-
-
-# Helpers para análisis de RREF y forma vectorial
-def _analizar_rref(A):
-    n = len(A); m = len(A[0]); num_vars = m - 1
-    piv_col_por_fila = [-1] * n
-    piv_fila_por_col = {}
-    for i in range(n):
-        for j in range(num_vars):
-            if A[i][j] == 1 and all(A[k][j] == 0 for k in range(n) if k != i):
-                piv_col_por_fila[i] = j
-                piv_fila_por_col[j] = i
-                break
-    pivot_cols = [j for j in piv_col_por_fila if j != -1]
-    free_cols = [j for j in range(num_vars) if j not in pivot_cols]
-    return pivot_cols, free_cols, piv_fila_por_col
-
-
-def _extraer_soluciones(A):
-    n = len(A); m = len(A[0]); num_vars = m - 1
-    # Incompatibilidad: [0 ... 0 | b≠0]
-    for i in range(n):
-        if all(A[i][j] == 0 for j in range(num_vars)) and A[i][-1] != 0:
-            return None, "incompatible", ([], [], {})
-    pivot_cols, free_cols, pivot_row_for_col = _analizar_rref(A)
-    soluciones = [None] * num_vars
-    if free_cols:
-        for j in range(num_vars):
-            if j in free_cols:
-                soluciones[j] = f"x{j+1} es variable libre"
-            else:
-                irow = pivot_row_for_col.get(j, None)
-                partes = []
-                if irow is not None and A[irow][-1] != 0:
-                    partes.append(str(A[irow][-1]))
-                for l in free_cols:
-                    if irow is not None:
-                        coef = -A[irow][l]
-                        if coef != 0:
-                            partes.append(f"({coef})*x{l+1}")
-                expr = " + ".join(partes) if partes else "0"
-                soluciones[j] = expr
-        return soluciones, "indeterminado", (pivot_cols, free_cols, pivot_row_for_col)
-    else:
-        # Determinado
-        for j in range(num_vars):
-            irow = pivot_row_for_col.get(j, None)
-            soluciones[j] = A[irow][-1] if irow is not None else 0
-        return soluciones, "determinado", (pivot_cols, free_cols, pivot_row_for_col)
-
-
-def vectores_columna_lado_a_lado(vectores, nombres, espacio_entre_vectores=4):
-    n = len(vectores[0]) if vectores else 0
-    m = len(vectores)
-    encabezados = [nombres[0]] + [f"+ {nombres[idx]}" for idx in range(1, m)]
-    max_encabezado = max((len(e) for e in encabezados), default=0)
-    max_num_len = 1
-    for v in vectores:
-        for fila in range(n):
-            max_num_len = max(max_num_len, len(str(v[fila])))
-    bloque_ancho = max_encabezado + 3 + max_num_len + 2
-    sep = " " * espacio_entre_vectores
-    lines = []
-    for fila in range(n):
-        line = ""
-        for idx, v in enumerate(vectores):
-            valstr = str(v[fila]).rjust(max_num_len)
-            if fila == 0:
-                li, ri = "\u23A1", "\u23A4"  # ⎡ ⎤
-            elif fila == n - 1:
-                li, ri = "\u23A3", "\u23A6"  # ⎣ ⎦
-            else:
-                li, ri = "\u23A2", "\u23A5"  # ⎢ ⎥
-            if fila == 0:
-                encabezado = encabezados[idx].rjust(max_encabezado)
-                bloque = f"{encabezado} {li} {valstr} {ri}"
-            else:
-                bloque = " " * max_encabezado + f" {li} {valstr} {ri}"
-            bloque = bloque.ljust(bloque_ancho)
-            if idx < m - 1:
-                bloque += sep
-            line += bloque
-        lines.append(line.rstrip())
-    return lines
-
-
 def imprimir_vectores_con_x_igual(editor: QTextEdit, lines):
     if not lines:
         return
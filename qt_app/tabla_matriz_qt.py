@@ -0,0 +1,175 @@
+"""Matrices editables y de resultado sobre modelo/vista (un solo widget por matriz).
+
+Un QLineEdit o QLabel por celda hace que crear y maquetar una matriz grande
+tarde segundos. Aquí los valores exactos viven en una lista plana dentro de un
+QAbstractTableModel y el QTableView solo pinta (y solo pide al modelo) las
+celdas visibles; el editor de celda se crea al editar.
+"""
+
+from fractions import Fraction
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PySide6.QtGui import QColor
+from PySide6.QtWidgets import QAbstractItemView, QAbstractScrollArea, QHeaderView, QTableView
+
+from .theme import bind_font_scale, bind_font_scale_stylesheet
+
+# Tamaño de cada celda en px (a escala de fuente 1)
+ANCHO_CELDA = 72
+ALTO_CELDA = 32
+
+_COLOR_VACIA = QColor("#9ca3af")
+_COLOR_INVALIDA = QColor("#b91c1c")
+
+
+class ModeloMatriz(QAbstractTableModel):
+    """Matriz filas x columnas guardada fila a fila en una lista plana.
+
+    Cada celda es None (sin escribir: vale 0 y se muestra "0" en gris, como el
+    placeholder de un QLineEdit), un valor exacto, o el texto tal cual si
+    convertir no lo acepta (se muestra en rojo y valores() lo rechaza, como
+    antes al leer la cuadrícula).
+    """
+
+    def __init__(self, filas: int = 0, columnas: int = 0, editable: bool = True, convertir=Fraction, parent=None):
+        super().__init__(parent)
+        self.editable = editable
+        self.convertir = convertir
+        self._filas = filas
+        self._columnas = columnas
+        self._celdas = [None] * (filas * columnas)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._filas
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._columnas
+
+    def flags(self, index):
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if self.editable:
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        v = self._celdas[index.row() * self._columnas + index.column()]
+        if role in (Qt.DisplayRole, Qt.ToolTipRole):
+            return "0" if v is None else str(v)
+        if role == Qt.EditRole:
+            return "" if v is None else str(v)
+        if role == Qt.TextAlignmentRole:
+            return int(Qt.AlignCenter)
+        if role == Qt.ForegroundRole:
+            if isinstance(v, str):
+                return _COLOR_INVALIDA
+            if v is None and self.editable:
+                return _COLOR_VACIA
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not self.editable or role != Qt.EditRole or not index.isValid():
+            return False
+        texto = str(value or "").strip()
+        if texto == "":
+            v = None
+        else:
+            try:
+                v = self.convertir(texto)
+            except (ValueError, ZeroDivisionError):
+                v = texto
+        self._celdas[index.row() * self._columnas + index.column()] = v
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def headerData(self, seccion, orientacion, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole:
+            return str(seccion + 1)
+        return None
+
+    def dimensionar(self, filas: int, columnas: int) -> None:
+        """Cambia el tamaño conservando los valores que siguen dentro."""
+        celdas = [None] * (filas * columnas)
+        for i in range(min(filas, self._filas)):
+            for j in range(min(columnas, self._columnas)):
+                celdas[i * columnas + j] = self._celdas[i * self._columnas + j]
+        self.beginResetModel()
+        self._filas, self._columnas, self._celdas = filas, columnas, celdas
+        self.endResetModel()
+
+    def establecer(self, M) -> None:
+        """Sustituye el contenido por la matriz M (lista de filas)."""
+        filas = len(M)
+        columnas = len(M[0]) if filas else 0
+        self.beginResetModel()
+        self._filas, self._columnas = filas, columnas
+        self._celdas = [x for fila in M for x in fila]
+        self.endResetModel()
+
+    def valores(self):
+        """Lista de filas con los valores (0 en las celdas vacías); ValueError si
+        alguna celda no es un número."""
+        c = self._columnas
+        for k, v in enumerate(self._celdas):
+            if isinstance(v, str):
+                raise ValueError(f"valor no valido en ({k // c + 1},{k % c + 1}): {v}")
+        cero = Fraction(0)
+        return [[cero if v is None else v for v in self._celdas[i * c:(i + 1) * c]] for i in range(self._filas)]
+
+
+class TablaMatriz(QTableView):
+    """Vista de un ModeloMatriz con celdas de tamaño fijo.
+
+    Al no ajustar las celdas al contenido, Qt no tiene que medirlas todas: la
+    vista crece con la matriz hasta un máximo y a partir de ahí desplaza.
+    editable=False da la vista de resultado (sin encabezados ni edición).
+    """
+
+    def __init__(self, filas: int = 0, columnas: int = 0, editable: bool = True, convertir=Fraction, parent=None):
+        super().__init__(parent)
+        self.modelo = ModeloMatriz(filas, columnas, editable, convertir, self)
+        self.setModel(self.modelo)
+        self.setSizeAdjustPolicy(QAbstractScrollArea.AdjustToContents)
+        self.setWordWrap(False)
+        for h in (self.horizontalHeader(), self.verticalHeader()):
+            h.setSectionResizeMode(QHeaderView.Fixed)
+        if editable:
+            self.setEditTriggers(
+                QAbstractItemView.AnyKeyPressed | QAbstractItemView.DoubleClicked
+                | QAbstractItemView.SelectedClicked | QAbstractItemView.EditKeyPressed
+            )
+        else:
+            self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+            self.horizontalHeader().hide()
+            self.verticalHeader().hide()
+            bind_font_scale_stylesheet(
+                self,
+                "QTableView{{background:#ffffff;color:#000;gridline-color:#ccc;"
+                "font-family:Segoe UI;font-size:{body}px;font-weight:600;}}",
+                body=14,
+            )
+        bind_font_scale(self, TablaMatriz._escalar)
+
+    def _escalar(self, escala: float) -> None:
+        self.horizontalHeader().setDefaultSectionSize(int(round(ANCHO_CELDA * escala)))
+        self.verticalHeader().setDefaultSectionSize(int(round(ALTO_CELDA * escala)))
+        self.updateGeometry()
+
+    def dimensionar(self, filas: int, columnas: int) -> None:
+        self.modelo.dimensionar(filas, columnas)
+        self.updateGeometry()
+
+    def establecer(self, M) -> None:
+        self.modelo.establecer(M)
+        self.updateGeometry()
+
+    def valores(self):
+        return self.modelo.valores()
+
+
+def vista_matriz(mat, parent=None) -> TablaMatriz:
+    """Vista de solo lectura de la matriz mat."""
+    vista = TablaMatriz(editable=False, parent=parent)
+    vista.establecer(mat)
+    return vista
@@ -1,3 +1,4 @@
+import threading
 import weakref
 
 from PySide6.QtWidgets import QApplication, QCheckBox
@@ -123,7 +124,9 @@ def bind_font_scale_stylesheet(widget, template: str, **size_map: int):
 
     def _apply(w, scale):
         values = {name: _scaled_px(base, scale) for name, base in size_map.items()}
-        w.setStyleSheet(template.format(**values))
+        hoja = template.format(**values)
+        if w.styleSheet() != hoja:
+            w.setStyleSheet(hoja)
 
     bind_font_scale(widget, _apply)
 
@@ -135,43 +138,42 @@ def scaled_font_px(base: int) -> int:
     return _scaled_px(base, current_font_scale(app))
 
 
-def apply_theme(app: QApplication, mode: str = "light") -> None:
-    app.setStyle("Fusion")
-    app.setProperty("theme_mode", mode)
-    scale = current_font_scale(app)
-    base_font_size = _scaled_px(11, scale)
-    title_font = _scaled_px(28, scale)
-    subtitle_font = _scaled_px(14, scale)
-    button_font = _scaled_px(14, scale)
-    back_button_font = _scaled_px(20, scale)
-
-    family = current_font_family(app)
-    palette = QPalette()
-    if mode == "dark":
-        # Modo oscuro complementario (dusty rose como acento)
-        bg = QColor("#1F1D22")
-        base = QColor("#15131A")
-        text = QColor("#F7F4F1")
-        subtle = QColor("#3A3542")
-        accent = QColor("#B07A8C")
-
-        palette.setColor(QPalette.Window, bg)
-        palette.setColor(QPalette.WindowText, text)
-        palette.setColor(QPalette.Base, base)
-        palette.setColor(QPalette.AlternateBase, QColor("#201E25"))
-        palette.setColor(QPalette.ToolTipBase, QColor("#26232B"))
-        palette.setColor(QPalette.ToolTipText, text)
-        palette.setColor(QPalette.Text, text)
-        palette.setColor(QPalette.Button, accent)
-        palette.setColor(QPalette.ButtonText, QColor("#FFFFFF"))
-        palette.setColor(QPalette.Highlight, accent)
-        palette.setColor(QPalette.HighlightedText, QColor("#FFFFFF"))
-        palette.setColor(QPalette.PlaceholderText, QColor("#8F8697"))
-
-        app.setPalette(palette)
-        app.setFont(QFont(family, base_font_size))
-        app.setStyleSheet(
-            f"""
+# Colores de la paleta por modo: claro "Ivory Chic" y oscuro complementario
+# (dusty rose como acento)
+_COLORES_TEMA = {
+    "dark": (
+        (QPalette.Window, "#1F1D22"),
+        (QPalette.WindowText, "#F7F4F1"),
+        (QPalette.Base, "#15131A"),
+        (QPalette.AlternateBase, "#201E25"),
+        (QPalette.ToolTipBase, "#26232B"),
+        (QPalette.ToolTipText, "#F7F4F1"),
+        (QPalette.Text, "#F7F4F1"),
+        (QPalette.Button, "#B07A8C"),
+        (QPalette.ButtonText, "#FFFFFF"),
+        (QPalette.Highlight, "#B07A8C"),
+        (QPalette.HighlightedText, "#FFFFFF"),
+        (QPalette.PlaceholderText, "#8F8697"),
+    ),
+    "light": (
+        (QPalette.Window, "#FAF7F5"),
+        (QPalette.WindowText, "#4F3A47"),
+        (QPalette.Base, "#FFFFFF"),
+        (QPalette.AlternateBase, "#F1E6E4"),
+        (QPalette.ToolTipBase, "#F1E6E4"),
+        (QPalette.ToolTipText, "#4F3A47"),
+        (QPalette.Text, "#4F3A47"),
+        (QPalette.Button, "#B07A8C"),
+        (QPalette.ButtonText, "#FFFFFF"),
+        (QPalette.Highlight, "#B07A8C"),
+        (QPalette.HighlightedText, "#FFFFFF"),
+        (QPalette.PlaceholderText, "#B09CA7"),
+    ),
+}
+
+# Hojas de estilo por modo; los tamaños se rellenan con _TAMANOS_TEMA escalados
+_HOJAS_TEMA = {
+    "dark": """
             QWidget {{ background: #1F1D22; color: #F7F4F1; }}
             QMainWindow {{ background: #1F1D22; }}
             QFrame#Card {{ background: #15131A; border: 1px solid #3A3542; border-radius: 16px; }}
@@ -249,31 +251,8 @@ def apply_theme(app: QApplication, mode: str = "light") -> None:
             }}
             QTabBar::tab:selected {{ background: #B07A8C; color: #ffffff; }}
             QTabBar::tab:hover {{ background: #9A5D73; }}
-            """
-        )
-    else:
-        # Claro Ivory Chic
-        bg = QColor("#FAF7F5")
-        base = QColor("#FFFFFF")
-        text = QColor("#4F3A47")
-        accent = QColor("#B07A8C")
-
-        palette.setColor(QPalette.Window, bg)
-        palette.setColor(QPalette.WindowText, text)
-        palette.setColor(QPalette.Base, base)
-        palette.setColor(QPalette.AlternateBase, QColor("#F1E6E4"))
-        palette.setColor(QPalette.ToolTipBase, QColor("#F1E6E4"))
-        palette.setColor(QPalette.ToolTipText, QColor("#4F3A47"))
-        palette.setColor(QPalette.Text, text)
-        palette.setColor(QPalette.Button, accent)
-        palette.setColor(QPalette.ButtonText, QColor("#FFFFFF"))
-        palette.setColor(QPalette.Highlight, accent)
-        palette.setColor(QPalette.HighlightedText, QColor("#FFFFFF"))
-        palette.setColor(QPalette.PlaceholderText, QColor("#B09CA7"))
-        app.setPalette(palette)
-        app.setFont(QFont(family, base_font_size))
-        app.setStyleSheet(
-            f"""
+            """,
+    "light": """
             QWidget {{ background: #FAF7F5; color: #4F3A47; }}
             QMainWindow {{ background: #FAF7F5; }}
             QFrame#Card {{ background: #F1E6E4; border: 1px solid #D9C8C5; border-radius: 16px; }}
@@ -352,8 +331,94 @@ def apply_theme(app: QApplication, mode: str = "light") -> None:
                 border-radius: 12px;
             }}
             QFrame#TopNav QPushButton {{ min-width: 120px; }}
-            """
-        )
+            """,
+}
+
+_TAMANOS_TEMA = {
+    "base_font_size": 11,
+    "title_font": 28,
+    "subtitle_font": 14,
+    "button_font": 14,
+    "back_button_font": 20,
+}
+
+
+class _TemaCompilado:
+    """Hoja de estilo ya formateada, colores de la paleta y tamaño de fuente."""
+
+    __slots__ = ("hoja", "colores", "fuente")
+
+    def __init__(self, hoja: str, colores, fuente: int):
+        self.hoja = hoja
+        self.colores = colores
+        self.fuente = fuente
+
+
+# (modo, escala, familia) -> _TemaCompilado; las QPalette se crean y guardan
+# aparte, solo en el hilo de la interfaz
+_temas = {}
+_paletas = {}
+_cerrojo_temas = threading.Lock()
+
+
+def _compilar_tema(mode: str, scale: float, family: str) -> _TemaCompilado:
+    clave = (mode, scale, family)
+    with _cerrojo_temas:
+        tema = _temas.get(clave)
+    if tema is None:
+        tamanos = {nombre: _scaled_px(base, scale) for nombre, base in _TAMANOS_TEMA.items()}
+        tema = _TemaCompilado(_HOJAS_TEMA[mode].format(**tamanos), _COLORES_TEMA[mode], tamanos["base_font_size"])
+        with _cerrojo_temas:
+            tema = _temas.setdefault(clave, tema)
+    return tema
+
+
+def _precompilar_temas(scale: float, family: str) -> None:
+    """Compila en un hilo aparte los modos que aún no están en caché, para que
+    alternar el tema solo tenga que aplicarlos."""
+    pendientes = [m for m in _HOJAS_TEMA if (m, scale, family) not in _temas]
+    if pendientes:
+        threading.Thread(
+            target=lambda: [_compilar_tema(m, scale, family) for m in pendientes],
+            name="precompilar-temas",
+            daemon=True,
+        ).start()
+
+
+def _paleta(mode: str, scale: float, family: str, tema: _TemaCompilado) -> QPalette:
+    clave = (mode, scale, family)
+    palette = _paletas.get(clave)
+    if palette is None:
+        palette = QPalette()
+        for rol, color in tema.colores:
+            palette.setColor(rol, QColor(color))
+        _paletas[clave] = palette
+    return palette
+
+
+def apply_theme(app: QApplication, mode: str = "light") -> None:
+    """Aplica el modo con la escala y familia actuales desde la caché de temas.
+
+    Cada setStyle/setPalette/setFont/setStyleSheet vuelve a pulir todas las
+    ventanas abiertas, así que solo se llama a los que cambian.
+    """
+    if app.style().objectName().lower() != "fusion":
+        app.setStyle("Fusion")
+    app.setProperty("theme_mode", mode)
+    modo = "dark" if mode == "dark" else "light"
+    scale = current_font_scale(app)
+    family = current_font_family(app)
+    tema = _compilar_tema(modo, scale, family)
+
+    palette = _paleta(modo, scale, family, tema)
+    if app.palette() != palette:
+        app.setPalette(palette)
+    font = QFont(family, tema.fuente)
+    if app.font() != font:
+        app.setFont(font)
+    if app.styleSheet() != tema.hoja:
+        app.setStyleSheet(tema.hoja)
+    _precompilar_temas(scale, family)
     try:
         _theme_bus.themeChanged.emit(mode)
     except Exception:
@@ -0,0 +1,229 @@
+"""Cálculos en segundo plano (QThreadPool) con progreso y cancelación.
+
+Las ventanas lanzan el cálculo con BarraTrabajo.ejecutar(funcion, ...): la
+función corre fuera del hilo de la interfaz y recibe un ControlTrabajo como
+primer argumento. Su resultado vuelve por señal al hilo de la interfaz, donde
+se llama a al_terminar(resultado). Los motores de core aceptan
+progreso=control.progreso; al pulsar "Cancelar" la siguiente llamada a
+progreso() (o a comprobar()) lanza TrabajoCancelado y el cálculo se aborta.
+"""
+
+import threading
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+from PySide6.QtWidgets import QHBoxLayout, QLabel, QProgressBar, QPushButton, QWidget
+
+
+class TrabajoCancelado(Exception):
+    """Se lanza dentro del cálculo cuando el usuario pulsa "Cancelar"."""
+
+
+class _SenalesTrabajo(QObject):
+    progreso = Signal(int, int)
+    resultado = Signal(object)
+    error = Signal(object)
+    cancelado = Signal()
+    terminado = Signal()
+
+
+class ControlTrabajo:
+    """Lo que ve la función de cálculo: cancelación y aviso de progreso."""
+
+    def __init__(self, senales: _SenalesTrabajo):
+        self._senales = senales
+        self._cancelar = threading.Event()
+
+    @property
+    def cancelado(self) -> bool:
+        return self._cancelar.is_set()
+
+    def cancelar(self):
+        self._cancelar.set()
+
+    def comprobar(self):
+        if self._cancelar.is_set():
+            raise TrabajoCancelado()
+
+    def progreso(self, hecho: int, total: int = 0):
+        self.comprobar()
+        self._senales.progreso.emit(int(hecho), int(total))
+
+    def recoger(self, pasos):
+        """Consume un generador de pasos de core comprobando la cancelación en
+        cada línea; devuelve (valor de retorno, lineas)."""
+        lineas = []
+        try:
+            while True:
+                self.comprobar()
+                lineas.append(next(pasos))
+        except StopIteration as fin:
+            return fin.value, lineas
+        except TrabajoCancelado:
+            pasos.close()  # libera lo que tenga abierto el generador (p. ej. procesos)
+            raise
+
+
+# Cálculos cuyo run() aún no ha vuelto (un cancelado sigue aquí hasta que
+# aborta); lo consulta la configuración antes de cambiar el backend numérico
+_en_curso = 0
+_cerrojo_en_curso = threading.Lock()
+
+
+def trabajos_en_curso() -> int:
+    return _en_curso
+
+
+class Trabajo(QRunnable):
+    """QRunnable con autoDelete: el pool lo borra al acabar run(), así que
+    quien lo lanza solo debe conservar senales y control."""
+
+    def __init__(self, funcion, *args, **kwargs):
+        super().__init__()
+        self.senales = _SenalesTrabajo()
+        self.control = ControlTrabajo(self.senales)
+        self._funcion = funcion
+        self._args = args
+        self._kwargs = kwargs
+
+    def run(self):
+        global _en_curso
+        with _cerrojo_en_curso:
+            _en_curso += 1
+        try:
+            resultado = self._funcion(self.control, *self._args, **self._kwargs)
+        except TrabajoCancelado:
+            self.senales.cancelado.emit()
+        except Exception as exc:
+            self.senales.error.emit(exc)
+        else:
+            if self.control.cancelado:
+                self.senales.cancelado.emit()
+            else:
+                self.senales.resultado.emit(resultado)
+        finally:
+            with _cerrojo_en_curso:
+                _en_curso -= 1
+            self.senales.terminado.emit()
+
+
+class _Lanzado:
+    """Lo que la barra guarda de un cálculo lanzado (nunca el QRunnable)."""
+
+    __slots__ = ("senales", "control", "al_terminar", "al_fallar", "al_cancelar")
+
+    def __init__(self, trabajo, al_terminar, al_fallar, al_cancelar):
+        self.senales = trabajo.senales
+        self.control = trabajo.control
+        self.al_terminar = al_terminar
+        self.al_fallar = al_fallar
+        self.al_cancelar = al_cancelar
+
+
+class BarraTrabajo(QWidget):
+    """Barra de progreso + botón "Cancelar"; solo visible mientras hay un cálculo.
+
+    Solo hay un cálculo por barra: lanzar otro cancela el anterior y descarta
+    su resultado. Las señales de cada cálculo lanzado (también de los
+    cancelados, que siguen en el pool hasta que run() vuelve) se conservan
+    hasta recibir su "terminado".
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        lay = QHBoxLayout(self)
+        lay.setContentsMargins(0, 0, 0, 0)
+        self.etiqueta = QLabel("Calculando…")
+        self.barra = QProgressBar()
+        self.barra.setTextVisible(True)
+        self.btn_cancelar = QPushButton("Cancelar")
+        self.btn_cancelar.clicked.connect(self.cancelar)
+        lay.addWidget(self.etiqueta)
+        lay.addWidget(self.barra, 1)
+        lay.addWidget(self.btn_cancelar)
+        self._actual = None
+        self._lanzados = set()
+        self._botones = []
+        self.setVisible(False)
+
+    def en_curso(self) -> bool:
+        return self._actual is not None
+
+    def ejecutar(self, funcion, *args, al_terminar=None, al_fallar=None, al_cancelar=None,
+                 deshabilitar=(), **kwargs):
+        """Lanza funcion(control, *args, **kwargs) en el QThreadPool global.
+
+        deshabilitar: botones que se desactivan mientras dura el cálculo.
+        Devuelve el ControlTrabajo del cálculo.
+        """
+        self.cancelar()
+        trabajo = Trabajo(funcion, *args, **kwargs)
+        lanzado = _Lanzado(trabajo, al_terminar, al_fallar, al_cancelar)
+        s = trabajo.senales
+        # slots de este widget (hilo de la interfaz): las señales llegan encoladas
+        s.progreso.connect(self._on_progreso)
+        s.resultado.connect(self._on_resultado)
+        s.error.connect(self._on_error)
+        s.terminado.connect(self._on_terminado)
+        self._actual = lanzado
+        self._lanzados.add(lanzado)
+        self._botones = [b for b in deshabilitar if b is not None]
+        for b in self._botones:
+            b.setEnabled(False)
+        self.barra.setRange(0, 0)  # indeterminada hasta el primer aviso
+        self.setVisible(True)
+        QThreadPool.globalInstance().start(trabajo)
+        return lanzado.control
+
+    def cancelar(self):
+        trabajo = self._actual
+        if trabajo is None:
+            return
+        trabajo.control.cancelar()
+        self._liberar()
+        if trabajo.al_cancelar is not None:
+            trabajo.al_cancelar()
+
+    def _trabajo_de(self, senales):
+        # None si la señal es de un cálculo ya cancelado o sustituido
+        lanzado = self._actual
+        if lanzado is not None and lanzado.senales is senales:
+            return lanzado
+        return None
+
+    def _on_progreso(self, hecho, total):
+        if self._trabajo_de(self.sender()) is None:
+            return
+        if total > 0:
+            self.barra.setRange(0, total)
+            self.barra.setValue(min(hecho, total))
+
+    def _on_resultado(self, resultado):
+        trabajo = self._trabajo_de(self.sender())
+        if trabajo is not None:
+            self._liberar()
+            if trabajo.al_terminar is not None:
+                trabajo.al_terminar(resultado)
+
+    def _on_error(self, exc):
+        trabajo = self._trabajo_de(self.sender())
+        if trabajo is not None:
+            self._liberar()
+            if trabajo.al_fallar is not None:
+                trabajo.al_fallar(exc)
+
+    def _on_terminado(self):
+        senales = self.sender()
+        if self._trabajo_de(senales) is not None:
+            self._liberar()
+        # llega también para los cancelados: ya no se emitirá nada más
+        self._lanzados = {l for l in self._lanzados if l.senales is not senales}
+
+    def _liberar(self):
+        self._actual = None
+        for b in self._botones:
+            try:
+                b.setEnabled(True)
+            except RuntimeError:
+                pass
+        self._botones = []
+        self.setVisible(False)
@@ -3,215 +3,27 @@ from PySide6.QtWidgets import (
     QGridLayout, QLineEdit, QTextEdit, QMessageBox, QTabWidget, QSpinBox
 )
 from PySide6.QtCore import Qt
-from fractions import Fraction
 from .theme import bind_font_scale_stylesheet
+from .trabajos_qt import BarraTrabajo
+from core.transformaciones import (
+    fmt as _fmt,
+    parse_fraction as _parse,
+    matmul as _matmul,
+    format_symbolic_explicit as _format_symbolic_explicit,
+    format_product as _format_product,
+    format_vector_column as _format_vector_column,
+    format_matrix as _format_matrix,
+    dot_steps as _dot_steps,
+    format_scaled_sum as _format_scaled_sum,
+    format_aug,
+    resolver_axb,
+)
 
 
-def _fmt(x: Fraction) -> str:
-    return f"{x.numerator}" if x.denominator == 1 else f"{x.numerator}/{x.denominator}"
-
-
-def _parse(s: str) -> Fraction:
-    s = (s or "").strip().replace(",", ".")
-    if s == "":
-        return Fraction(0)
-    return Fraction(s)
-
-
-def _matmul(A, x):
-    m = len(A)
-    n = len(A[0]) if m else 0
-    if len(x) != n:
-        raise ValueError("Dimensiones incompatibles entre A y x")
-    return [sum(A[i][j] * x[j] for j in range(n)) for i in range(m)]
-
+def _trabajo_axb(control, A, b):
+    # Solo el resultado (factorizar(A).transformar(b)); los pasos se generan al pedir el detalle
+    return resolver_axb(A, b, trace=False, progreso=control.progreso)
 
-def _format_symbolic_explicit(A):
-    m = len(A)
-    n = len(A[0]) if m else 0
-    xnames = [f"x{j+1}" for j in range(n)]
-    lines = []
-    lines.append("")
-    lines.append("Representación como combinación lineal de las columnas:")
-    lines += _format_linear_combination(A)
-    lines.append("")
-    lines.append("Forma explícita (por componentes):")
-    fila_expr = []
-    for i in range(m):
-        terms = []
-        for j in range(n):
-            a = _fmt(A[i][j])
-            xj = xnames[j]
-            if a == "0":
-                continue
-            if a == "1":
-                terms.append(xj)
-            elif a == "-1":
-                terms.append(f"- {xj}")
-            else:
-                if a.startswith("-"):
-                    terms.append(f"- {a[1:]}{xj}")
-                else:
-                    terms.append(f"{a}{xj}")
-        if not terms:
-            fila_expr.append("0")
-        else:
-            expr = terms[0]
-            for t in terms[1:]:
-                expr = expr + (" + " + t if not t.strip().startswith("-") else " - " + t.strip()[2:])
-            fila_expr.append(expr)
-    lines.append("T([" + ", ".join(xnames) + "]^T) = [")
-    for expr in fila_expr:
-        lines.append("  " + expr)
-    lines.append("]^T")
-    return lines
-
-
-def _format_linear_combination(A):
-    m = len(A)
-    n = len(A[0]) if m else 0
-    xnames = [f"x{j+1}" for j in range(n)]
-    col_w = [0]*n
-    for j in range(n):
-        col_w[j] = max(len(_fmt(A[i][j])) for i in range(m)) if m else 1
-    xw = [len(s) for s in xnames]
-
-    # expresiones por fila del resultado
-    fila_expr = []
-    for i in range(m):
-        terms = []
-        for j in range(n):
-            a = _fmt(A[i][j])
-            if a == "0":
-                continue
-            if a == "1":
-                terms.append(f"x{j+1}")
-            elif a == "-1":
-                terms.append(f"-x{j+1}")
-            else:
-                terms.append(f"{a}x{j+1}")
-        if not terms:
-            fila_expr.append("0")
-        else:
-            expr = terms[0]
-            for t in terms[1:]:
-                expr += (" + " + t) if not t.startswith("-") else (" - " + t[1:])
-            fila_expr.append(expr)
-
-    # Construir bloques por filas con ancho fijo y alinear la columna del resultado
-    left_parts = []
-    for i in range(m):
-        pieces = []
-        for j in range(n):
-            scalar = xnames[j] if i == 0 else (" " * xw[j])
-            val = _fmt(A[i][j]).rjust(col_w[j])
-            pieces.append(f"{scalar} [ {val} ]")
-        left_parts.append("  +  ".join(pieces))
-
-    max_left = max(len(s) for s in left_parts) if left_parts else 0
-    lines = []
-    for i in range(m):
-        left = left_parts[i].ljust(max_left)
-        if i == 0:
-            lines.append(f"= {left} = [ {fila_expr[i]} ]")
-        else:
-            lines.append(f"  {left}   [ {fila_expr[i]} ]")
-    return lines
-
-
-def _format_product(A, x, b=None):
-    """Devuelve líneas de texto que muestran [A][x] = [b] con corchetes.
-    x es vector columna. Soporta m != n.
-    """
-    m = len(A)
-    n = len(A[0]) if m else 0
-    # anchuras por columna de A
-    col_w = [0]*n
-    for j in range(n):
-        col_w[j] = max(len(_fmt(A[i][j])) for i in range(m)) if m else 1
-    x_w = max((len(_fmt(x[j])) for j in range(n)), default=1)
-    b_w = max((len(_fmt(b[i])) for i in range(m)), default=1) if b is not None else 1
-
-    lines = []
-    rows = max(m, n)
-    for i in range(rows):
-        # bloque A
-        if i < m:
-            a_row = " ".join(_fmt(A[i][j]).rjust(col_w[j]) for j in range(n))
-            left = "[ " + a_row + " ]"
-        else:
-            left = "  " + " "*(sum(col_w)+ (n-1)) + "  "
-        # bloque x
-        if i < n:
-            x_txt = _fmt(x[i]).rjust(x_w)
-            mid = "[ " + x_txt + " ]"
-        else:
-            mid = "  " + " "*(x_w+2)
-        # bloque b
-        if b is not None and i < m:
-            b_txt = _fmt(b[i]).rjust(b_w)
-            right = "[ " + b_txt + " ]"
-        else:
-            right = ""
-        eq = " = " if (b is not None and i == 0) else ("   " if b is not None else "")
-        times = "   " if i else "   "  # separación simple
-        if i == 0 and b is not None:
-            lines.append(f"{left}{times}{mid}{eq}{right}")
-        else:
-            lines.append(f"{left}{times}{mid}{('   '+right) if right else ''}")
-    return lines
-
-
-def _format_vector_column(vec):
-    vals = [_fmt(v) for v in vec]
-    w = max((len(s) for s in vals), default=1)
-    return "\n".join("[ " + s.rjust(w) + " ]" for s in vals)
-
-
-def _format_matrix(A):
-    if not A:
-        return "[ ]"
-    m = len(A); n = len(A[0])
-    col_w = [0]*n
-    for j in range(n):
-        col_w[j] = max(len(_fmt(A[i][j])) for i in range(m))
-    lines = []
-    for i in range(m):
-        row = " ".join(_fmt(A[i][j]).rjust(col_w[j]) for j in range(n))
-        lines.append("[ " + row + " ]")
-    return "\n".join(lines)
-
-
-def _dot_steps(A, x, b):
-    m = len(A); n = len(A[0]) if A else 0
-    steps = ["", "  Detalle por filas (producto punto):"]
-    for i in range(m):
-        mults = [f"({_fmt(A[i][j])})*({_fmt(x[j])})" for j in range(n)]
-        prods = [A[i][j]*x[j] for j in range(n)]
-        sums = " + ".join(_fmt(p) for p in prods)
-        steps.append(f"  Fila {i+1}: " + " + ".join(mults) + f" = {sums} = {_fmt(b[i])}")
-    return steps
-
-
-def _format_scaled_sum(c, Tu, d, Tv, result):
-    sc = _fmt(c); sd = _fmt(d)
-    m = len(Tu)
-    wt = max((len(_fmt(x)) for x in Tu), default=1)
-    wv = max((len(_fmt(x)) for x in Tv), default=1)
-    wr = max((len(_fmt(x)) for x in result), default=1)
-    ws1 = len(sc); ws2 = len(sd)
-    lines = []
-    for i in range(m):
-        coef1 = sc if i == 0 else " "*ws1
-        coef2 = sd if i == 0 else " "*ws2
-        t = _fmt(Tu[i]).rjust(wt)
-        v = _fmt(Tv[i]).rjust(wv)
-        r = _fmt(result[i]).rjust(wr)
-        if i == 0:
-            lines.append(f"= {coef1} [ {t} ]  +  {coef2} [ {v} ] = [ {r} ]")
-        else:
-            lines.append(f"  {coef1} [ {t} ]     {coef2} [ {v} ]   [ {r} ]")
-    return lines
 
 class TransformacionesWindow(QMainWindow):
     def __init__(self, parent=None):
@@ -437,7 +249,15 @@ class TransformacionesWindow(QMainWindow):
             "font-family:Consolas,monospace;font-size:{body}px;",
             body=12,
         )
+        self.trabajo4 = BarraTrabajo(self)
+        lay.addWidget(self.trabajo4)
+        self.detalle4 = QPushButton("Ver pasos detallados")
+        self.detalle4.setEnabled(False)
+        self.detalle4.clicked.connect(self._toggle_detalles_axb)
+        lay.addWidget(self.detalle4)
         lay.addWidget(self.out4, 1)
+        self._axb = None
+        self.mostrando_detalles_axb = False
 
         self.m4.valueChanged.connect(self._crear_axb)
         self.n4.valueChanged.connect(self._crear_axb)
@@ -463,63 +283,57 @@ class TransformacionesWindow(QMainWindow):
         self.grid4_lay.addWidget(solve, m+2, 0, 1, n+1)
 
     def _format_aug(self, M):
-        m = len(M); n = len(M[0])-1 if m else 0
-        col_w = [0]*n
-        for j in range(n):
-            col_w[j] = max(len(_fmt(M[i][j])) for i in range(m)) if m else 1
-        bw = max((len(_fmt(M[i][-1])) for i in range(m)), default=1)
-        lines = []
-        for i in range(m):
-            left = " ".join(_fmt(M[i][j]).rjust(col_w[j]) for j in range(n))
-            right = _fmt(M[i][-1]).rjust(bw)
-            lines.append("[ " + left + "  |  " + right + " ]")
-        return "\n".join(lines)
+        return format_aug(M)
 
     def _resolver_axb(self):
         try:
             m, n = self.m4.value(), self.n4.value()
             A = [[_parse(self.A4[i][j].text()) for j in range(n)] for i in range(m)]
             b = [_parse(self.b4[i].text()) for i in range(m)]
-            M = [row[:] + [b[i]] for i, row in enumerate(A)]
-            pasos = ["Matriz aumentada [A | b]:\n" + self._format_aug(M) + "\n"]
-            r = 0; piv_cols = []
-            for c in range(n):
-                p = None
-                for i in range(r, m):
-                    if M[i][c] != 0:
-                        p = i; break
-                if p is None:
-                    continue
-                if p != r:
-                    M[r], M[p] = M[p], M[r]
-                    pasos.append(f"Intercambio F{r+1} ↔ F{p+1}\n" + self._format_aug(M) + "\n")
-                piv = M[r][c]
-                if piv != 1:
-                    M[r] = [x / piv for x in M[r]]
-                    pasos.append(f"F{r+1} ← F{r+1} / {_fmt(piv)}\n" + self._format_aug(M) + "\n")
-                for i in range(m):
-                    if i != r and M[i][c] != 0:
-                        fac = M[i][c]
-                        M[i] = [M[i][k] - fac*M[r][k] for k in range(n+1)]
-                        pasos.append(f"F{i+1} ← F{i+1} - ({_fmt(fac)})·F{r+1}\n" + self._format_aug(M) + "\n")
-                piv_cols.append(c); r += 1
-                if r == m: break
+        except Exception as exc:
+            QMessageBox.warning(self, "Aviso", f"No se pudo resolver Ax=b: {exc}")
+            return
+        self.trabajo4.ejecutar(
+            _trabajo_axb, A, b,
+            al_terminar=lambda res: self._fin_axb(A, b, n, res),
+            al_fallar=lambda exc: QMessageBox.warning(self, "Aviso", f"No se pudo resolver Ax=b: {exc}"),
+            deshabilitar=(self.detalle4,),
+        )
 
-            for i in range(m):
-                if all(M[i][j] == 0 for j in range(n)) and M[i][-1] != 0:
-                    self.out4.setPlainText("Sistema inconsistente.\n\n" + "\n".join(pasos))
-                    return
-            if len(piv_cols) == n:
-                x = [Fraction(0)]*n
-                for i, c in enumerate(piv_cols):
-                    x[c] = M[i][-1]
+    def _fin_axb(self, A, b, n, resultado):
+        # (A, b, n, resultado, resultado con pasos o None hasta pedirlos)
+        self._axb = [A, b, n, resultado, None]
+        self.mostrando_detalles_axb = False
+        self.detalle4.setText("Ver pasos detallados")
+        self.detalle4.setEnabled(True)
+        self._mostrar_axb(n, resultado)
+
+    def _toggle_detalles_axb(self):
+        A, b, n, resultado, con_pasos = self._axb
+        if self.mostrando_detalles_axb:
+            self.detalle4.setText("Ver pasos detallados")
+            self._mostrar_axb(n, resultado)
+        else:
+            if con_pasos is None:
+                con_pasos = self._axb[4] = resolver_axb(A, b)
+            self.detalle4.setText("Ocultar pasos detallados")
+            self._mostrar_axb(n, con_pasos)
+        self.mostrando_detalles_axb = not self.mostrando_detalles_axb
+
+    def _mostrar_axb(self, n, resultado):
+        try:
+            M, piv_cols, pasos, tipo, x = resultado
+            if tipo == "inconsistente":
+                self.out4.setPlainText("Sistema inconsistente.\n\n" + ("\n".join(pasos) if pasos else "RREF:\n" + self._format_aug(M)))
+                return
+            if tipo == "unica":
                 vals_fmt = [_fmt(xi) for xi in x]
                 linea_vars = ", ".join([f"x{j+1} = {vals_fmt[j]}" for j in range(n)])
                 col_txt = _format_vector_column(x)
                 fila_txt = "[ " + ", ".join(vals_fmt) + " ]^T"
                 aprox = ", ".join([f"{float(xi):.6g}" for xi in x])
                 out = [
-                    "RREF de [A|b] y pasos:\n" + self._format_aug(M),
+                    ("RREF de [A|b] y pasos:\n" if pasos else "RREF de [A|b]:\n") + self._format_aug(M),
                     "\nSolución única:",
                     linea_vars,
                     "\nVector columna:",
@@ -528,7 +342,7 @@ class TransformacionesWindow(QMainWindow):
                     fila_txt,
                     f"\nAproximado: ({aprox})^T",
                 ]
-                self.out4.setPlainText("\n".join(pasos) + "\n" + "\n".join(out))
+                self.out4.setPlainText(("\n".join(pasos) + "\n" if pasos else "") + "\n".join(out))
             else:
                 self.out4.setPlainText("Sistema con infinitas soluciones (parámetros libres).\n\n" + "\n".join(pasos) + "\nRREF:\n" + self._format_aug(M))
         except Exception as exc:
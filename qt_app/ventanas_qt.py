@@ -0,0 +1,26 @@
+"""Apertura perezosa de las ventanas de cálculo desde los menús.
+
+Los menús no importan los módulos de las calculadoras al arrancar: el módulo se
+importa en el primer clic y la ventana creada se guarda en el menú, de modo que
+los clics siguientes solo la vuelven a mostrar (con los datos que tenía).
+"""
+
+import importlib
+
+
+def abrir_ventana(menu, modulo: str, clase: str):
+    """Muestra la ventana clase de qt_app.<modulo>, creándola la primera vez."""
+    ventanas = getattr(menu, "_ventanas", None)
+    if ventanas is None:
+        ventanas = {}
+        menu._ventanas = ventanas
+    clave = (modulo, clase)
+    w = ventanas.get(clave)
+    if w is None:
+        mod = importlib.import_module(f".{modulo}", __package__)
+        w = getattr(mod, clase)(parent=menu)
+        ventanas[clave] = w
+    w.showMaximized()
+    w.raise_()
+    w.activateWindow()
+    return w
@@ -0,0 +1,173 @@
+"""Vista previa del sistema de ecuaciones mientras se escribe en la cuadrícula."""
+
+from fractions import Fraction
+
+from PySide6.QtCore import QObject, QTimer
+from PySide6.QtGui import QTextCharFormat, QTextCursor
+
+
+# Espera tras la última tecla antes de repintar (ms)
+INTERVALO_MS = 120
+ENCABEZADO = "Sistema de ecuaciones ingresado:"
+
+
+def _termino(c, j, formatear):
+    if c == 0:
+        return None
+    var = f"x{j+1}"
+    if c == 1:
+        return var
+    if c == -1:
+        return f"- {var}"
+    return f"{formatear(c)}{var}"
+
+
+def ecuacion(fila, formatear=str) -> str:
+    """Texto "a1x1 + a2x2 ... = b" de una fila de la matriz aumentada."""
+    partes = []
+    for j, c in enumerate(fila[:-1]):
+        t = _termino(c, j, formatear)
+        if t is None:
+            continue
+        if not partes:
+            partes.append(t)
+        elif t.startswith("-"):
+            partes.append(f"- {t[2:] if t.startswith('- ') else t[1:]}")
+        else:
+            partes.append(f"+ {t}")
+    izquierda = " ".join(partes) if partes else "0"
+    derecha = formatear(fila[-1]) if fila else "0"
+    return f"{izquierda} = {derecha}"
+
+
+class VistaPreviaSistema(QObject):
+    """Mantiene en destino (QTextEdit) el sistema de la cuadrícula de QLineEdit.
+
+    Cada tecla solo marca su celda; INTERVALO_MS después de la última se
+    vuelven a leer únicamente las celdas marcadas, se rehace el texto de sus
+    filas (el resto sale de la caché) y en el documento se reemplazan solo
+    esos bloques. Si el documento ya no tiene la vista previa (p. ej. se
+    escribió un resultado) se repinta entera; si alguna celda no es un número
+    se vacía, como antes.
+
+    convertir: texto -> valor (Fraction por defecto); formatear: valor -> texto;
+    estilo(): (formato del encabezado, formato de las filas) como
+    QTextCharFormat, o None para texto plano; activa(): False para no pintar
+    (los valores se siguen leyendo).
+    """
+
+    def __init__(self, destino, convertir=Fraction, formatear=str, estilo=None, activa=None, parent=None):
+        super().__init__(parent if parent is not None else destino)
+        self.destino = destino
+        self.convertir = convertir
+        self.formatear = formatear
+        self.estilo = estilo
+        self.activa = activa
+        self._entradas = []
+        self._posiciones = {}  # QLineEdit -> (fila, columna)
+        self._valores = []
+        self._lineas = []
+        self._pintadas = None  # texto de cada fila en el documento, o None si hay que repintar todo
+        self._formato_filas = QTextCharFormat()
+        self._pendientes = set()
+        self._invalidas = set()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(INTERVALO_MS)
+        self._timer.timeout.connect(self.actualizar)
+
+    def conectar(self, entradas):
+        """Cuadrícula nueva o redimensionada: conecta solo las entradas que aún
+        no lo estaban, lee todas las celdas una vez y pinta la vista entera."""
+        self._timer.stop()
+        posiciones = {e: (i, j) for i, fila in enumerate(entradas) for j, e in enumerate(fila)}
+        for e in posiciones:
+            if e not in self._posiciones:
+                e.textChanged.connect(self._marcar)
+        self._posiciones = posiciones
+        self._entradas = entradas
+        self._valores = [[None] * len(fila) for fila in entradas]
+        self._lineas = [None] * len(entradas)
+        self._pintadas = None
+        self._invalidas = set()
+        self._pendientes = set(posiciones.values())
+        self.actualizar()
+
+    def _marcar(self, _texto=None):
+        posicion = self._posiciones.get(self.sender())
+        if posicion is not None:
+            self._pendientes.add(posicion)
+            self._timer.start()
+
+    def actualizar(self):
+        """Lee las celdas marcadas y repinta las filas que cambiaron."""
+        self._timer.stop()
+        filas = set()
+        for i, j in self._pendientes:
+            if i >= len(self._entradas) or j >= len(self._entradas[i]):
+                continue
+            texto = (self._entradas[i][j].text() or "0").strip()
+            try:
+                valor = self.convertir(texto)
+            except (ValueError, ZeroDivisionError):
+                self._invalidas.add((i, j))
+                continue
+            self._invalidas.discard((i, j))
+            if valor != self._valores[i][j] or self._lineas[i] is None:
+                self._valores[i][j] = valor
+                filas.add(i)
+        self._pendientes.clear()
+        for i in filas:
+            if all(v is not None for v in self._valores[i]):
+                self._lineas[i] = ecuacion(self._valores[i], self.formatear)
+        if self.activa is not None and not self.activa():
+            self._pintadas = None
+            return
+        if self._invalidas or not self._entradas:
+            if self._pintadas is not None or not self.destino.document().isEmpty():
+                self.destino.clear()
+            self._pintadas = None
+            return
+        if not self._vista_intacta():
+            self._pintar_todo()
+            return
+        self._pintar_filas(sorted(i for i in filas if self._lineas[i] != self._pintadas[i]))
+
+    def _vista_intacta(self) -> bool:
+        if self._pintadas is None:
+            return False
+        doc = self.destino.document()
+        if doc.blockCount() != len(self._lineas) + 1 or doc.firstBlock().text() != ENCABEZADO:
+            return False
+        return doc.lastBlock().text() == self._pintadas[-1]
+
+    def _pintar_todo(self):
+        encabezado, filas = self.estilo() if self.estilo is not None else (QTextCharFormat(), QTextCharFormat())
+        self._formato_filas = filas
+        self.destino.clear()
+        cursor = QTextCursor(self.destino.document())
+        cursor.beginEditBlock()
+        cursor.insertText(ENCABEZADO, encabezado)
+        for linea in self._lineas:
+            cursor.insertBlock()
+            cursor.insertText(linea, filas)
+        cursor.endEditBlock()
+        self._pintadas = list(self._lineas)
+
+    def _pintar_filas(self, filas):
+        if not filas:
+            return
+        doc = self.destino.document()
+        cursor = QTextCursor(doc)
+        cursor.beginEditBlock()
+        for i in filas:
+            bloque = doc.findBlockByNumber(i + 1)
+            if bloque.text() != self._pintadas[i]:
+                cursor.endEditBlock()
+                self._pintar_todo()
+                return
+            cursor.setPosition(bloque.position())
+            cursor.setPosition(bloque.position() + bloque.length() - 1, QTextCursor.KeepAnchor)
+            cursor.insertText(self._lineas[i], self._formato_filas)
+            self._pintadas[i] = self._lineas[i]
+        cursor.endEditBlock()
@@ -1,6 +1,20 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from fractions import Fraction
+
+from core.transformaciones import (
+    fmt,
+    parse_fraction,
+    matmul,
+    format_product,
+    format_symbolic_explicit,
+    format_linear_combination,
+    format_vector_column,
+    format_matrix,
+    dot_steps,
+    format_scaled_sum,
+    format_aug,
+    resolver_axb,
+)
 
 
 class TransformacionesLinealesApp:
@@ -27,24 +41,9 @@ class TransformacionesLinealesApp:
         self._build_ui()
 
     # -------------------- utilidades --------------------
-    @staticmethod
-    def _parse_fraction(s: str) -> Fraction:
-        s = (s or "").strip().replace(",", ".")
-        if s == "":
-            return Fraction(0)
-        return Fraction(s)
-
-    @staticmethod
-    def _fmt(x: Fraction) -> str:
-        return f"{x.numerator}" if x.denominator == 1 else f"{x.numerator}/{x.denominator}"
-
-    @staticmethod
-    def _matmul(A, x):
-        m = len(A)
-        n = len(A[0]) if m else 0
-        if len(x) != n:
-            raise ValueError("Dimensiones incompatibles entre A y x")
-        return [sum(A[i][j] * x[j] for j in range(n)) for i in range(m)]
+    _parse_fraction = staticmethod(parse_fraction)
+    _fmt = staticmethod(fmt)
+    _matmul = staticmethod(matmul)
 
     # -------------------- estilos y UI --------------------
     def _setup_styles(self):
@@ -184,131 +183,14 @@ class TransformacionesLinealesApp:
 
     # ------- formato matricial con corchetes -------
     def _format_product(self, A, x, b=None):
-        m = len(A)
-        n = len(A[0]) if m else 0
-        col_w = [0]*n
-        for j in range(n):
-            col_w[j] = max(len(self._fmt(A[i][j])) for i in range(m)) if m else 1
-        x_w = max((len(self._fmt(x[j])) for j in range(n)), default=1)
-        b_w = max((len(self._fmt(b[i])) for i in range(m)), default=1) if b is not None else 1
-        lines = []
-        rows = max(m, n)
-        for i in range(rows):
-            if i < m:
-                a_row = " ".join(self._fmt(A[i][j]).rjust(col_w[j]) for j in range(n))
-                left = "[ " + a_row + " ]"
-            else:
-                left = "  " + " "*(sum(col_w)+(n-1)) + "  "
-            if i < n:
-                mid = "[ " + self._fmt(x[i]).rjust(x_w) + " ]"
-            else:
-                mid = "  " + " "*(x_w+2)
-            if b is not None and i < m:
-                right = "[ " + self._fmt(b[i]).rjust(b_w) + " ]"
-            else:
-                right = ""
-            eq = " = " if (b is not None and i == 0) else ("   " if b is not None else "")
-            if i == 0 and b is not None:
-                lines.append(f"{left}   {mid}{eq}{right}")
-            else:
-                lines.append(f"{left}   {mid}{('   '+right) if right else ''}")
-        return lines
+        return format_product(A, x, b)
 
     # ------- forma explícita T([x1,..,xn]) -------
     def _format_symbolic_explicit(self, A):
-        m = len(A)
-        n = len(A[0]) if m else 0
-        xnames = [f"x{j+1}" for j in range(n)]
-        lines = []
-        # Representación como combinación lineal de columnas
-        lines.append("")
-        lines.append("Representación como combinación lineal de las columnas:")
-        lines += self._format_linear_combination(A)
-        lines.append("")
-        lines.append("Forma explícita (por componentes):")
-        fila_expr = []
-        for i in range(m):
-            terms = []
-            for j in range(n):
-                a = self._fmt(A[i][j])
-                xj = xnames[j]
-                if a == "0":
-                    continue
-                if a == "1":
-                    terms.append(xj)
-                elif a == "-1":
-                    terms.append(f"- {xj}")
-                else:
-                    if a.startswith("-"):
-                        terms.append(f"- {a[1:]}{xj}")
-                    else:
-                        terms.append(f"{a}{xj}")
-            if not terms:
-                fila_expr.append("0")
-            else:
-                expr = terms[0]
-                for t in terms[1:]:
-                    expr = expr + (" + " + t if not t.strip().startswith("-") else " - " + t.strip()[2:])
-                fila_expr.append(expr)
-        lines.append("T([" + ", ".join(xnames) + "]^T) = [")
-        for expr in fila_expr:
-            lines.append("  " + expr)
-        lines.append("]^T")
-        return lines
+        return format_symbolic_explicit(A)
 
     def _format_linear_combination(self, A):
-        m = len(A)
-        n = len(A[0]) if m else 0
-        xnames = [f"x{j+1}" for j in range(n)]
-
-        # Ancho por columna para alinear cada bloque [ a_ij ]
-        col_w = [0] * n
-        for j in range(n):
-            col_w[j] = max(len(self._fmt(A[i][j])) for i in range(m)) if m else 1
-        xw = [len(s) for s in xnames]
-
-        # Expresiones del resultado por fila
-        fila_expr = []
-        for i in range(m):
-            terms = []
-            for j in range(n):
-                a = self._fmt(A[i][j])
-                if a == "0":
-                    continue
-                if a == "1":
-                    terms.append(f"x{j+1}")
-                elif a == "-1":
-                    terms.append(f"-x{j+1}")
-                else:
-                    terms.append(f"{a}x{j+1}")
-            if not terms:
-                fila_expr.append("0")
-            else:
-                expr = terms[0]
-                for t in terms[1:]:
-                    expr += (" + " + t) if not t.startswith("-") else (" - " + t[1:])
-                fila_expr.append(expr)
-
-        # Construir parte izquierda por filas con bloques de ancho fijo
-        left_parts = []
-        for i in range(m):
-            pieces = []
-            for j in range(n):
-                scalar = xnames[j] if i == 0 else (" " * xw[j])
-                val = self._fmt(A[i][j]).rjust(col_w[j])
-                pieces.append(f"{scalar} [ {val} ]")
-            left_parts.append("  +  ".join(pieces))
-
-        # Alinear columna del resultado [ … ]
-        max_left = max(len(s) for s in left_parts) if left_parts else 0
-        lines = []
-        for i in range(m):
-            left = left_parts[i].ljust(max_left)
-            if i == 0:
-                lines.append(f"= {left} = [ {fila_expr[i]} ]")
-            else:
-                lines.append(f"  {left}   [ {fila_expr[i]} ]")
-        return lines
+        return format_linear_combination(A)
 
     # -------------------- TAB 2: matriz desde imágenes de base --------------------
     def _build_tab_base(self):
@@ -535,47 +417,13 @@ class TransformacionesLinealesApp:
 
     # ------- util de formato para linealidad -------
     def _format_matrix(self, A):
-        if not A:
-            return "[ ]"
-        m = len(A); n = len(A[0])
-        col_w = [0]*n
-        for j in range(n):
-            col_w[j] = max(len(self._fmt(A[i][j])) for i in range(m))
-        lines = []
-        for i in range(m):
-            row = " ".join(self._fmt(A[i][j]).rjust(col_w[j]) for j in range(n))
-            lines.append("[ " + row + " ]")
-        return "\n".join(lines)
+        return format_matrix(A)
 
     def _dot_steps(self, A, x, b):
-        m = len(A); n = len(A[0]) if A else 0
-        steps = ["", "  Detalle por filas (producto punto):"]
-        for i in range(m):
-            mults = [f"({self._fmt(A[i][j])})*({self._fmt(x[j])})" for j in range(n)]
-            prods = [A[i][j]*x[j] for j in range(n)]
-            sums = " + ".join(self._fmt(p) for p in prods)
-            steps.append(f"  Fila {i+1}: " + " + ".join(mults) + f" = {sums} = {self._fmt(b[i])}")
-        return steps
+        return dot_steps(A, x, b)
 
     def _format_scaled_sum(self, c, Tu, d, Tv, result):
-        sc = self._fmt(c); sd = self._fmt(d)
-        m = len(Tu)
-        wt = max((len(self._fmt(x)) for x in Tu), default=1)
-        wv = max((len(self._fmt(x)) for x in Tv), default=1)
-        wr = max((len(self._fmt(x)) for x in result), default=1)
-        ws1 = len(sc); ws2 = len(sd)
-        lines = []
-        for i in range(m):
-            coef1 = sc if i == 0 else " "*ws1
-            coef2 = sd if i == 0 else " "*ws2
-            t = self._fmt(Tu[i]).rjust(wt)
-            v = self._fmt(Tv[i]).rjust(wv)
-            r = self._fmt(result[i]).rjust(wr)
-            if i == 0:
-                lines.append(f"= {coef1} [ {t} ]  +  {coef2} [ {v} ] = [ {r} ]")
-            else:
-                lines.append(f"  {coef1} [ {t} ]     {coef2} [ {v} ]   [ {r} ]")
-        return lines
+        return format_scaled_sum(c, Tu, d, Tv, result)
 
     # -------------------- TAB 4: Resolver Ax=b --------------------
     def _build_tab_axb(self):
@@ -592,6 +440,13 @@ class TransformacionesLinealesApp:
         self.frame_axb = ttk.Frame(f)
         self.frame_axb.pack(pady=10)
 
+        # Los pasos solo se generan al pedir el detalle
+        self._axb = None
+        self.mostrando_detalles_axb = False
+        self.detalle_axb = ttk.Button(f, text="Ver pasos detallados", style="Primary.TButton",
+                                      command=self._toggle_detalles_axb, state="disabled")
+        self.detalle_axb.pack()
+
         self.res_axb = tk.Text(f, height=18, font=("Consolas", 11), bg="#fff0f5")
         self.res_axb.pack(fill="both", expand=False, padx=10, pady=6)
         self.res_axb.configure(state="disabled")
@@ -632,64 +487,44 @@ class TransformacionesLinealesApp:
 
     def _format_aug(self, M):
         # M: m x (n+1)
-        m = len(M); n = len(M[0])-1 if m else 0
-        col_w = [0]*n
-        for j in range(n):
-            col_w[j] = max(len(self._fmt(M[i][j])) for i in range(m)) if m else 1
-        bw = max((len(self._fmt(M[i][-1])) for i in range(m)), default=1)
-        lines = []
-        for i in range(m):
-            left = " ".join(self._fmt(M[i][j]).rjust(col_w[j]) for j in range(n))
-            right = self._fmt(M[i][-1]).rjust(bw)
-            lines.append("[ " + left + "  |  " + right + " ]")
-        return "\n".join(lines)
+        return format_aug(M)
 
     def _resolver_axb(self):
         try:
             A, b = self._leer_A_b()
-            m = len(A); n = len(A[0]) if m else 0
-            # construir aumentada
-            M = [row[:] + [b[i]] for i, row in enumerate(A)]
-            pasos = []
-            pasos.append("Matriz aumentada [A | b]:\n" + self._format_aug(M) + "\n")
-            r = 0
-            piv_cols = []
-            for c in range(n):
-                # buscar pivote
-                p = None
-                for i in range(r, m):
-                    if M[i][c] != 0:
-                        p = i; break
-                if p is None:
-                    continue
-                if p != r:
-                    M[r], M[p] = M[p], M[r]
-                    pasos.append(f"Intercambio F{r+1} ↔ F{p+1}\n" + self._format_aug(M) + "\n")
-                piv = M[r][c]
-                if piv != 1:
-                    M[r] = [x / piv for x in M[r]]
-                    pasos.append(f"F{r+1} ← F{r+1} / {self._fmt(piv)}\n" + self._format_aug(M) + "\n")
-                # eliminar otras filas
-                for i in range(m):
-                    if i != r and M[i][c] != 0:
-                        fac = M[i][c]
-                        M[i] = [M[i][k] - fac*M[r][k] for k in range(n+1)]
-                        pasos.append(f"F{i+1} ← F{i+1} - ({self._fmt(fac)})·F{r+1}\n" + self._format_aug(M) + "\n")
-                piv_cols.append(c)
-                r += 1
-                if r == m:
-                    break
-            # análisis
+            n = len(A[0]) if A else 0
+            # solo el resultado: factorizar(A).transformar(b), sin formatear pasos
+            resultado = resolver_axb(A, b, trace=False)
+        except Exception as exc:
+            messagebox.showerror("Error", f"No se pudo resolver Ax=b: {exc}")
+            return
+        # (A, b, n, resultado, resultado con pasos o None hasta pedirlos)
+        self._axb = [A, b, n, resultado, None]
+        self.mostrando_detalles_axb = False
+        self.detalle_axb.config(text="Ver pasos detallados", state="normal")
+        self._mostrar_axb(n, resultado)
+
+    def _toggle_detalles_axb(self):
+        A, b, n, resultado, con_pasos = self._axb
+        if self.mostrando_detalles_axb:
+            self.detalle_axb.config(text="Ver pasos detallados")
+            self._mostrar_axb(n, resultado)
+        else:
+            if con_pasos is None:
+                con_pasos = self._axb[4] = resolver_axb(A, b)
+            self.detalle_axb.config(text="Ocultar pasos detallados")
+            self._mostrar_axb(n, con_pasos)
+        self.mostrando_detalles_axb = not self.mostrando_detalles_axb
+
+    def _mostrar_axb(self, n, resultado):
+        try:
+            M, piv_cols, pasos, tipo, x = resultado
             # inconsistente
-            for i in range(m):
-                if all(M[i][j] == 0 for j in range(n)) and M[i][-1] != 0:
-                    self._write(self.res_axb, "Sistema inconsistente.\n\n" + "\n".join(pasos))
-                    return
+            if tipo == "inconsistente":
+                self._write(self.res_axb, "Sistema inconsistente.\n\n" + ("\n".join(pasos) if pasos else "RREF:\n" + self._format_aug(M)))
+                return
             # construir solución
-            if len(piv_cols) == n:
-                x = [Fraction(0)]*n
-                for i, c in enumerate(piv_cols):
-                    x[c] = M[i][-1]
+            if tipo == "unica":
                 # formateos
                 vals_fmt = [self._fmt(xi) for xi in x]
                 linea_vars = ", ".join([f"x{j+1} = {vals_fmt[j]}" for j in range(n)])
@@ -697,7 +532,7 @@ class TransformacionesLinealesApp:
                 fila_txt = "[ " + ", ".join(vals_fmt) + " ]^T"
                 aprox = ", ".join([f"{float(xi):.6g}" for xi in x])
                 out = [
-                    "RREF de [A|b] y pasos:\n" + self._format_aug(M),
+                    ("RREF de [A|b] y pasos:\n" if pasos else "RREF de [A|b]:\n") + self._format_aug(M),
                     "\nSolución única:",
                     linea_vars,
                     "\nVector columna:",
@@ -706,7 +541,7 @@ class TransformacionesLinealesApp:
                     fila_txt,
                     f"\nAproximado: ({aprox})^T",
                 ]
-                self._write(self.res_axb, "\n\n".join(pasos) + "\n" + "\n".join(out))
+                self._write(self.res_axb, ("\n\n".join(pasos) + "\n" if pasos else "") + "\n".join(out))
             else:
                 # parámetros libres (salida breve)
                 self._write(self.res_axb, "Sistema con infinitas soluciones (parámetros libres).\n\n" + "\n".join(pasos) + "\nRREF:\n" + self._format_aug(M))
@@ -714,10 +549,7 @@ class TransformacionesLinealesApp:
             messagebox.showerror("Error", f"No se pudo resolver Ax=b: {exc}")
 
     def _format_vector_column(self, vec):
-        vals = [self._fmt(v) for v in vec]
-        w = max((len(s) for s in vals), default=1)
-        lines = ["[ " + s.rjust(w) + " ]" for s in vals]
-        return "\n".join(lines)
+        return format_vector_column(vec)
 
 
 # Modo directo (para pruebas manuales)
@@ -2,6 +2,14 @@
 from tkinter import ttk, messagebox
 from fractions import Fraction
 
+from core.transpuesta import Transpuesta
+from matriz_canvas_tk import MatrizCanvas
+
+# Animacion: intervalo entre fotogramas (ms) y duración total aproximada
+INTERVALO_MAX_MS = 300
+INTERVALO_MIN_MS = 30
+DURACION_ANIMACION_MS = 6000
+
 
 class TranspuestaMatrizApp:
     def __init__(self, root, volver_callback):
@@ -101,6 +109,7 @@ class TranspuestaMatrizApp:
         self.ingreso_frame.pack(pady=(8, 6))
         self.entries_grid = None
         self.dim = (0, 0)
+        self._anim_job = None
 
         # acciones
         actions = tk.Frame(container, bg=self.bg)
@@ -197,6 +206,7 @@ class TranspuestaMatrizApp:
         return mat
 
     def _calcular_transpuesta(self):
+        self._detener_animacion()
         for w in self.result_frame.winfo_children():
             w.destroy()
         try:
@@ -218,27 +228,9 @@ class TranspuestaMatrizApp:
         )
         res_title.pack(pady=(4, 6))
 
-        grid = tk.Frame(self.result_frame, bg=self.bg)
-        grid.pack()
-
-        # preparar grilla de etiquetas para el resultado
-        self.result_labels = []
-        for i in range(c):
-            row_lbls = []
-            for j in range(f):
-                lbl = tk.Label(
-                    grid,
-                    text="",
-                    bg=self.bg,
-                    fg="#111",
-                    font=("Segoe UI", 11),
-                    relief="groove",
-                    width=10,
-                    anchor="center",
-                )
-                lbl.grid(row=i, column=j, padx=4, pady=4, sticky="nsew")
-                row_lbls.append(lbl)
-            self.result_labels.append(row_lbls)
+        # grilla del resultado: un solo lienzo en vez de una etiqueta por celda
+        self.resultado = MatrizCanvas(self.result_frame, c, f, bg=self.bg)
+        self.resultado.pack()
 
         # secciÃ³n de pasos
         pasos_title = tk.Label(
@@ -267,37 +259,58 @@ class TranspuestaMatrizApp:
     def _mostrar_directo(self, A):
         f = len(A)
         c = len(A[0]) if f else 0
+        # T[j][i] = A[i][j]: vista sin copiar y dibujada de una vez
+        self.resultado.mostrar(Transpuesta(A))
         pasos = []
         for i in range(f):
             for j in range(c):
                 val = A[i][j]
-                # T[j][i] = A[i][j]
-                self.result_labels[j][i].config(text=str(val))
                 pasos.append(f"Paso {len(pasos)+1}: A[{i+1},{j+1}] -> T[{j+1},{i+1}] = {val}")
         self.pasos_text.insert("1.0", "\n".join(pasos))
 
     def _iniciar_animacion(self, A):
-        # crear lista de pares (i,j) en orden fila-por-fila
+        # elementos en orden fila-por-fila; unos DURACION_ANIMACION_MS en total: en
+        # matrices grandes baja el intervalo y, si llega al minimo, se mueven varios por fotograma
         f = len(A)
         c = len(A[0]) if f else 0
-        self._anim_pairs = [(i, j) for i in range(f) for j in range(c)]
+        total = f * c
+        self._anim_intervalo = max(INTERVALO_MIN_MS, min(INTERVALO_MAX_MS, DURACION_ANIMACION_MS // max(1, total)))
+        self._anim_lote = max(1, -(-total * self._anim_intervalo // DURACION_ANIMACION_MS))
+        self._anim_total = total
         self._anim_index = 0
         self._A_anim = A
         self._animar_siguiente()
 
     def _animar_siguiente(self):
-        if self._anim_index >= len(self._anim_pairs):
+        self._anim_job = None
+        if self._anim_index >= self._anim_total or not self.resultado.winfo_exists():
             return
-        i, j = self._anim_pairs[self._anim_index]
-        val = self._A_anim[i][j]
-        # T[j][i] = val
-        self.result_labels[j][i].config(text=str(val))
-        paso_txt = f"Paso {self._anim_index+1}: A[{i+1},{j+1}] -> T[{j+1},{i+1}] = {val}\n"
-        self.pasos_text.insert("end", paso_txt)
+        A = self._A_anim
+        c = len(A[0])
+        fin = min(self._anim_total, self._anim_index + self._anim_lote)
+        lineas = []
+        movidas = []
+        for k in range(self._anim_index, fin):
+            i, j = divmod(k, c)
+            val = A[i][j]
+            # T[j][i] = val
+            self.resultado.poner(j, i, val)
+            movidas.append((j, i))
+            lineas.append(f"Paso {k+1}: A[{i+1},{j+1}] -> T[{j+1},{i+1}] = {val}\n")
+        self.resultado.resaltar(movidas)
+        self.pasos_text.insert("end", "".join(lineas))
         self.pasos_text.see("end")
-        self._anim_index += 1
-        # programar siguiente paso
-        self.root.after(300, self._animar_siguiente)
+        self._anim_index = fin
+        # programar siguiente fotograma
+        self._anim_job = self.root.after(self._anim_intervalo, self._animar_siguiente)
+
+    def _detener_animacion(self):
+        if self._anim_job is not None:
+            try:
+                self.root.after_cancel(self._anim_job)
+            except Exception:
+                pass
+            self._anim_job = None
 
     def _volver_al_inicio(self):
         try: